@@ -0,0 +1,495 @@
+"""Scaling benchmark for the annotation data layer and the Excel export.
+
+Times each operation on models holding 10 to 100,000 intervals, records the
+peak memory it allocates, and fits a growth exponent from the two largest
+sizes measured (about 1 for linear work, 2 for quadratic)::
+
+    python -m benchmarks.data_benchmark --output bench/data.json --plot bench/data.png
+    python -m benchmarks.data_benchmark --quick --compare bench/data.json
+
+Before each size, an operation's time is extrapolated from the sizes already
+measured; sizes predicted to take longer than ``--max-seconds`` per call are
+skipped and reported with the prediction instead. Excel export steps are read
+from the spans ``ExcelExportStrategy`` records with the tracer. Plotting needs
+matplotlib and is skipped with a message when it is not installed.
+"""
+from __future__ import annotations
+
+import argparse
+from datetime import datetime, timezone
+import json
+import math
+import os
+from pathlib import Path
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+if __package__ in {None, ""}:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pandas as pd
+
+from benchmarks.synthetic_annotations import INTERVAL_STRIDE, frames_for, synthetic_intervals
+from models.annotation_model import AnnotationModel
+from models.export_types import ExportType
+from models.record_model import RecordModel
+from models.video_model import VideoModel
+from services.annotation_export_adapter import intervals_to_time_records
+from services.export_service import EXPORT_INTERVALS, ExcelExportStrategy
+from utils.tracing import get_tracer
+
+
+BASELINE_SCHEMA_VERSION = 1
+FULL_SIZES = (10, 100, 1_000, 10_000, 100_000)
+QUICK_SIZES = (10, 100, 1_000)
+FPS = 30.0
+EXPORT_TYPE = ExportType.LOOMING
+EXPORT_STEPS = (
+    "export_paired_data",
+    "export_interval_statistics",
+    "export_custom_statistics",
+    "export_write_workbook",
+)
+# Repeat fast operations until this much time has been spent on them.
+TIMING_WINDOW_SECONDS = 0.2
+MAX_REPEATS = 50
+
+# A prepared case: ``(call, reset)``. ``reset`` restores state before each
+# call and is not timed.
+Case = Tuple[Callable[[], Any], Callable[[], None]]
+
+
+def annotation_model_with(count: int, video_path: str) -> AnnotationModel:
+    """Model holding ``count`` intervals, installed without pairwise validation."""
+    model = AnnotationModel()
+    model.set_video_context(video_path, FPS, frames_for(count))
+    model._intervals = synthetic_intervals(count)
+    return model
+
+
+def record_model_with(count: int) -> RecordModel:
+    record_model = RecordModel()
+    record_model._records = intervals_to_time_records(synthetic_intervals(count), FPS)
+    return record_model
+
+
+def video_model_for(count: int, video_path: str) -> VideoModel:
+    video_model = VideoModel()
+    video_model.video_path = video_path
+    video_model.video_fps = FPS
+    video_model.total_frames = frames_for(count)
+    return video_model
+
+
+def _restoring(model: AnnotationModel, call: Callable[[], Any]) -> Case:
+    original = list(model._intervals)
+
+    def reset():
+        model._intervals = list(original)
+
+    return call, reset
+
+
+def _no_reset():
+    pass
+
+
+def prepare_add(count: int, work_dir: str) -> Case:
+    model = annotation_model_with(count, str(Path(work_dir) / "bench.avi"))
+    start = count * INTERVAL_STRIDE
+    return _restoring(model, lambda: model.add_interval(start, start + 2, interval_id="bench-new"))
+
+
+def prepare_update(count: int, work_dir: str) -> Case:
+    model = annotation_model_with(count, str(Path(work_dir) / "bench.avi"))
+    target = model.intervals[count // 2]
+    return _restoring(model, lambda: model.update_interval(target.id, target.start_frame, target.end_frame - 1))
+
+
+def prepare_delete(count: int, work_dir: str) -> Case:
+    model = annotation_model_with(count, str(Path(work_dir) / "bench.avi"))
+    target = model.intervals[count // 2]
+    return _restoring(model, lambda: model.delete_interval(target.id))
+
+
+def prepare_replace(count: int, work_dir: str) -> Case:
+    model = annotation_model_with(0, str(Path(work_dir) / "bench.avi"))
+    model.set_timing(FPS, frames_for(count))
+    intervals = synthetic_intervals(count)
+    return lambda: model.replace_intervals(intervals), _no_reset
+
+
+def prepare_sidecar_save(count: int, work_dir: str) -> Case:
+    video_path = str(Path(work_dir) / f"save_{count}.avi")
+    model = annotation_model_with(count, video_path)
+    return lambda: model.save_sidecar(video_path), _no_reset
+
+
+def prepare_sidecar_load(count: int, work_dir: str) -> Case:
+    video_path = str(Path(work_dir) / f"load_{count}.avi")
+    annotation_model_with(count, video_path).save_sidecar(video_path)
+    model = annotation_model_with(0, video_path)
+    model.set_timing(FPS, frames_for(count))
+    return lambda: model.load_sidecar(video_path), _no_reset
+
+
+def prepare_time_records(count: int, _work_dir: str) -> Case:
+    intervals = synthetic_intervals(count)
+    return lambda: intervals_to_time_records(intervals, FPS), _no_reset
+
+
+def prepare_custom_statistics(count: int, _work_dir: str) -> Case:
+    record_model = record_model_with(count)
+    bins = EXPORT_INTERVALS[EXPORT_TYPE]
+    return lambda: record_model.calculate_custom_interval_statistics(bins), _no_reset
+
+
+def prepare_minute_statistics(count: int, _work_dir: str) -> Case:
+    record_model = record_model_with(count)
+    return record_model.calculate_minute_statistics, _no_reset
+
+
+def prepare_excel_export(count: int, work_dir: str) -> Case:
+    records = record_model_with(count).records
+    video_path = str(Path(work_dir) / "bench.avi")
+    video_model = video_model_for(count, video_path)
+    strategy = ExcelExportStrategy()
+    file_path = str(Path(work_dir) / f"export_{count}.xlsx")
+
+    def call():
+        if not strategy.export(records, video_model, file_path, EXPORT_TYPE):
+            raise RuntimeError(f"Excel export failed for {count} intervals")
+
+    return call, _no_reset
+
+
+OPERATIONS: Dict[str, Callable[[int, str], Case]] = {
+    "annotation_add": prepare_add,
+    "annotation_update": prepare_update,
+    "annotation_delete": prepare_delete,
+    "annotation_replace": prepare_replace,
+    "sidecar_save": prepare_sidecar_save,
+    "sidecar_load": prepare_sidecar_load,
+    "export_time_records": prepare_time_records,
+    "record_custom_statistics": prepare_custom_statistics,
+    "record_minute_statistics": prepare_minute_statistics,
+    "excel_export": prepare_excel_export,
+}
+
+
+def time_case(call: Callable[[], Any], reset: Callable[[], None]) -> Tuple[float, int]:
+    """Return mean seconds per call and the number of calls timed."""
+    total = 0.0
+    calls = 0
+    while calls < MAX_REPEATS and (calls == 0 or total < TIMING_WINDOW_SECONDS):
+        reset()
+        started = time.perf_counter()
+        call()
+        total += time.perf_counter() - started
+        calls += 1
+    return total / calls, calls
+
+
+def peak_memory_kb(call: Callable[[], Any], reset: Callable[[], None]) -> float:
+    """Peak memory allocated during one call, measured with tracemalloc."""
+    reset()
+    tracemalloc.start()
+    try:
+        baseline, _peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        call()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return round((peak - baseline) / 1024, 1)
+
+
+def growth_exponent(points: Sequence[Tuple[int, float]]) -> Optional[float]:
+    """Log-log slope between the two largest measured sizes."""
+    if len(points) < 2:
+        return None
+    (size_a, seconds_a), (size_b, seconds_b) = points[-2], points[-1]
+    if seconds_a <= 0 or seconds_b <= 0 or size_b == size_a:
+        return None
+    return math.log(seconds_b / seconds_a) / math.log(size_b / size_a)
+
+
+def predict_seconds(points: Sequence[Tuple[int, float]], size: int) -> Optional[float]:
+    """Extrapolate to ``size``, assuming at least linear growth."""
+    if not points:
+        return None
+    last_size, last_seconds = points[-1]
+    exponent = max(1.0, growth_exponent(points) or 1.0)
+    return last_seconds * (size / last_size) ** exponent
+
+
+def run_operation(name: str, sizes: Sequence[int], work_dir: str, max_seconds: float) -> List[Dict[str, Any]]:
+    prepare = OPERATIONS[name]
+    tracer = get_tracer()
+    results = []
+    measured: List[Tuple[int, float]] = []
+    for size in sizes:
+        predicted = predict_seconds(measured, size)
+        if predicted is not None and predicted > max_seconds:
+            results.append(
+                {
+                    "case": f"{name}_{size}",
+                    "operation": name,
+                    "size": size,
+                    "skipped": True,
+                    "predicted_seconds": round(predicted, 3),
+                }
+            )
+            continue
+        call, reset = prepare(size, work_dir)
+        if not measured:
+            # Warm up lazy imports and caches outside the timed calls.
+            reset()
+            call()
+        tracer.set_enabled(name == "excel_export")
+        try:
+            seconds, calls = time_case(call, reset)
+            steps = _export_step_seconds(tracer.events(), calls) if tracer.enabled else {}
+        finally:
+            tracer.set_enabled(False)
+        measured.append((size, seconds))
+        result = {
+            "case": f"{name}_{size}",
+            "operation": name,
+            "size": size,
+            "skipped": False,
+            "seconds": round(seconds, 6),
+            "calls": calls,
+            "peak_kb": peak_memory_kb(call, reset),
+        }
+        if steps:
+            result["steps"] = steps
+        results.append(result)
+    return results
+
+
+def _export_step_seconds(events: List[dict], calls: int) -> Dict[str, float]:
+    totals = {step: 0.0 for step in EXPORT_STEPS}
+    for event in events:
+        if event["name"] in totals:
+            totals[event["name"]] += event["dur"] / 1_000_000
+    return {step: round(total / calls, 6) for step, total in totals.items()}
+
+
+def model_memory_kb(sizes: Sequence[int], work_dir: str) -> List[Dict[str, Any]]:
+    """Memory retained by an ``AnnotationModel`` and its export records."""
+    results = []
+    for size in sizes:
+        tracemalloc.start()
+        try:
+            model = annotation_model_with(size, str(Path(work_dir) / "bench.avi"))
+            model_bytes, _peak = tracemalloc.get_traced_memory()
+            records = intervals_to_time_records(model.intervals, FPS)
+            total_bytes, _peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del records
+        results.append(
+            {
+                "case": f"model_memory_{size}",
+                "operation": "model_memory",
+                "size": size,
+                "skipped": False,
+                "model_kb": round(model_bytes / 1024, 1),
+                "records_kb": round((total_bytes - model_bytes) / 1024, 1),
+            }
+        )
+    return results
+
+
+def run_benchmarks(
+    sizes: Sequence[int],
+    operations: Sequence[str],
+    work_dir: str,
+    max_seconds: float,
+) -> List[Dict[str, Any]]:
+    results = []
+    for name in operations:
+        for result in run_operation(name, sizes, work_dir, max_seconds):
+            print(format_result(result))
+            results.append(result)
+    results.extend(model_memory_kb(sizes, work_dir))
+    return results
+
+
+def growth_summary(results: List[Dict[str, Any]]) -> Dict[str, Optional[float]]:
+    points: Dict[str, List[Tuple[int, float]]] = {}
+    for result in results:
+        if result["skipped"] or "seconds" not in result:
+            continue
+        points.setdefault(result["operation"], []).append((result["size"], result["seconds"]))
+    summary: Dict[str, Optional[float]] = {}
+    for name, series in points.items():
+        exponent = growth_exponent(series)
+        summary[name] = round(exponent, 2) if exponent is not None else None
+    return summary
+
+
+def format_result(result: Dict[str, Any]) -> str:
+    label = f"{result['operation']:<26} n={result['size']:<7}"
+    if result["skipped"]:
+        return f"{label} skipped, predicted {result['predicted_seconds']:.1f} s"
+    text = f"{label} {result['seconds'] * 1000:10.3f} ms  peak {result['peak_kb']:10.1f} KB"
+    if "steps" in result:
+        text += "  " + ", ".join(f"{step[7:]} {seconds * 1000:.1f} ms" for step, seconds in result["steps"].items())
+    return text
+
+
+def plot_growth(path: str, results: List[Dict[str, Any]]) -> bool:
+    """Draw time and memory against size on log-log axes; ``False`` without matplotlib."""
+    try:
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        return False
+
+    figure, (time_axis, memory_axis) = plt.subplots(1, 2, figsize=(14, 6))
+    for name in dict.fromkeys(result["operation"] for result in results if "seconds" in result or "predicted_seconds" in result):
+        series = [result for result in results if result["operation"] == name]
+        measured = [result for result in series if not result["skipped"]]
+        line, = time_axis.plot(
+            [result["size"] for result in measured],
+            [result["seconds"] for result in measured],
+            marker="o",
+            label=name,
+        )
+        predicted = [result for result in series if result["skipped"]]
+        if predicted and measured:
+            time_axis.plot(
+                [measured[-1]["size"]] + [result["size"] for result in predicted],
+                [measured[-1]["seconds"]] + [result["predicted_seconds"] for result in predicted],
+                linestyle="--",
+                marker="x",
+                color=line.get_color(),
+            )
+        memory_axis.plot(
+            [result["size"] for result in measured],
+            [max(result["peak_kb"], 0.1) for result in measured],
+            marker="o",
+            label=name,
+            color=line.get_color(),
+        )
+    for axis, title, unit in ((time_axis, "Time per call", "seconds"), (memory_axis, "Peak allocation per call", "KB")):
+        axis.set_xscale("log")
+        axis.set_yscale("log")
+        axis.set_xlabel("intervals")
+        axis.set_ylabel(unit)
+        axis.set_title(title)
+        axis.grid(True, which="both", alpha=0.3)
+    time_axis.legend(fontsize="small")
+    figure.tight_layout()
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    figure.savefig(target, dpi=120)
+    plt.close(figure)
+    return True
+
+
+def machine_info() -> Dict[str, Any]:
+    return {
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def save_baseline(path: str, results: List[Dict[str, Any]]):
+    payload = {
+        "schema_version": BASELINE_SCHEMA_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "machine": machine_info(),
+        "growth": growth_summary(results),
+        "results": results,
+    }
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with target.open("w", encoding="utf-8") as file:
+        json.dump(payload, file, ensure_ascii=False, indent=2)
+        file.write("\n")
+
+
+def load_baseline(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def compare_results(
+    baseline: List[Dict[str, Any]],
+    current: List[Dict[str, Any]],
+    metric: str = "seconds",
+) -> List[Dict[str, Any]]:
+    """Match cases by name and report ``current / baseline`` for ``metric``."""
+    previous = {item["case"]: item for item in baseline}
+    rows = []
+    for item in current:
+        before = previous.get(item["case"])
+        if before is None or not before.get(metric) or item.get(metric) is None:
+            continue
+        rows.append(
+            {
+                "case": item["case"],
+                "baseline": before[metric],
+                "current": item[metric],
+                "ratio": round(item[metric] / before[metric], 3),
+            }
+        )
+    return rows
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="AnnotationModel, RecordModel and export scaling benchmark")
+    parser.add_argument("--quick", action="store_true", help="sizes up to 1,000 intervals")
+    parser.add_argument("--sizes", default=None, help="comma separated interval counts, e.g. 10,1000,100000")
+    parser.add_argument("--operations", default=None, help=f"comma separated subset of: {', '.join(OPERATIONS)}")
+    parser.add_argument("--max-seconds", type=float, default=10.0, help="skip sizes predicted to take longer per call")
+    parser.add_argument("--output", default=None, help="write results as a JSON baseline")
+    parser.add_argument("--compare", default=None, help="compare against a saved JSON baseline")
+    parser.add_argument("--plot", default=None, help="save growth curves as an image (needs matplotlib)")
+    args = parser.parse_args(argv)
+
+    if args.sizes:
+        sizes = sorted({max(1, int(value)) for value in args.sizes.split(",")})
+    else:
+        sizes = list(QUICK_SIZES if args.quick else FULL_SIZES)
+    operations = [value.strip() for value in args.operations.split(",")] if args.operations else list(OPERATIONS)
+    unknown = [name for name in operations if name not in OPERATIONS]
+    if unknown:
+        parser.error(f"unknown operations: {', '.join(unknown)}")
+
+    with tempfile.TemporaryDirectory(prefix="videotimer-data-bench-") as work_dir:
+        results = run_benchmarks(sizes, operations, work_dir, args.max_seconds)
+
+    for name, exponent in growth_summary(results).items():
+        print(f"{name:<26} growth exponent {exponent if exponent is not None else '-'}")
+    if args.output:
+        save_baseline(args.output, results)
+        print(f"baseline written: {args.output}")
+    if args.plot:
+        if plot_growth(args.plot, results):
+            print(f"growth curves written: {args.plot}")
+        else:
+            print("matplotlib is not installed; skipping --plot")
+    if args.compare:
+        rows = compare_results(load_baseline(args.compare)["results"], results)
+        for row in rows:
+            print(
+                f"{row['case']:<32} {row['baseline'] * 1000:.3f} ms -> {row['current'] * 1000:.3f} ms "
+                f"(x{row['ratio']:.2f})"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
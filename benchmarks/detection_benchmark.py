@@ -0,0 +1,244 @@
+"""Throughput benchmark for ``FreezingDetectionService``.
+
+Writes synthetic videos locally, times detection end to end and per stage,
+and saves a JSON baseline that later runs can be compared against::
+
+    python -m benchmarks.detection_benchmark --output bench/detection.json
+    python -m benchmarks.detection_benchmark --quick --compare bench/detection.json
+
+Each case runs in a fresh process so that peak RSS belongs to that case only.
+Stage times are summed over all decoder threads, so with several workers they
+can exceed the wall time.
+"""
+from __future__ import annotations
+
+import argparse
+from collections import defaultdict
+from dataclasses import asdict
+from datetime import datetime, timezone
+import json
+import multiprocessing
+import os
+from pathlib import Path
+import platform
+import sys
+import tempfile
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+if __package__ in {None, ""}:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import cv2
+
+from benchmarks.synthetic_video import SyntheticVideoSpec, default_freeze_periods, write_synthetic_video
+from services.freezing_detection_service import FreezingDetectionParams, FreezingDetectionService
+
+
+BASELINE_SCHEMA_VERSION = 1
+FULL_RESOLUTIONS = ((320, 240), (640, 480), (1280, 720), (1920, 1080))
+QUICK_RESOLUTIONS = ((320, 240), (640, 480))
+FULL_CODECS = ("MJPG", "mp4v", "XVID")
+QUICK_CODECS = ("MJPG",)
+FULL_LENGTHS = (20.0, 60.0)
+QUICK_LENGTHS = (10.0,)
+FULL_WORKERS = (1, 2, 4)
+QUICK_WORKERS = (1, 2)
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of the current process, if the platform reports it."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes.
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 2)
+
+
+def run_case(video_path: str, spec: Dict[str, Any], workers: int) -> Dict[str, Any]:
+    """Run one detection and return its measurements."""
+    stages: Dict[str, float] = defaultdict(float)
+    service = FreezingDetectionService(
+        stage_observer=lambda stage, seconds: stages.__setitem__(stage, stages[stage] + seconds)
+    )
+    total_frames = int(round(spec["seconds"] * spec["fps"]))
+
+    wall_started = time.perf_counter()
+    cpu_started = time.process_time()
+    intervals = service.detect_freezing(
+        video_path,
+        spec["fps"],
+        total_frames,
+        FreezingDetectionParams(),
+        workers=workers,
+    )
+    cpu_seconds = time.process_time() - cpu_started
+    wall_seconds = time.perf_counter() - wall_started
+
+    return {
+        "case": f"{Path(video_path).stem}_w{workers}",
+        "codec": spec["codec"],
+        "width": spec["width"],
+        "height": spec["height"],
+        "seconds": spec["seconds"],
+        "frames": total_frames,
+        "workers": workers,
+        "wall_seconds": round(wall_seconds, 4),
+        "cpu_seconds": round(cpu_seconds, 4),
+        "frames_per_second": round(total_frames / wall_seconds, 1) if wall_seconds > 0 else None,
+        "peak_rss_mb": peak_rss_mb(),
+        "stages": {name: round(value, 4) for name, value in sorted(stages.items())},
+        "intervals": len(intervals),
+        "expected_freezes": len(spec["freeze_periods"]),
+    }
+
+
+def _run_case_in_child(arguments) -> Dict[str, Any]:
+    return run_case(*arguments)
+
+
+def build_specs(
+    resolutions: Iterable[Sequence[int]],
+    codecs: Iterable[str],
+    lengths: Iterable[float],
+) -> List[SyntheticVideoSpec]:
+    return [
+        SyntheticVideoSpec(
+            width=width,
+            height=height,
+            seconds=seconds,
+            codec=codec,
+            freeze_periods=default_freeze_periods(seconds),
+        )
+        for codec in codecs
+        for width, height in resolutions
+        for seconds in lengths
+    ]
+
+
+def run_benchmarks(
+    specs: Sequence[SyntheticVideoSpec],
+    worker_counts: Sequence[int],
+    work_dir: str,
+    log=print,
+) -> List[Dict[str, Any]]:
+    results: List[Dict[str, Any]] = []
+    context = multiprocessing.get_context("spawn")
+    for spec in specs:
+        try:
+            video_path = write_synthetic_video(work_dir, spec)
+        except RuntimeError as exc:
+            log(f"skip {spec.name}: {exc}")
+            continue
+        for workers in worker_counts:
+            with context.Pool(1) as pool:
+                result = pool.apply(_run_case_in_child, ((video_path, asdict(spec), workers),))
+            results.append(result)
+            log(format_result(result))
+    return results
+
+
+def format_result(result: Dict[str, Any]) -> str:
+    stages = " ".join(f"{name}={seconds:.3f}s" for name, seconds in result["stages"].items())
+    rss = f"{result['peak_rss_mb']:.0f}MB" if result["peak_rss_mb"] is not None else "n/a"
+    return (
+        f"{result['case']:<32} {result['frames_per_second']:>9.1f} fps "
+        f"wall={result['wall_seconds']:.3f}s cpu={result['cpu_seconds']:.3f}s rss={rss} {stages}"
+    )
+
+
+def machine_info() -> Dict[str, Any]:
+    return {
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "opencv": cv2.__version__,
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def save_baseline(path: str, results: List[Dict[str, Any]]):
+    payload = {
+        "schema_version": BASELINE_SCHEMA_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "machine": machine_info(),
+        "results": results,
+    }
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with target.open("w", encoding="utf-8") as file:
+        json.dump(payload, file, ensure_ascii=False, indent=2)
+        file.write("\n")
+
+
+def load_baseline(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def compare_results(
+    baseline: List[Dict[str, Any]],
+    current: List[Dict[str, Any]],
+    metric: str = "wall_seconds",
+) -> List[Dict[str, Any]]:
+    """Match cases by name and report ``current / baseline`` for ``metric``."""
+    previous = {item["case"]: item for item in baseline}
+    rows = []
+    for item in current:
+        before = previous.get(item["case"])
+        if before is None or not before.get(metric) or item.get(metric) is None:
+            continue
+        rows.append(
+            {
+                "case": item["case"],
+                "baseline": before[metric],
+                "current": item[metric],
+                "ratio": round(item[metric] / before[metric], 3),
+            }
+        )
+    return rows
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="FreezingDetectionService throughput benchmark")
+    parser.add_argument("--quick", action="store_true", help="small matrix for a fast check")
+    parser.add_argument("--workers", default=None, help="comma separated worker counts, e.g. 1,2,4")
+    parser.add_argument("--output", default=None, help="write results as a JSON baseline")
+    parser.add_argument("--compare", default=None, help="compare against a saved JSON baseline")
+    parser.add_argument("--work-dir", default=None, help="keep synthetic videos in this directory")
+    args = parser.parse_args(argv)
+
+    specs = build_specs(
+        QUICK_RESOLUTIONS if args.quick else FULL_RESOLUTIONS,
+        QUICK_CODECS if args.quick else FULL_CODECS,
+        QUICK_LENGTHS if args.quick else FULL_LENGTHS,
+    )
+    if args.workers:
+        worker_counts = [max(1, int(value)) for value in args.workers.split(",")]
+    else:
+        worker_counts = list(QUICK_WORKERS if args.quick else FULL_WORKERS)
+
+    if args.work_dir:
+        Path(args.work_dir).mkdir(parents=True, exist_ok=True)
+        results = run_benchmarks(specs, worker_counts, args.work_dir)
+    else:
+        with tempfile.TemporaryDirectory(prefix="videotimer-bench-") as work_dir:
+            results = run_benchmarks(specs, worker_counts, work_dir)
+
+    if args.output:
+        save_baseline(args.output, results)
+        print(f"baseline written: {args.output}")
+    if args.compare:
+        rows = compare_results(load_baseline(args.compare)["results"], results)
+        for row in rows:
+            print(
+                f"{row['case']:<32} {row['baseline']:.3f}s -> {row['current']:.3f}s "
+                f"(x{row['ratio']:.2f})"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,147 @@
+"""Per-frame display cost of ``VideoCanvas`` against the previous pixmap path.
+
+Times how long showing one decoded frame takes, including a synchronous
+repaint, for several source resolutions on a canvas of a typical size::
+
+    python -m benchmarks.display_benchmark --output bench/display.json
+
+``legacy`` is the pre-scaling path: full-resolution ``cvtColor`` to RGB, a
+deep-copied ``QImage``, ``QPixmap`` conversion and a smooth ``QPixmap``
+rescale. ``canvas_fast`` and ``canvas_smooth`` are the current canvas during
+playback and while paused; ``canvas_zoom4`` is the paused canvas zoomed 4x,
+where only a sixteenth of the frame is scaled.
+"""
+from __future__ import annotations
+
+import argparse
+from datetime import datetime, timezone
+import json
+import os
+from pathlib import Path
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+if __package__ in {None, ""}:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import cv2
+import numpy as np
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QImage, QPixmap
+from PySide6.QtWidgets import QApplication, QLabel
+
+from views.qt.widgets.video_canvas import VideoCanvas
+
+
+BASELINE_SCHEMA_VERSION = 1
+RESOLUTIONS = ((640, 480), (1280, 720), (1920, 1080))
+CANVAS_SIZE = (960, 540)
+
+
+def legacy_display(label: QLabel, frame: np.ndarray):
+    rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    height, width, channels = rgb_frame.shape
+    image = QImage(rgb_frame.data, width, height, channels * width, QImage.Format.Format_RGB888).copy()
+    pixmap = QPixmap.fromImage(image)
+    label.setPixmap(
+        pixmap.scaled(label.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+    )
+
+
+def synthetic_frames(width: int, height: int, count: int) -> List[np.ndarray]:
+    rng = np.random.default_rng(0)
+    base = rng.integers(0, 255, (height, width, 3), dtype=np.uint8)
+    return [np.roll(base, index * 7, axis=1) for index in range(count)]
+
+
+def time_path(widget, show, frames: Sequence[np.ndarray], repeats: int) -> Dict[str, float]:
+    samples = []
+    for index in range(repeats):
+        frame = frames[index % len(frames)]
+        started = time.perf_counter()
+        show(frame)
+        widget.repaint()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {
+        "mean_ms": round(statistics.fmean(samples), 3),
+        "p95_ms": round(samples[int(len(samples) * 0.95) - 1], 3),
+    }
+
+
+def run_benchmarks(repeats: int) -> List[Dict[str, Any]]:
+    app = QApplication.instance() or QApplication([])
+    legacy = QLabel()
+    legacy.resize(*CANVAS_SIZE)
+    legacy.show()
+    canvas = VideoCanvas()
+    canvas.resize(*CANVAS_SIZE)
+    canvas.show()
+    app.processEvents()
+
+    results = []
+    for width, height in RESOLUTIONS:
+        frames = synthetic_frames(width, height, 8)
+        result = {"case": f"{width}x{height}", "canvas": f"{CANVAS_SIZE[0]}x{CANVAS_SIZE[1]}"}
+        result["legacy"] = time_path(legacy, lambda frame: legacy_display(legacy, frame), frames, repeats)
+        canvas.set_fast_scaling(True)
+        result["canvas_fast"] = time_path(canvas, canvas.set_frame, frames, repeats)
+        canvas.set_fast_scaling(False)
+        result["canvas_smooth"] = time_path(canvas, canvas.set_frame, frames, repeats)
+        canvas.viewport.zoom_at(0.5, 0.5, 4.0)
+        result["canvas_zoom4"] = time_path(canvas, canvas.set_frame, frames, repeats)
+        canvas.viewport.reset()
+        results.append(result)
+    return results
+
+
+def machine_info() -> Dict[str, Any]:
+    return {
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "opencv": cv2.__version__,
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def save_baseline(path: str, results: List[Dict[str, Any]]):
+    payload = {
+        "schema_version": BASELINE_SCHEMA_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "machine": machine_info(),
+        "results": results,
+    }
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with target.open("w", encoding="utf-8") as file:
+        json.dump(payload, file, ensure_ascii=False, indent=2)
+        file.write("\n")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="VideoCanvas per-frame display benchmark")
+    parser.add_argument("--repeats", type=int, default=200, help="frames shown per path and resolution")
+    parser.add_argument("--output", default=None, help="write results as a JSON baseline")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(max(20, args.repeats))
+    for result in results:
+        print(
+            f"{result['case']:<10} legacy {result['legacy']['mean_ms']:.2f} ms  "
+            f"fast {result['canvas_fast']['mean_ms']:.2f} ms  "
+            f"smooth {result['canvas_smooth']['mean_ms']:.2f} ms  "
+            f"zoom4 {result['canvas_zoom4']['mean_ms']:.2f} ms"
+        )
+    if args.output:
+        save_baseline(args.output, results)
+        print(f"baseline written: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,22 @@
+"""Non-overlapping synthetic annotation intervals for benchmarks."""
+from __future__ import annotations
+
+from typing import List
+
+from models.annotation_model import AnnotationInterval
+
+
+# Each synthetic interval covers two frames followed by a two-frame gap.
+INTERVAL_STRIDE = 4
+
+
+def synthetic_intervals(count: int) -> List[AnnotationInterval]:
+    return [
+        AnnotationInterval(id=f"bench-{index}", start_frame=index * INTERVAL_STRIDE, end_frame=index * INTERVAL_STRIDE + 2)
+        for index in range(count)
+    ]
+
+
+def frames_for(count: int) -> int:
+    """Frame count of a video long enough to hold ``count`` synthetic intervals."""
+    return count * INTERVAL_STRIDE + INTERVAL_STRIDE
@@ -0,0 +1,92 @@
+"""Synthetic mouse videos with scripted freeze periods for benchmarks."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+
+CODEC_EXTENSIONS = {
+    "MJPG": ".avi",
+    "XVID": ".avi",
+    "mp4v": ".mp4",
+}
+
+
+@dataclass(frozen=True)
+class SyntheticVideoSpec:
+    """Shape of one synthetic video."""
+
+    width: int = 640
+    height: int = 480
+    fps: float = 30.0
+    seconds: float = 20.0
+    codec: str = "MJPG"
+    freeze_periods: Tuple[Tuple[float, float], ...] = ((2.0, 5.0), (9.0, 11.0), (15.0, 18.0))
+
+    @property
+    def total_frames(self) -> int:
+        return int(round(self.seconds * self.fps))
+
+    @property
+    def name(self) -> str:
+        return f"{self.codec}_{self.width}x{self.height}_{self.seconds:g}s"
+
+
+def default_freeze_periods(seconds: float) -> Tuple[Tuple[float, float], ...]:
+    """Alternate 3 s moving / 2 s frozen over the whole video."""
+    periods: List[Tuple[float, float]] = []
+    start = 3.0
+    while start + 2.0 <= seconds:
+        periods.append((start, start + 2.0))
+        start += 5.0
+    return tuple(periods)
+
+
+def is_frozen(timestamp: float, freeze_periods: Sequence[Tuple[float, float]]) -> bool:
+    return any(start <= timestamp < end for start, end in freeze_periods)
+
+
+def write_synthetic_video(directory: str, spec: SyntheticVideoSpec) -> str:
+    """Write a moving-blob video and return its path.
+
+    Raises:
+        RuntimeError: The requested codec is not available in this OpenCV build.
+    """
+    path = Path(directory) / f"{spec.name}{CODEC_EXTENSIONS.get(spec.codec, '.avi')}"
+    writer = cv2.VideoWriter(
+        str(path),
+        cv2.VideoWriter_fourcc(*spec.codec),
+        spec.fps,
+        (spec.width, spec.height),
+    )
+    if not writer.isOpened():
+        raise RuntimeError(f"OpenCV writer unavailable for codec {spec.codec}")
+
+    radius = max(4, spec.height // 12)
+    rng = np.random.default_rng(0)
+    background = rng.integers(30, 60, size=(spec.height, spec.width, 3), dtype=np.uint8)
+    moving_frames = 0
+    try:
+        for index in range(spec.total_frames):
+            if not is_frozen(index / spec.fps, spec.freeze_periods):
+                moving_frames += 1
+            frame = background.copy()
+            centre = _position_for(moving_frames, spec, radius)
+            cv2.circle(frame, centre, radius, (220, 220, 220), -1)
+            writer.write(frame)
+    finally:
+        writer.release()
+    return str(path)
+
+
+def _position_for(moving_frames: int, spec: SyntheticVideoSpec, radius: int) -> Tuple[int, int]:
+    span_x = max(1, spec.width - 4 * radius)
+    span_y = max(1, spec.height - 4 * radius)
+    phase = moving_frames * 4
+    x = 2 * radius + abs((phase % (2 * span_x)) - span_x)
+    y = 2 * radius + abs(((phase // 3) % (2 * span_y)) - span_y)
+    return int(x), int(y)
@@ -0,0 +1,334 @@
+"""GUI-side benchmarks for ``QtAnnotationWorkbench`` on the offscreen platform.
+
+Runs the real workbench window without a display and measures::
+
+    python -m benchmarks.ui_benchmark --output bench/ui.json
+    python -m benchmarks.ui_benchmark --quick --compare bench/ui.json
+
+* ``playback_<speed>x``: achieved presentation rate, content rate and dropped
+  frames while playing a synthetic video at 1x, 2x and 4x.
+* ``interval_paint_<count>_zoom<level>x``: one synchronous repaint of
+  ``IntervalTrackWidget`` holding that many intervals, at several zoom levels.
+* ``refresh_<count>``: one interval edit through the undo stack until the
+  window has repainted, and ``_refresh_all_views`` on its own.
+* ``thumbnail_miss`` / ``thumbnail_hit``: a hover preview on an uncached and
+  a cached frame.
+
+Every result names its main ``metric`` so ``--compare`` can report
+``current / baseline`` per case.
+"""
+from __future__ import annotations
+
+import argparse
+from datetime import datetime, timezone
+import json
+import os
+from pathlib import Path
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+if __package__ in {None, ""}:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import cv2
+from PySide6.QtCore import QEventLoop, QPoint, QTimer
+from PySide6.QtWidgets import QApplication
+
+from benchmarks.synthetic_annotations import frames_for, synthetic_intervals
+from benchmarks.synthetic_video import SyntheticVideoSpec, default_freeze_periods, write_synthetic_video
+from utils.timeline_viewport import TimelineViewport
+from views.qt.widgets.timeline import IntervalTrackWidget
+from views.qt.workbench import QtAnnotationWorkbench
+
+
+BASELINE_SCHEMA_VERSION = 1
+PLAYBACK_SPEEDS = ("1.0x", "2.0x", "4.0x")
+FULL_INTERVAL_COUNTS = (10, 1_000, 50_000)
+QUICK_INTERVAL_COUNTS = (10, 1_000)
+ZOOM_LEVELS = (1, 10, 100)
+WINDOW_SIZE = (1500, 920)
+TRACK_SIZE = (1200, 76)
+
+
+def run_event_loop(seconds: float):
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    loop.exec()
+
+
+def summarise(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "mean_ms": round(statistics.fmean(ordered), 3),
+        "p95_ms": round(ordered[max(0, int(len(ordered) * 0.95) - 1)], 3),
+        "max_ms": round(ordered[-1], 3),
+    }
+
+
+def time_calls(call: Callable[[int], None], repeats: int) -> Dict[str, float]:
+    samples = []
+    for index in range(repeats):
+        started = time.perf_counter()
+        call(index)
+        samples.append((time.perf_counter() - started) * 1000)
+    return summarise(samples)
+
+
+def repeats_for(count: int, repeats: int) -> int:
+    """Fewer repetitions for very large cases so the run stays short."""
+    return max(3, min(repeats, repeats * 1_000 // max(count, 1)))
+
+
+def bench_playback(app: QApplication, window: QtAnnotationWorkbench, seconds: float) -> List[Dict[str, Any]]:
+    results = []
+    fps = window.video_model.video_fps
+    for speed in PLAYBACK_SPEEDS:
+        window.speed_combo.setCurrentText(speed)
+        window.seek_to_frame(0)
+        app.processEvents()
+        started_frame = window.current_frame
+        started = time.perf_counter()
+        window.toggle_playback()
+        run_event_loop(seconds)
+        elapsed = time.perf_counter() - started
+        clock = window.playback_clock
+        presented = clock.presented_frames
+        dropped = clock.dropped_frames
+        advanced = window.current_frame - started_frame
+        window.toggle_playback()
+        app.processEvents()
+        rate = float(speed.rstrip("x"))
+        results.append(
+            {
+                "case": f"playback_{speed}",
+                "metric": "achieved_fps",
+                "speed": rate,
+                "seconds": round(elapsed, 3),
+                "achieved_fps": round(presented / elapsed, 2),
+                "target_display_fps": round(min(fps * rate, window._display_rate()), 2),
+                "content_fps": round(advanced / elapsed, 2),
+                "target_content_fps": round(fps * rate, 2),
+                "dropped_frames": dropped,
+            }
+        )
+    return results
+
+
+def bench_interval_paint(app: QApplication, counts: Sequence[int], repeats: int) -> List[Dict[str, Any]]:
+    viewport = TimelineViewport()
+    track = IntervalTrackWidget(viewport)
+    track.resize(*TRACK_SIZE)
+    track.show()
+    results = []
+    for count in counts:
+        total_frames = frames_for(count)
+        viewport.set_video(total_frames, 30.0)
+        track.set_intervals(synthetic_intervals(count))
+        for zoom in ZOOM_LEVELS:
+            span = max(viewport.minimum_span, total_frames // zoom)
+            start = max(0, (total_frames - span) // 2)
+            viewport.set_visible_range(start, start + span)
+            track.set_current_frame(start + span // 2)
+            app.processEvents()
+            result = {"case": f"interval_paint_{count}_zoom{zoom}x", "metric": "mean_ms", "intervals": count, "zoom": zoom}
+            result.update(time_calls(lambda _index: track.repaint(), repeats_for(count, repeats)))
+            results.append(result)
+    track.close()
+    return results
+
+
+def install_intervals(window: QtAnnotationWorkbench, count: int):
+    """Put ``count`` intervals on a timeline stretched to fit them.
+
+    The generated intervals never overlap, so they are assigned directly
+    instead of through ``replace_intervals``, whose pairwise validation would
+    dominate setup at the largest sizes.
+    """
+    model = window.annotation_model
+    total_frames = max(window.video_model.total_frames, frames_for(count))
+    model.set_timing(model.video_fps, total_frames)
+    model._intervals = synthetic_intervals(count)
+    model.dirty = False
+    window.timeline.set_video(total_frames, model.video_fps)
+    window.undo_stack.clear()
+    window._refresh_all_views()
+
+
+def bench_refresh(app: QApplication, window: QtAnnotationWorkbench, counts: Sequence[int], repeats: int) -> List[Dict[str, Any]]:
+    results = []
+    for count in counts:
+        install_intervals(window, count)
+        app.processEvents()
+        target = synthetic_intervals(count)[count // 2]
+
+        def edit(index: int):
+            end_frame = target.end_frame - 1 if index % 2 == 0 else target.end_frame
+            window._push_update_interval(target.id, target.start_frame, end_frame)
+            app.processEvents()
+
+        rounds = repeats_for(count, repeats)
+        result = {"case": f"refresh_{count}", "metric": "edit_mean_ms", "intervals": count}
+        edit_stats = time_calls(edit, rounds)
+        refresh_stats = time_calls(lambda _index: window._refresh_all_views(), rounds)
+        result.update({f"edit_{key}": value for key, value in edit_stats.items()})
+        result.update({f"refresh_{key}": value for key, value in refresh_stats.items()})
+        results.append(result)
+    install_intervals(window, 0)
+    return results
+
+
+def bench_thumbnails(window: QtAnnotationWorkbench, repeats: int) -> List[Dict[str, Any]]:
+    total_frames = window.video_model.total_frames
+    frames = [(index * 7919) % total_frames for index in range(min(repeats, window.thumbnail_cache.max_items))]
+    anchor = window.mapToGlobal(QPoint(400, 700))
+    window.thumbnail_cache.cache.clear()
+    show = lambda index: window._show_thumbnail(frames[index % len(frames)], anchor)
+    misses = time_calls(show, len(frames))
+    hits = time_calls(show, len(frames))
+    window.thumbnail_popup.hide()
+    return [
+        {"case": "thumbnail_miss", "metric": "mean_ms", "samples": len(frames), **misses},
+        {"case": "thumbnail_hit", "metric": "mean_ms", "samples": len(frames), **hits},
+    ]
+
+
+def run_benchmarks(
+    work_dir: str,
+    interval_counts: Sequence[int],
+    playback_seconds: float,
+    repeats: int,
+    video_spec: SyntheticVideoSpec,
+) -> List[Dict[str, Any]]:
+    app = QApplication.instance() or QApplication([])
+    video_path = write_synthetic_video(work_dir, video_spec)
+    window = QtAnnotationWorkbench()
+    window.resize(*WINDOW_SIZE)
+    window.show()
+    window.load_video(video_path)
+    app.processEvents()
+    try:
+        results = bench_playback(app, window, playback_seconds)
+        results.extend(bench_interval_paint(app, interval_counts, repeats))
+        results.extend(bench_refresh(app, window, interval_counts, repeats))
+        results.extend(bench_thumbnails(window, repeats))
+    finally:
+        window.undo_stack.clear()
+        window.annotation_model.dirty = False
+        window.close()
+    return results
+
+
+def format_result(result: Dict[str, Any]) -> str:
+    if result["metric"] == "achieved_fps":
+        return (
+            f"{result['case']:<32} {result['achieved_fps']:.1f}/{result['target_display_fps']:.1f} fps shown, "
+            f"content {result['content_fps']:.1f}/{result['target_content_fps']:.1f} fps, "
+            f"dropped {result['dropped_frames']}"
+        )
+    if result["metric"] == "edit_mean_ms":
+        return (
+            f"{result['case']:<32} edit {result['edit_mean_ms']:.2f} ms (p95 {result['edit_p95_ms']:.2f}), "
+            f"refresh {result['refresh_mean_ms']:.2f} ms"
+        )
+    return f"{result['case']:<32} {result['mean_ms']:.3f} ms (p95 {result['p95_ms']:.3f})"
+
+
+def machine_info() -> Dict[str, Any]:
+    return {
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "opencv": cv2.__version__,
+        "qt_platform": os.environ.get("QT_QPA_PLATFORM", ""),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def save_baseline(path: str, results: List[Dict[str, Any]]):
+    payload = {
+        "schema_version": BASELINE_SCHEMA_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "machine": machine_info(),
+        "results": results,
+    }
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with target.open("w", encoding="utf-8") as file:
+        json.dump(payload, file, ensure_ascii=False, indent=2)
+        file.write("\n")
+
+
+def load_baseline(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def compare_results(baseline: List[Dict[str, Any]], current: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Match cases by name and report ``current / baseline`` of each case's metric."""
+    previous = {item["case"]: item for item in baseline}
+    rows = []
+    for item in current:
+        metric = item["metric"]
+        before = previous.get(item["case"])
+        if before is None or not before.get(metric) or item.get(metric) is None:
+            continue
+        rows.append(
+            {
+                "case": item["case"],
+                "metric": metric,
+                "baseline": before[metric],
+                "current": item[metric],
+                "ratio": round(item[metric] / before[metric], 3),
+            }
+        )
+    return rows
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Offscreen QtAnnotationWorkbench UI benchmark")
+    parser.add_argument("--quick", action="store_true", help="smaller video, fewer intervals and shorter playback")
+    parser.add_argument("--repeats", type=int, default=50, help="repetitions per timing case")
+    parser.add_argument("--playback-seconds", type=float, default=None, help="playback time per speed")
+    parser.add_argument("--output", default=None, help="write results as a JSON baseline")
+    parser.add_argument("--compare", default=None, help="compare against a saved JSON baseline")
+    parser.add_argument("--work-dir", default=None, help="keep the synthetic video in this directory")
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        spec = SyntheticVideoSpec(width=320, height=240, seconds=10.0, freeze_periods=default_freeze_periods(10.0))
+        counts = QUICK_INTERVAL_COUNTS
+    else:
+        spec = SyntheticVideoSpec(width=640, height=480, seconds=30.0, freeze_periods=default_freeze_periods(30.0))
+        counts = FULL_INTERVAL_COUNTS
+    playback_seconds = args.playback_seconds or (1.5 if args.quick else 4.0)
+    repeats = max(5, args.repeats)
+
+    if args.work_dir:
+        Path(args.work_dir).mkdir(parents=True, exist_ok=True)
+        results = run_benchmarks(args.work_dir, counts, playback_seconds, repeats, spec)
+    else:
+        with tempfile.TemporaryDirectory(prefix="videotimer-ui-bench-") as work_dir:
+            results = run_benchmarks(work_dir, counts, playback_seconds, repeats, spec)
+
+    for result in results:
+        print(format_result(result))
+    if args.output:
+        save_baseline(args.output, results)
+        print(f"baseline written: {args.output}")
+    if args.compare:
+        rows = compare_results(load_baseline(args.compare)["results"], results)
+        for row in rows:
+            print(
+                f"{row['case']:<32} {row['metric']} {row['baseline']:.3f} -> {row['current']:.3f} "
+                f"(x{row['ratio']:.2f})"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
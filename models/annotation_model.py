@@ -1,6 +1,7 @@
 """Editable interval annotation model for the PySide6 workbench."""
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 import json
@@ -87,6 +88,9 @@ class AnnotationModel:
         self.video_fps: float = 30.0
         self.total_frames: int = 0
         self.video_metadata: Dict[str, Any] = {}
+        # Per-frame start times (plus the end of the last frame) for variable
+        # frame rate videos; ``None`` means frames are evenly spaced at fps.
+        self.frame_times: Optional[List[float]] = None
         self._intervals: List[AnnotationInterval] = []
         self.dirty: bool = False
 
@@ -108,6 +112,7 @@ class AnnotationModel:
         self.video_path = video_path
         self.video_fps = fps if fps > 0 else 30.0
         self.total_frames = max(0, int(total_frames))
+        self.frame_times = None
         self.video_metadata = {
             "path": video_path,
             "filename": Path(video_path).name,
@@ -125,12 +130,46 @@ class AnnotationModel:
         if dirty:
             self.dirty = True
 
+    def set_timing(
+        self,
+        fps: float,
+        total_frames: int,
+        frame_times: Optional[List[float]] = None,
+    ):
+        """Replace frame rate, frame count and frame times, keeping intervals.
+
+        Used once an exact media index is available for an already open
+        video. ``frame_times`` must hold ``total_frames + 1`` entries.
+        """
+        self.video_fps = fps if fps > 0 else self.video_fps
+        self.total_frames = max(0, int(total_frames))
+        if frame_times is not None and len(frame_times) != self.total_frames + 1:
+            raise ValueError("frame_times must have total_frames + 1 entries")
+        self.frame_times = list(frame_times) if frame_times is not None else None
+        self.video_metadata.update(
+            {
+                "fps": self.video_fps,
+                "total_frames": self.total_frames,
+                "duration": self.frame_to_seconds(self.total_frames),
+            }
+        )
+
     def frame_to_seconds(self, frame: int) -> float:
+        if self.frame_times is not None:
+            return self.frame_times[min(max(0, int(frame)), len(self.frame_times) - 1)]
         if self.video_fps <= 0:
             return 0.0
         return max(0, int(frame)) / self.video_fps
 
     def seconds_to_frame(self, seconds: float) -> int:
+        if self.frame_times is not None:
+            position = bisect_left(self.frame_times, max(0.0, seconds))
+            if position >= len(self.frame_times):
+                return self.clamp_frame(len(self.frame_times) - 1)
+            # Snap to whichever frame boundary is closer, like round() below.
+            if position > 0 and seconds - self.frame_times[position - 1] < self.frame_times[position] - seconds:
+                position -= 1
+            return self.clamp_frame(position)
         return self.clamp_frame(round(max(0.0, seconds) * self.video_fps))
 
     def clamp_frame(self, frame: int) -> int:
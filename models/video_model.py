@@ -1,6 +1,6 @@
 """视频数据模型"""
 import threading
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 import cv2
 import numpy as np
 
@@ -8,17 +8,28 @@ import numpy as np
 class VideoModel:
     """视频数据模型 - 封装视频相关数据"""
     
-    def __init__(self):
+    def __init__(self, capture_factory: Callable[[str], object] = cv2.VideoCapture):
+        self.capture_factory = capture_factory  # 打开解码器的工厂，分段视频清单需要使用 open_video_capture
         self.video_capture: Optional[cv2.VideoCapture] = None
         self.video_path: str = ""
+        self.capture_path: str = ""  # 实际解码的文件，可能是本地缓存副本
+        self.media_index = None  # 媒体索引（关键帧、逐帧时间戳、真实帧数），未扫描时为 None
+        self.proxy_path: str = ""  # 低分辨率全帧内代理文件，仅用于拖动预览、缩略图和分割预览
         self.video_fps: float = 30.0
         self.total_frames: int = 0
+        self.frame_width: int = 0
+        self.frame_height: int = 0
         self.current_frame: int = 0
         self.video_playing: bool = False
         self.video_paused: bool = False
         self.playback_speed: float = 1.0  # 播放速度倍率
         self._lock = threading.Lock()  # 线程锁，保护video_capture访问
 
+    @property
+    def preview_path(self) -> str:
+        """拖动预览、缩略图等只需近似画面的场景使用的解码文件，有代理文件时优先使用代理"""
+        return self.proxy_path or self.capture_path
+
     @property
     def duration(self) -> float:
         """获取视频总时长（秒）"""
@@ -40,11 +51,12 @@ class VideoModel:
             return (self.current_frame / max(self.total_frames - 1, 1)) * 100
         return 0.0
 
-    def load_video(self, file_path: str) -> bool:
+    def load_video(self, file_path: str, capture_path: Optional[str] = None) -> bool:
         """加载视频文件
         
         Args:
             file_path: 视频文件路径
+            capture_path: 实际解码的文件路径（如本地缓存副本），默认与 file_path 相同
             
         Returns:
             是否加载成功
@@ -55,21 +67,74 @@ class VideoModel:
                 if self.video_capture:
                     self.video_capture.release()
 
-                self.video_capture = cv2.VideoCapture(file_path)
+                self.video_capture = self.capture_factory(capture_path or file_path)
 
                 if not self.video_capture.isOpened():
                     return False
 
                 # 获取视频信息
                 self.video_path = file_path
+                self.capture_path = capture_path or file_path
                 self.video_fps = self.video_capture.get(cv2.CAP_PROP_FPS)
                 self.total_frames = int(self.video_capture.get(cv2.CAP_PROP_FRAME_COUNT))
+                self.frame_width = int(self.video_capture.get(cv2.CAP_PROP_FRAME_WIDTH))
+                self.frame_height = int(self.video_capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
                 self.current_frame = 0
 
             return True
         except Exception:
             return False
 
+    def switch_capture_source(self, capture_path: str) -> bool:
+        """切换到同一视频的另一份副本（如本地缓存），保持视频路径和当前帧不变
+        
+        Args:
+            capture_path: 新的解码文件路径
+            
+        Returns:
+            是否切换成功；帧数不一致时保留原 capture
+        """
+        capture = self.capture_factory(capture_path)
+        if not capture.isOpened():
+            return False
+        with self._lock:
+            # 与当前 capture 的容器头帧数比较，total_frames 可能已被媒体索引修正
+            expected = (
+                int(self.video_capture.get(cv2.CAP_PROP_FRAME_COUNT))
+                if self.video_capture
+                else self.total_frames
+            )
+        if int(capture.get(cv2.CAP_PROP_FRAME_COUNT)) != expected:
+            capture.release()
+            return False
+        with self._lock:
+            if self.video_capture:
+                position = self.video_capture.get(cv2.CAP_PROP_POS_FRAMES)
+                capture.set(cv2.CAP_PROP_POS_FRAMES, position)
+                self.video_capture.release()
+            self.video_capture = capture
+            self.capture_path = capture_path
+        return True
+
+    def apply_media_index(self, media_index) -> bool:
+        """使用媒体索引中的真实帧数和平均帧率替换容器头信息
+        
+        Args:
+            media_index: services.media_index.MediaIndex 实例
+            
+        Returns:
+            帧数或帧率是否发生变化
+        """
+        with self._lock:
+            self.media_index = media_index
+            changed = media_index.frame_count != self.total_frames
+            self.total_frames = media_index.frame_count
+            if media_index.is_variable_frame_rate and media_index.average_fps > 0:
+                changed = changed or abs(media_index.average_fps - self.video_fps) > 1e-6
+                self.video_fps = media_index.average_fps
+            self.current_frame = min(self.current_frame, max(0, self.total_frames - 1))
+        return changed
+
     def seek_to_frame(self, frame_number: int) -> bool:
         """跳转到指定帧
         
@@ -127,6 +192,9 @@ class VideoModel:
             if self.video_capture:
                 self.video_capture.release()
                 self.video_capture = None
+            self.capture_path = ""
+            self.proxy_path = ""
+            self.media_index = None
         self.video_playing = False
         self.current_frame = 0
 
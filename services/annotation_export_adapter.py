@@ -1,7 +1,7 @@
 """Adapters between interval annotations and the legacy export service."""
 from __future__ import annotations
 
-from typing import Iterable, List
+from typing import Callable, Iterable, List, Optional
 
 from models.annotation_model import AnnotationInterval
 from models.record_model import TimeRecord
@@ -10,19 +10,22 @@ from models.record_model import TimeRecord
 def intervals_to_time_records(
     intervals: Iterable[AnnotationInterval],
     fps: float,
+    frame_to_seconds: Optional[Callable[[int], float]] = None,
 ) -> List[TimeRecord]:
     """Convert interval annotations to the paired TimeRecord format.
 
     The existing Excel exporter expects odd/even records to represent
     start/end points. Keeping this adapter small lets the new UI use a proper
     interval model without rewriting the export sheets in the first pass.
+    Pass ``frame_to_seconds`` to use exact per-frame times instead of ``fps``.
     """
+    to_seconds = frame_to_seconds or (lambda frame: _frame_to_seconds(frame, fps))
     records: List[TimeRecord] = []
     previous_time = 0.0
 
     for interval in sorted(intervals, key=lambda item: (item.start_frame, item.end_frame)):
-        start_time = _frame_to_seconds(interval.start_frame, fps)
-        end_time = _frame_to_seconds(interval.end_frame, fps)
+        start_time = to_seconds(interval.start_frame)
+        end_time = to_seconds(interval.end_frame)
         for video_time, frame in (
             (start_time, interval.start_frame),
             (end_time, interval.end_frame),
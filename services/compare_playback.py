@@ -0,0 +1,167 @@
+"""Lockstep playback of several videos on one shared clock."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+import time
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from services.media_index import MediaIndex
+from services.playback_engine import DecodeAheadBuffer
+
+
+@dataclass
+class CompareSource:
+    """One video of a comparison and how its frames map to time."""
+
+    video_path: str
+    fps: float
+    total_frames: int
+    media_index: Optional[MediaIndex] = None
+
+    @property
+    def duration(self) -> float:
+        if self.media_index is not None and self.media_index.frame_count:
+            return float(self.media_index.pts[-1]) + self.media_index.frame_duration
+        return self.total_frames / self.fps if self.fps > 0 else 0.0
+
+    def frame_at(self, seconds: float) -> int:
+        """Frame on screen at ``seconds``: the last one whose presentation time has come."""
+        if self.media_index is not None and self.media_index.frame_count:
+            frame = int(np.searchsorted(self.media_index.pts, seconds, side="right")) - 1
+        else:
+            frame = int(math.floor(max(0.0, seconds) * self.fps + 1e-9))
+        return max(0, min(frame, self.total_frames - 1))
+
+    def frame_time(self, frame: int) -> float:
+        frame = max(0, min(int(frame), max(0, self.total_frames - 1)))
+        if self.media_index is not None and frame < self.media_index.frame_count:
+            return float(self.media_index.pts[frame])
+        return frame / self.fps if self.fps > 0 else 0.0
+
+
+def _decode_ahead_buffer(source: CompareSource, depth: int) -> DecodeAheadBuffer:
+    return DecodeAheadBuffer(source.video_path, depth, media_index=source.media_index)
+
+
+class ComparePlayback:
+    """Present two or more videos in lockstep on one wall clock.
+
+    Every source has its own :class:`DecodeAheadBuffer`, so each video is
+    decoded on its own thread and the decoders run in parallel. The shared
+    position is kept in seconds; :meth:`poll` maps it to each video's frame
+    through that video's own timestamps, so videos with different frame
+    rates stay aligned in time rather than in frame numbers.
+
+    :meth:`poll` only pops a buffer when its video is due a new frame. As
+    with :meth:`DecodeAheadBuffer.pop`, a frame handed out is a ring slot that
+    is reused after the next pop of the same buffer.
+    """
+
+    def __init__(
+        self,
+        sources: Sequence[CompareSource],
+        depth: int = 8,
+        buffer_factory: Optional[Callable[[CompareSource, int], DecodeAheadBuffer]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        max_display_fps: float = 60.0,
+    ):
+        buffer_factory = buffer_factory or _decode_ahead_buffer
+        self.sources = list(sources)
+        self.buffers = [buffer_factory(source, depth) for source in self.sources]
+        self.duration = max((source.duration for source in self.sources), default=0.0)
+        self.max_display_fps = max(1.0, float(max_display_fps))
+        self.speed = 1.0
+        self.playing = False
+        self.shown_frames: List[Optional[int]] = [None] * len(self.sources)
+        self._clock = clock
+        self._origin_position = 0.0
+        self._origin_time = 0.0
+
+    @property
+    def position(self) -> float:
+        """Shared playhead in seconds."""
+        if not self.playing:
+            return self._origin_position
+        elapsed = max(0.0, self._clock() - self._origin_time)
+        return min(self._origin_position + elapsed * self.speed, self.duration)
+
+    @property
+    def finished(self) -> bool:
+        return self.position >= self.duration
+
+    @property
+    def dropped_frames(self) -> List[int]:
+        return [buffer.stats.dropped for buffer in self.buffers]
+
+    def target_frames(self, position: Optional[float] = None) -> List[int]:
+        position = self.position if position is None else position
+        return [source.frame_at(position) for source in self.sources]
+
+    def seek(self, seconds: float):
+        """Move every video to ``seconds``; the next :meth:`poll` presents the new frames."""
+        self._origin_position = max(0.0, min(float(seconds), self.duration))
+        self._origin_time = self._clock()
+        for index, (buffer, frame) in enumerate(zip(self.buffers, self.target_frames())):
+            buffer.seek(frame)
+            self.shown_frames[index] = None
+
+    def play(self, speed: Optional[float] = None):
+        """Run the shared clock from the current position.
+
+        The buffers keep decoding sequentially after the frames on screen,
+        so resuming needs no seek.
+        """
+        if speed is not None:
+            self.set_speed(speed)
+        if self.finished:
+            self.seek(0.0)
+        self._origin_time = self._clock()
+        self.playing = True
+
+    def pause(self):
+        """Stop the clock and present the exact frames due at the paused position."""
+        self._origin_position = self.position
+        self.playing = False
+        for index, (buffer, frame) in enumerate(zip(self.buffers, self.target_frames())):
+            if self.shown_frames[index] != frame:
+                # With a frame step the due frame may never be decoded; fetch it.
+                buffer.seek(frame)
+                self.shown_frames[index] = None
+
+    def set_speed(self, speed: float):
+        self._origin_position = self.position
+        self._origin_time = self._clock()
+        self.speed = max(0.01, float(speed))
+        for source, buffer in zip(self.sources, self.buffers):
+            # Grab past frames that would never be shown at high speeds.
+            rate = source.fps * self.speed
+            buffer.set_frame_step(max(1, math.ceil(rate / self.max_display_fps - 1e-6)))
+
+    def poll(self) -> List[Optional[Tuple[int, np.ndarray]]]:
+        """Return the frame each video should show now, or ``None`` where it is unchanged.
+
+        A ``None`` also means the video's decoder has not caught up yet; its
+        previous frame stays on screen and is replaced on a later poll.
+        """
+        targets = self.target_frames()
+        presented: List[Optional[Tuple[int, np.ndarray]]] = []
+        for index, (buffer, target) in enumerate(zip(self.buffers, targets)):
+            if self.shown_frames[index] == target:
+                presented.append(None)
+                continue
+            item = buffer.pop_until(target)
+            if item is not None:
+                self.shown_frames[index] = item[0]
+            presented.append(item)
+        if self.playing and self.finished:
+            self.pause()
+        return presented
+
+    def stop(self):
+        """Stop every decoder thread."""
+        self.playing = False
+        for buffer in self.buffers:
+            buffer.stop()
@@ -0,0 +1,164 @@
+"""Pool of parked OpenCV decoders for random access across a long video."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import time
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from services.media_index import MediaIndex, seek_capture
+from services.segmented_capture import open_video_capture
+from utils.perf_stats import get_perf_stats
+
+
+# Estimated cost of a seek, in frames decoded, when keyframes are unknown.
+DEFAULT_SEEK_COST_FRAMES = 60
+# Fixed overhead of a seek on top of decoding forward from the keyframe.
+SEEK_OVERHEAD_FRAMES = 4
+VISIT_BINS = 64
+
+
+@dataclass
+class _Decoder:
+    capture: object
+    position: int = 0
+    last_used: float = 0.0
+
+
+class DecoderPool:
+    """A few captures of one video, each left where it last decoded.
+
+    A read goes to the decoder that reaches the target by decoding forward
+    the least; only when a seek is cheaper does the least recently used
+    decoder jump. Visits are counted per region of the timeline so
+    :meth:`park_idle` can move idle decoders into the regions the user keeps
+    returning to. Intended for use from one thread.
+    """
+
+    def __init__(
+        self,
+        video_path: str,
+        total_frames: int,
+        size: int = 3,
+        capture_factory: Callable[[str], object] = open_video_capture,
+        media_index: Optional[MediaIndex] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.video_path = video_path
+        self.total_frames = max(1, int(total_frames))
+        self.media_index = media_index
+        self._clock = clock
+        self._decoders: List[_Decoder] = [
+            _Decoder(capture_factory(video_path)) for _ in range(max(1, int(size)))
+        ]
+        self.visits = [0] * VISIT_BINS
+        self.seeks = 0
+
+    @property
+    def positions(self) -> List[int]:
+        return [decoder.position for decoder in self._decoders]
+
+    def forward_distance(self, frame: int) -> Optional[int]:
+        """Frames the closest decoder would decode forward to reach ``frame``.
+
+        Returns ``None`` when every decoder is past ``frame`` or a seek would
+        be cheaper than decoding forward.
+        """
+        distance = min(
+            (frame - decoder.position for decoder in self._decoders if decoder.position <= frame),
+            default=None,
+        )
+        if distance is None or distance >= self._seek_cost(frame):
+            return None
+        return distance
+
+    def read_frames(self, start: int, end: int) -> List[Tuple[int, np.ndarray]]:
+        """Decode ``start..end`` inclusive with the cheapest decoder.
+
+        Stops early at end of stream, so the result may be shorter.
+        """
+        start = max(0, int(start))
+        self.visits[self._bin(end)] += 1
+        decoder = self._pick(start)
+        capture = decoder.capture
+        if decoder.position > start or start - decoder.position >= self._seek_cost(start):
+            self.seeks += 1
+            if not seek_capture(capture, start, self.media_index):
+                return []
+        else:
+            for _ in range(start - decoder.position):
+                if not capture.grab():
+                    return []
+        decoder.position = start
+        decoder.last_used = self._clock()
+
+        perf = get_perf_stats()
+        frames: List[Tuple[int, np.ndarray]] = []
+        for index in range(start, int(end) + 1):
+            started = perf.start()
+            ok, frame = capture.read()
+            perf.stop("decode", started)
+            if not ok:
+                break
+            frames.append((index, frame))
+            decoder.position = index + 1
+        return frames
+
+    def park_idle(self, keep_recent: int = 1):
+        """Move idle decoders to the most visited regions not already covered.
+
+        The ``keep_recent`` most recently used decoders stay where they are.
+        """
+        by_recency = sorted(self._decoders, key=lambda decoder: decoder.last_used, reverse=True)
+        idle = by_recency[keep_recent:]
+        covered = {self._bin(decoder.position) for decoder in by_recency[:keep_recent]}
+        hot_bins = [
+            bin_index
+            for bin_index in sorted(range(VISIT_BINS), key=lambda index: self.visits[index], reverse=True)
+            if self.visits[bin_index] > 0 and bin_index not in covered
+        ][:len(idle)]
+        # A decoder already sitting in a hot region stays, one per region.
+        movable = []
+        for decoder in idle:
+            bin_index = self._bin(decoder.position)
+            if bin_index in hot_bins and bin_index not in covered:
+                covered.add(bin_index)
+            else:
+                movable.append(decoder)
+        targets = [bin_index for bin_index in hot_bins if bin_index not in covered]
+        for decoder, bin_index in zip(movable, targets):
+            target = self._bin_start(bin_index)
+            if self.media_index is not None:
+                keyframe = self.media_index.keyframe_at_or_before(target)
+                target = keyframe if keyframe is not None else target
+            if seek_capture(decoder.capture, target, self.media_index):
+                decoder.position = target
+
+    def release(self):
+        for decoder in self._decoders:
+            decoder.capture.release()
+        self._decoders = []
+
+    def _pick(self, frame: int) -> _Decoder:
+        forward = [decoder for decoder in self._decoders if decoder.position <= frame]
+        if forward:
+            closest = max(forward, key=lambda decoder: decoder.position)
+            if frame - closest.position < self._seek_cost(frame):
+                return closest
+        # Seeking: move the decoder that has been idle longest so the
+        # others stay parked where they were useful.
+        return min(self._decoders, key=lambda decoder: decoder.last_used)
+
+    def _seek_cost(self, frame: int) -> int:
+        if self.media_index is not None:
+            keyframe = self.media_index.keyframe_at_or_before(frame)
+            if keyframe is not None:
+                return frame - keyframe + SEEK_OVERHEAD_FRAMES
+        return DEFAULT_SEEK_COST_FRAMES
+
+    def _bin(self, frame: int) -> int:
+        return min(VISIT_BINS - 1, max(0, int(frame) * VISIT_BINS // self.total_frames))
+
+    def _bin_start(self, bin_index: int) -> int:
+        return (bin_index * self.total_frames + VISIT_BINS - 1) // VISIT_BINS
@@ -0,0 +1,69 @@
+"""In-memory cache of freezing detection results."""
+from __future__ import annotations
+
+from collections import OrderedDict
+import os
+import threading
+from typing import Hashable, List, Optional
+
+from services.freezing_detection_service import FreezingDetectionParams, FreezingInterval
+from utils.metrics import get_metrics
+
+
+def detection_cache_key(
+    video_path: str,
+    params: FreezingDetectionParams,
+    crop_role: Optional[str] = None,
+    split_ratio: Optional[float] = None,
+) -> Optional[tuple]:
+    """Return a cache key for one detection run, or ``None`` if the file is missing.
+
+    The key includes the file size and modification time so that a video
+    replaced on disk never reuses stale results.
+    """
+    try:
+        stat = os.stat(video_path)
+    except OSError:
+        return None
+    return (
+        os.path.abspath(video_path),
+        stat.st_size,
+        stat.st_mtime_ns,
+        params,
+        crop_role,
+        round(split_ratio, 6) if split_ratio is not None else None,
+    )
+
+
+class DetectionResultCache:
+    """Thread-safe LRU cache of detection results keyed by video and parameters."""
+
+    def __init__(self, max_items: int = 16):
+        self.max_items = max_items
+        self._items: OrderedDict[Hashable, List[FreezingInterval]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Optional[Hashable]) -> Optional[List[FreezingInterval]]:
+        if key is None:
+            return None
+        with self._lock:
+            intervals = self._items.get(key)
+            if intervals is None:
+                get_metrics().inc("cache_requests", cache="detection", result="miss")
+                return None
+            self._items.move_to_end(key)
+        get_metrics().inc("cache_requests", cache="detection", result="hit")
+        return list(intervals)
+
+    def put(self, key: Optional[Hashable], intervals: List[FreezingInterval]):
+        if key is None:
+            return
+        with self._lock:
+            self._items[key] = list(intervals)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
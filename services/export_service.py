@@ -1,17 +1,24 @@
 """导出服务类 - 使用策略模式支持多种导出格式"""
 from __future__ import annotations
 
+import logging
+import time
 import pandas as pd
 from typing import TYPE_CHECKING, List, Dict, Any, Tuple, Optional
 from abc import ABC, abstractmethod
 from models.record_model import RecordModel, TimeRecord
+from utils.metrics import get_metrics
 from utils.time_formatter import TimeFormatter
+from utils.tracing import get_tracer
 from models.export_types import ExportType
 
 if TYPE_CHECKING:
     from models.video_model import VideoModel
 
 
+logger = logging.getLogger(__name__)
+
+
 # 各导出类型的时间区间配置（秒）
 EXPORT_INTERVALS: Dict[ExportType, List[Tuple[float, float]]] = {
     ExportType.LOOMING: [
@@ -83,7 +90,11 @@ class ExcelExportStrategy(ExportStrategy):
     def export(self, records: List[TimeRecord], video_model: VideoModel, file_path: str,
                export_type: Optional[ExportType] = None) -> bool:
         """导出到Excel"""
+        metrics = get_metrics()
+        tracer = get_tracer()
+        started = time.perf_counter()
         try:
+            step = tracer.start()
             record_model = RecordModel()
             # 临时设置记录以便计算统计
             record_model._records = records
@@ -96,8 +107,10 @@ class ExcelExportStrategy(ExportStrategy):
             summary_data = self._create_summary_data(records, video_model)
             summary_df = pd.DataFrame(summary_data)
             final_df_paired = pd.concat([df_paired, summary_df], ignore_index=True)
+            tracer.stop("export_paired_data", step, "export", records=len(records))
 
             # Sheet 2: 区间统计
+            step = tracer.start()
             total_duration, intervals = self._calculate_interval_statistics(record_model)
             stats_data = self._create_stats_data(total_duration, intervals)
             df_stats = pd.DataFrame(stats_data)
@@ -105,8 +118,10 @@ class ExcelExportStrategy(ExportStrategy):
             # 区间详情
             detail_data = self._create_detail_data(intervals)
             df_detail = pd.DataFrame(detail_data)
+            tracer.stop("export_interval_statistics", step, "export", intervals=len(intervals))
 
             # Sheet 3: 按自定义区间统计（根据导出类型）
+            step = tracer.start()
             if export_type and export_type in EXPORT_INTERVALS:
                 custom_intervals = EXPORT_INTERVALS[export_type]
                 include_first_3min = export_type in EXPORT_TYPES_WITH_FIRST_3MIN
@@ -122,8 +137,10 @@ class ExcelExportStrategy(ExportStrategy):
                 custom_data = self._create_minute_data(minute_stats, total_duration)
                 df_custom = pd.DataFrame(custom_data)
                 sheet_name = '按分钟统计'
+            tracer.stop("export_custom_statistics", step, "export", sheet=sheet_name)
 
             # 写入Excel
+            step = tracer.start()
             with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
                 # Sheet 1: 原始记录
                 final_df_paired.to_excel(writer, sheet_name='原始记录', index=False)
@@ -152,12 +169,15 @@ class ExcelExportStrategy(ExportStrategy):
                 worksheet4.column_dimensions['A'].width = 25
                 worksheet4.column_dimensions['B'].width = 30
                 worksheet4.column_dimensions['C'].width = 15
+            tracer.stop("export_write_workbook", step, "export")
 
+            metrics.inc("jobs", job="excel_export", status="done")
+            metrics.observe("job_seconds", time.perf_counter() - started, job="excel_export")
+            tracer.stop("excel_export", started, "export", path=file_path)
             return True
-        except Exception as e:
-            print(f"导出错误: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("导出错误: %s", file_path)
+            metrics.inc("jobs", job="excel_export", status="failed")
             return False
 
     def _create_paired_data(self, records: List[TimeRecord]) -> List[Dict[str, Any]]:
@@ -0,0 +1,133 @@
+"""Byte-bounded LRU cache of files derived from source videos."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Dict, Optional
+
+
+INDEX_FILENAME = "index.json"
+
+
+class FileCache:
+    """Shared bookkeeping for caches that keep one local file per source video.
+
+    Entries live in ``index.json`` under ``root`` keyed by a hash of the
+    source's absolute path, and are validated against the source file's size
+    and modification time, so a replaced video is derived again. Subclasses
+    add their own checks in :meth:`_entry_valid` and register finished files
+    with :meth:`_store`; the least recently used entries are evicted once the
+    total exceeds ``max_bytes``.
+    """
+
+    def __init__(self, root: str, max_bytes: int):
+        self.root = Path(root)
+        self.max_bytes = max(0, int(max_bytes))
+        self._lock = threading.Lock()
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._index: Dict[str, dict] = self._load_index()
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            return sum(int(entry["bytes"]) for entry in self._index.values())
+
+    def _lookup(self, source_path: str) -> Optional[dict]:
+        """Return a copy of the valid entry for ``source_path`` and mark it used.
+
+        Invalid entries are removed together with their files.
+        """
+        key = self._key(source_path)
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return None
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                return None
+            local_path = self.root / entry["local_name"]
+            valid = (
+                entry["size"] == stat.st_size
+                and entry["mtime_ns"] == stat.st_mtime_ns
+                and local_path.is_file()
+                and self._entry_valid(entry, local_path, stat)
+            )
+            if not valid:
+                self._remove_entry(key)
+                self._save_index()
+                return None
+            entry["last_used"] = time.time()
+            self._save_index()
+            return dict(entry)
+
+    def _entry_valid(self, entry: dict, local_path: Path, stat: os.stat_result) -> bool:
+        return True
+
+    def _discard(self, source_path: str, incoming_bytes: int = 0):
+        """Drop the entry of ``source_path`` and make room for ``incoming_bytes``."""
+        with self._lock:
+            self._remove_entry(self._key(source_path))
+            if incoming_bytes:
+                self._evict_for(incoming_bytes)
+            self._save_index()
+
+    def _store(self, source_path: str, stat: os.stat_result, local_name: str, **fields) -> Path:
+        """Register the finished file ``local_name`` for ``source_path``."""
+        key = self._key(source_path)
+        local_path = self.root / local_name
+        with self._lock:
+            self._index[key] = {
+                "source": os.path.abspath(source_path),
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                **fields,
+                "local_name": local_name,
+                "bytes": local_path.stat().st_size,
+                "last_used": time.time(),
+            }
+            self._evict_for(0, keep=key)
+            self._save_index()
+        return local_path
+
+    def _evict_for(self, incoming_bytes: int, keep: Optional[str] = None):
+        total = sum(int(entry["bytes"]) for entry in self._index.values())
+        for key, entry in sorted(self._index.items(), key=lambda item: item[1]["last_used"]):
+            if total + incoming_bytes <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            total -= int(entry["bytes"])
+            self._remove_entry(key)
+
+    def _remove_entry(self, key: str):
+        entry = self._index.pop(key, None)
+        if entry is None:
+            return
+        try:
+            (self.root / entry["local_name"]).unlink()
+        except OSError:
+            pass
+
+    def _load_index(self) -> Dict[str, dict]:
+        try:
+            with (self.root / INDEX_FILENAME).open("r", encoding="utf-8") as file:
+                payload = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        return {key: dict(entry) for key, entry in payload.get("entries", {}).items()}
+
+    def _save_index(self):
+        target = self.root / INDEX_FILENAME
+        temp_path = target.with_name(INDEX_FILENAME + ".tmp")
+        with temp_path.open("w", encoding="utf-8") as file:
+            json.dump({"entries": self._index}, file, ensure_ascii=False, indent=2)
+        os.replace(temp_path, target)
+
+    @staticmethod
+    def _key(source_path: str) -> str:
+        return hashlib.sha1(os.path.abspath(source_path).encode("utf-8")).hexdigest()
@@ -0,0 +1,61 @@
+"""Memory-bounded cache of decoded frames around the playhead."""
+from __future__ import annotations
+
+from typing import Dict, Optional
+
+import numpy as np
+
+from utils.metrics import get_metrics
+
+
+class FrameCache:
+    """Decoded BGR frames keyed by source frame index.
+
+    The cache is bounded in bytes rather than entries. When it is full, the
+    frame furthest from the playhead is evicted first, so the cache keeps a
+    window around the playhead instead of a plain LRU history. The playhead
+    is the frame last requested with :meth:`get` or set with
+    :meth:`set_playhead`, which playback calls as it stores each frame. Frames are stored before any virtual crop is applied, so split
+    sessions of one video share entries. Intended for use from one thread.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max(0, int(max_bytes))
+        self.total_bytes = 0
+        self._frames: Dict[int, np.ndarray] = {}
+        self._playhead = 0
+
+    def __contains__(self, frame: int) -> bool:
+        return int(frame) in self._frames
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def get(self, frame: int) -> Optional[np.ndarray]:
+        frame = int(frame)
+        self._playhead = frame
+        image = self._frames.get(frame)
+        get_metrics().inc("cache_requests", cache="frame", result="miss" if image is None else "hit")
+        return image
+
+    def set_playhead(self, frame: int):
+        """Centre the eviction window on ``frame`` without counting a lookup."""
+        self._playhead = int(frame)
+
+    def put(self, frame: int, image: np.ndarray):
+        """Store ``image`` for ``frame``; the caller must not modify it afterwards."""
+        frame = int(frame)
+        if image.nbytes > self.max_bytes:
+            return
+        previous = self._frames.pop(frame, None)
+        if previous is not None:
+            self.total_bytes -= previous.nbytes
+        self._frames[frame] = image
+        self.total_bytes += image.nbytes
+        while self.total_bytes > self.max_bytes:
+            furthest = max(self._frames, key=lambda key: abs(key - self._playhead))
+            self.total_bytes -= self._frames.pop(furthest).nbytes
+
+    def clear(self):
+        self._frames.clear()
+        self.total_bytes = 0
@@ -1,11 +1,17 @@
 """OpenCV-based freezing detection service."""
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+import threading
+import time
 from typing import Callable, List, Optional, Sequence, Tuple
 
 import cv2
 import numpy as np
 
+from services.media_index import MediaIndex, seek_capture
+from services.segmented_capture import open_video_capture
 from services.video_crop_service import apply_horizontal_crop
+from utils.tracing import get_tracer
 
 
 @dataclass(frozen=True)
@@ -22,6 +28,10 @@ class FreezingDetectionParams:
     smoothing_window: float = 0.3
 
 
+class DetectionCancelledError(RuntimeError):
+    """Raised when a detection run is stopped by its ``should_continue`` hook."""
+
+
 @dataclass(frozen=True)
 class FreezingInterval:
     """Detected freezing interval in video time."""
@@ -36,6 +46,16 @@ class FreezingInterval:
 class FreezingDetectionService:
     """Detect likely freezing intervals from fixed-camera mouse videos."""
 
+    def __init__(self, stage_observer: Optional[Callable[[str, float], None]] = None):
+        """Create a detection service.
+
+        Args:
+            stage_observer: Optional callback receiving ``(stage, seconds)`` for
+                each ``decode``, ``skip``, ``preprocess``, ``motion`` and
+                ``postprocess`` step. Used by benchmarks and instrumentation.
+        """
+        self.stage_observer = stage_observer
+
     def detect_freezing(
         self,
         video_path: str,
@@ -45,6 +65,9 @@ class FreezingDetectionService:
         progress_callback: Optional[Callable[[float], None]] = None,
         crop_role: Optional[str] = None,
         split_ratio: Optional[float] = None,
+        should_continue: Optional[Callable[[], bool]] = None,
+        workers: int = 1,
+        media_index: Optional[MediaIndex] = None,
     ) -> List[FreezingInterval]:
         """Detect freezing intervals from a video file.
 
@@ -54,12 +77,27 @@ class FreezingDetectionService:
             total_frames: Total frame count from the loaded video model.
             params: Optional detection parameters.
             progress_callback: Optional callback receiving progress in [0, 1].
+            should_continue: Optional hook called between samples. It may block
+                to pause the run and returns ``False`` to cancel it.
+            workers: Number of decoder threads. With a keyframe index, values
+                above one split the sampled frames into contiguous ranges,
+                each decoded by its own capture, and results are identical to
+                a single-threaded run. Without one the video is read
+                sequentially, because range starts would rely on inexact
+                frame-number seeks.
+            media_index: Optional index of the video. Parallel ranges seek
+                through the nearest keyframe to the exact frame.
 
         Returns:
             Detected freezing intervals sorted by start time.
+
+        Raises:
+            DetectionCancelledError: ``should_continue`` returned ``False``.
         """
         params = params or FreezingDetectionParams()
-        capture = cv2.VideoCapture(video_path)
+        tracer = get_tracer()
+        trace_started = tracer.start()
+        capture = open_video_capture(video_path)
         if not capture.isOpened():
             raise ValueError(f"无法打开视频文件: {video_path}")
 
@@ -73,56 +111,211 @@ class FreezingDetectionService:
             )
             sample_step = max(1, int(round(video_fps / max(params.sample_rate, 0.1))))
             sample_period = sample_step / video_fps
-
-            times: List[float] = []
-            motion_values: List[float] = []
-            previous_frame: Optional[np.ndarray] = None
-            frame_index = 0
-
-            while True:
-                ret, frame = capture.read()
-                if not ret:
-                    break
-
-                frame = apply_horizontal_crop(frame, crop_role, split_ratio)
-                processed_frame = self._preprocess_frame(frame, params)
-                if previous_frame is None:
-                    motion_ratio = 0.0
-                else:
-                    motion_ratio = self._calculate_motion_ratio(
-                        previous_frame, processed_frame, params
-                    )
-
-                times.append(frame_index / video_fps)
-                motion_values.append(motion_ratio)
-                previous_frame = processed_frame
-
-                if progress_callback and frame_count > 0:
-                    progress_callback(min(frame_index / max(frame_count - 1, 1), 1.0))
-
-                skipped = 0
-                while skipped < sample_step - 1:
-                    if not capture.grab():
-                        frame_index += skipped + 1
-                        break
-                    skipped += 1
-
-                if skipped < sample_step - 1:
-                    break
-
-                frame_index += sample_step
+            sample_count = (frame_count + sample_step - 1) // sample_step if frame_count > 0 else 0
+
+            exact_seeks = media_index is not None and bool(media_index.keyframes)
+            if workers > 1 and exact_seeks and sample_count >= workers * 2:
+                capture.release()
+                times, motion_values = self._analyse_parallel(
+                    video_path,
+                    video_fps,
+                    sample_step,
+                    sample_count,
+                    workers,
+                    params,
+                    progress_callback,
+                    crop_role,
+                    split_ratio,
+                    should_continue,
+                    media_index,
+                )
+            else:
+                def on_sample(frame_index: int):
+                    if progress_callback and frame_count > 0:
+                        progress_callback(min(frame_index / max(frame_count - 1, 1), 1.0))
+                    if should_continue is not None and not should_continue():
+                        raise DetectionCancelledError("检测已取消")
+
+                times, motion_values = self._analyse_samples(
+                    capture,
+                    0,
+                    None,
+                    None,
+                    sample_step,
+                    video_fps,
+                    params,
+                    crop_role,
+                    split_ratio,
+                    on_sample,
+                )
 
             if progress_callback:
                 progress_callback(1.0)
 
+            started = time.perf_counter()
             smoothed_motion = self._smooth_motion(
                 motion_values, sample_step, video_fps, params
             )
-            return self._motion_to_intervals(
+            intervals = self._motion_to_intervals(
                 times, smoothed_motion, video_fps, frame_count, sample_period, params
             )
+            self._observe("postprocess", started)
+            return intervals
         finally:
             capture.release()
+            tracer.stop("detect_freezing", trace_started, "detection", video=video_path, workers=workers)
+
+    def _analyse_parallel(
+        self,
+        video_path: str,
+        video_fps: float,
+        sample_step: int,
+        sample_count: int,
+        workers: int,
+        params: FreezingDetectionParams,
+        progress_callback: Optional[Callable[[float], None]],
+        crop_role: Optional[str],
+        split_ratio: Optional[float],
+        should_continue: Optional[Callable[[], bool]],
+        media_index: Optional[MediaIndex] = None,
+    ) -> Tuple[List[float], List[float]]:
+        chunk_size = (sample_count + workers - 1) // workers
+        # The last range reads to end of stream, like the single-threaded path,
+        # in case the container under-reports its frame count.
+        ranges: List[Tuple[int, Optional[int]]] = [
+            (first, chunk_size) for first in range(0, sample_count, chunk_size)
+        ]
+        ranges[-1] = (ranges[-1][0], None)
+        done_lock = threading.Lock()
+        done = [0]
+
+        def on_sample(_frame_index: int):
+            if progress_callback:
+                with done_lock:
+                    done[0] += 1
+                    completed = done[0]
+                progress_callback(min(completed / sample_count, 1.0))
+            if should_continue is not None and not should_continue():
+                raise DetectionCancelledError("检测已取消")
+
+        def analyse_range(first_sample: int, limit: Optional[int]) -> Tuple[List[float], List[float]]:
+            trace_started = get_tracer().start()
+            capture = open_video_capture(video_path)
+            if not capture.isOpened():
+                raise ValueError(f"无法打开视频文件: {video_path}")
+            try:
+                baseline = None
+                if first_sample > 0:
+                    # The first motion value of a range needs the previous sample.
+                    seek_capture(capture, (first_sample - 1) * sample_step, media_index)
+                    ret, frame = capture.read()
+                    if not ret:
+                        return [], []
+                    frame = apply_horizontal_crop(frame, crop_role, split_ratio)
+                    baseline = self._preprocess_frame(frame, params)
+                    # Step forward to the range's first sample instead of seeking
+                    # again, which would decode the same GOP a second time.
+                    for _ in range(sample_step - 1):
+                        if not capture.grab():
+                            return [], []
+                return self._analyse_samples(
+                    capture,
+                    first_sample * sample_step,
+                    limit,
+                    baseline,
+                    sample_step,
+                    video_fps,
+                    params,
+                    crop_role,
+                    split_ratio,
+                    on_sample,
+                )
+            finally:
+                capture.release()
+                get_tracer().stop("analyse_range", trace_started, "detection", first_sample=first_sample)
+
+        times: List[float] = []
+        motion_values: List[float] = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(analyse_range, first, limit) for first, limit in ranges]
+            for (_first, limit), future in zip(ranges, futures):
+                range_times, range_motion = future.result()
+                times.extend(range_times)
+                motion_values.extend(range_motion)
+                if limit is not None and len(range_times) < limit:
+                    # End of stream came earlier than the reported frame count.
+                    break
+        return times, motion_values
+
+    def _analyse_samples(
+        self,
+        capture,
+        first_frame: int,
+        sample_limit: Optional[int],
+        previous_frame: Optional[np.ndarray],
+        sample_step: int,
+        video_fps: float,
+        params: FreezingDetectionParams,
+        crop_role: Optional[str],
+        split_ratio: Optional[float],
+        on_sample: Callable[[int], None],
+    ) -> Tuple[List[float], List[float]]:
+        times: List[float] = []
+        motion_values: List[float] = []
+        frame_index = first_frame
+
+        while sample_limit is None or len(times) < sample_limit:
+            started = time.perf_counter()
+            ret, frame = capture.read()
+            self._observe("decode", started)
+            if not ret:
+                break
+
+            started = time.perf_counter()
+            frame = apply_horizontal_crop(frame, crop_role, split_ratio)
+            processed_frame = self._preprocess_frame(frame, params)
+            self._observe("preprocess", started)
+            if previous_frame is None:
+                motion_ratio = 0.0
+            else:
+                started = time.perf_counter()
+                motion_ratio = self._calculate_motion_ratio(
+                    previous_frame, processed_frame, params
+                )
+                self._observe("motion", started)
+
+            times.append(frame_index / video_fps)
+            motion_values.append(motion_ratio)
+            previous_frame = processed_frame
+            on_sample(frame_index)
+
+            if sample_limit is not None and len(times) >= sample_limit:
+                break
+
+            started = time.perf_counter()
+            skipped = 0
+            while skipped < sample_step - 1:
+                if not capture.grab():
+                    frame_index += skipped + 1
+                    break
+                skipped += 1
+            self._observe("skip", started)
+
+            if skipped < sample_step - 1:
+                break
+
+            frame_index += sample_step
+
+        return times, motion_values
+
+    def _observe(self, stage: str, started: float):
+        tracer = get_tracer()
+        if self.stage_observer is None and not tracer.enabled:
+            return
+        ended = time.perf_counter()
+        if self.stage_observer is not None:
+            self.stage_observer(stage, ended - started)
+        tracer.complete(stage, started, ended, "detection")
 
     def _preprocess_frame(
         self, frame: np.ndarray, params: FreezingDetectionParams
@@ -0,0 +1,334 @@
+"""Persistent per-video index of keyframes, timestamps and the true frame count."""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from functools import cached_property
+import os
+import struct
+from typing import Callable, List, Optional
+import zlib
+
+import cv2
+import numpy as np
+
+
+INDEX_SUFFIX = ".vtidx"
+INDEX_MAGIC = b"VTIDX\x00\x00\x01"
+INDEX_VERSION = 1
+# magic, version, frame count, keyframe count, source size, source mtime_ns
+_HEADER = struct.Struct("<8sIIIqq")
+# Relative frame-duration spread above which a file is treated as variable frame rate.
+VFR_TOLERANCE = 0.01
+
+
+class MediaIndexCancelledError(RuntimeError):
+    """Raised when a scan is stopped by its ``should_continue`` hook."""
+
+
+@dataclass
+class MediaIndex:
+    """Keyframe positions and presentation times of every frame in a video.
+
+    ``pts`` holds one presentation time in seconds per frame, in display
+    order and relative to the first frame. ``keyframes`` lists the frame
+    numbers a decoder can start from; it is empty when the scan could not
+    tell keyframes apart.
+    """
+
+    frame_count: int
+    pts: np.ndarray
+    keyframes: List[int] = field(default_factory=list)
+    source_size: int = 0
+    source_mtime_ns: int = 0
+
+    @property
+    def frame_duration(self) -> float:
+        if self.frame_count < 2:
+            return 0.0
+        return float(np.median(np.diff(self.pts)))
+
+    @property
+    def average_fps(self) -> float:
+        if self.frame_count < 2 or self.pts[-1] <= 0:
+            return 0.0
+        return (self.frame_count - 1) / float(self.pts[-1])
+
+    @cached_property
+    def is_variable_frame_rate(self) -> bool:
+        # Cached: seek_capture asks on every seek and the scan covers every frame.
+        if self.frame_count < 3:
+            return False
+        durations = np.diff(self.pts)
+        median = float(np.median(durations))
+        return median > 0 and float(np.abs(durations - median).max()) > median * VFR_TOLERANCE
+
+    def keyframe_at_or_before(self, frame: int) -> Optional[int]:
+        position = bisect_right(self.keyframes, int(frame))
+        return self.keyframes[position - 1] if position else None
+
+    def first_keyframe_in(self, start: int, end: int) -> Optional[int]:
+        """Return the first keyframe in ``[start, end]``, if any."""
+        position = bisect_left(self.keyframes, int(start))
+        if position < len(self.keyframes) and self.keyframes[position] <= end:
+            return self.keyframes[position]
+        return None
+
+    def frame_times(self) -> List[float]:
+        """Start time of every frame plus the end time of the last one."""
+        if self.frame_count == 0:
+            return [0.0]
+        return [float(value) for value in self.pts] + [float(self.pts[-1]) + self.frame_duration]
+
+    def matches(self, video_path: str) -> bool:
+        """True when ``video_path`` is the exact file this index was built from."""
+        try:
+            stat = os.stat(video_path)
+        except OSError:
+            return False
+        return stat.st_size == self.source_size and stat.st_mtime_ns == self.source_mtime_ns
+
+
+def index_path_for(video_path: str) -> str:
+    return video_path + INDEX_SUFFIX
+
+
+def save_media_index(index: MediaIndex, video_path: str) -> str:
+    """Write ``index`` beside ``video_path`` and return the index path.
+
+    Raises:
+        OSError: The index file could not be written.
+    """
+    target = index_path_for(video_path)
+    payload = (
+        np.asarray(index.keyframes, dtype="<u4").tobytes()
+        + np.asarray(index.pts, dtype="<f8").tobytes()
+    )
+    header = _HEADER.pack(
+        INDEX_MAGIC,
+        INDEX_VERSION,
+        index.frame_count,
+        len(index.keyframes),
+        index.source_size,
+        index.source_mtime_ns,
+    )
+    temp_path = target + ".tmp"
+    with open(temp_path, "wb") as file:
+        file.write(header)
+        file.write(zlib.compress(payload, 6))
+    os.replace(temp_path, target)
+    return target
+
+
+def load_media_index(video_path: str) -> Optional[MediaIndex]:
+    """Return the saved index for ``video_path``, or ``None`` if missing or stale."""
+    try:
+        with open(index_path_for(video_path), "rb") as file:
+            data = file.read()
+    except OSError:
+        return None
+    if len(data) < _HEADER.size:
+        return None
+    magic, version, frame_count, keyframe_count, size, mtime_ns = _HEADER.unpack_from(data)
+    if magic != INDEX_MAGIC or version != INDEX_VERSION:
+        return None
+    try:
+        payload = zlib.decompress(data[_HEADER.size:])
+    except zlib.error:
+        return None
+    if len(payload) != keyframe_count * 4 + frame_count * 8:
+        return None
+    keyframes = np.frombuffer(payload, dtype="<u4", count=keyframe_count)
+    pts = np.frombuffer(payload, dtype="<f8", count=frame_count, offset=keyframe_count * 4)
+    index = MediaIndex(
+        frame_count=frame_count,
+        pts=pts.astype(np.float64),
+        keyframes=[int(value) for value in keyframes],
+        source_size=size,
+        source_mtime_ns=mtime_ns,
+    )
+    return index if index.matches(video_path) else None
+
+
+def pyav_available() -> bool:
+    """True when PyAV can be imported for a demux-only scan."""
+    try:
+        import av  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def scan_media_index(
+    video_path: str,
+    progress_callback: Optional[Callable[[float], None]] = None,
+    should_continue: Optional[Callable[[], bool]] = None,
+    allow_decode: bool = False,
+) -> MediaIndex:
+    """Scan ``video_path`` once and return its index.
+
+    With PyAV installed the scan only demuxes packets, so no pixels are
+    decoded and keyframes are known. Without it the scan needs
+    ``allow_decode``: OpenCV ``grab()`` then decodes every frame, which is
+    much slower and leaves ``keyframes`` empty, but still yields the exact
+    frame count and per-frame timestamps.
+
+    Raises:
+        MediaIndexCancelledError: ``should_continue`` returned ``False``.
+        ValueError: The video could not be opened, or PyAV is missing and
+            ``allow_decode`` is false.
+    """
+    stat = os.stat(video_path)
+    try:
+        import av
+    except ImportError:
+        if not allow_decode:
+            raise ValueError("未安装 PyAV，无法只解复用扫描索引")
+        pts, keyframes = _scan_with_opencv(video_path, progress_callback, should_continue)
+    else:
+        pts, keyframes = _scan_with_pyav(av, video_path, progress_callback, should_continue)
+    if progress_callback:
+        progress_callback(1.0)
+    return MediaIndex(
+        frame_count=len(pts),
+        pts=pts,
+        keyframes=keyframes,
+        source_size=stat.st_size,
+        source_mtime_ns=stat.st_mtime_ns,
+    )
+
+
+def _scan_with_pyav(av, video_path, progress_callback, should_continue):
+    try:
+        container = av.open(video_path)
+    except av.error.FFmpegError as exc:
+        raise ValueError(f"无法打开视频文件: {video_path}") from exc
+    with container:
+        stream = container.streams.video[0]
+        time_base = float(stream.time_base)
+        duration = float(container.duration or 0) / 1_000_000
+        packets = []
+        for packet in container.demux(stream):
+            timestamp = packet.pts if packet.pts is not None else packet.dts
+            if timestamp is None:
+                # Flush packets at end of stream carry no data.
+                continue
+            packets.append((timestamp, bool(packet.is_keyframe)))
+            if len(packets) % 500 == 0:
+                _checkpoint(should_continue)
+                if progress_callback and duration > 0:
+                    progress_callback(min(timestamp * time_base / duration, 0.99))
+    # Packets arrive in decode order; frames are numbered in display order.
+    packets.sort()
+    if not packets:
+        return np.zeros(0, dtype=np.float64), []
+    first = packets[0][0]
+    pts = np.array([(timestamp - first) * time_base for timestamp, _key in packets], dtype=np.float64)
+    keyframes = [frame for frame, (_timestamp, key) in enumerate(packets) if key]
+    return pts, keyframes
+
+
+def _scan_with_opencv(video_path, progress_callback, should_continue):
+    capture = cv2.VideoCapture(video_path)
+    if not capture.isOpened():
+        raise ValueError(f"无法打开视频文件: {video_path}")
+    try:
+        expected = max(1, int(capture.get(cv2.CAP_PROP_FRAME_COUNT)))
+        times: List[float] = []
+        while capture.grab():
+            times.append(capture.get(cv2.CAP_PROP_POS_MSEC) / 1000.0)
+            if len(times) % 500 == 0:
+                _checkpoint(should_continue)
+                if progress_callback:
+                    progress_callback(min(len(times) / expected, 0.99))
+    finally:
+        capture.release()
+    pts = np.asarray(times, dtype=np.float64)
+    if len(pts):
+        pts -= pts[0]
+    return pts, []
+
+
+def _checkpoint(should_continue):
+    if should_continue is not None and not should_continue():
+        raise MediaIndexCancelledError("索引扫描已取消")
+
+
+def frame_for_timestamp(
+    seconds: float,
+    fps: float,
+    total_frames: int,
+    index: Optional[MediaIndex] = None,
+) -> int:
+    """Return the frame whose presentation time is nearest to ``seconds``.
+
+    Used to number frames delivered by decoders that report timestamps
+    instead of frame numbers. Picking the nearest frame rather than the last
+    one started absorbs the rounding of millisecond or microsecond clocks.
+    """
+    last_frame = max(0, int(total_frames) - 1)
+    if index is not None and index.frame_count:
+        position = int(np.searchsorted(index.pts, seconds))
+        if position >= index.frame_count:
+            return min(index.frame_count - 1, last_frame)
+        if position > 0 and seconds - index.pts[position - 1] < index.pts[position] - seconds:
+            position -= 1
+        return min(position, last_frame)
+    if fps <= 0:
+        return 0
+    return max(0, min(int(round(seconds * fps)), last_frame))
+
+
+def seek_capture(capture, frame: int, index: Optional[MediaIndex] = None) -> bool:
+    """Position ``capture`` so the next ``read()`` returns ``frame``.
+
+    With keyframes known, the capture seeks to the nearest keyframe at or
+    before ``frame`` and ``grab()``s forward to the exact frame. OpenCV turns
+    a frame-number seek into a timestamp using the average frame rate, which
+    lands on the keyframe only for constant frame rate files. For variable
+    frame rate files the seek goes to the keyframe's presentation time
+    instead, and the timestamp of the frame it lands on is checked against
+    the index (see :func:`_seek_by_timestamp`). Without keyframes it falls
+    back to a plain ``CAP_PROP_POS_FRAMES`` seek.
+    """
+    frame = max(0, int(frame))
+    keyframe = index.keyframe_at_or_before(frame) if index is not None else None
+    if keyframe is None:
+        return capture.set(cv2.CAP_PROP_POS_FRAMES, frame)
+    if index.is_variable_frame_rate:
+        return _seek_by_timestamp(capture, frame, index)
+    if not capture.set(cv2.CAP_PROP_POS_FRAMES, keyframe):
+        return False
+    return _grab_frames(capture, frame - keyframe)
+
+
+def _seek_by_timestamp(capture, frame: int, index: MediaIndex) -> bool:
+    """Seek a variable frame rate file through keyframe timestamps.
+
+    The landing frame has to be grabbed to read its timestamp, so the seek
+    aims at a keyframe strictly before ``frame``. If the demuxer lands on or
+    past ``frame`` anyway, the next earlier keyframe is tried, down to the
+    start of the stream, which is always exact.
+    """
+    keyframe = index.keyframe_at_or_before(frame - 1) if frame > 0 else None
+    while keyframe is not None and keyframe > 0:
+        if not capture.set(cv2.CAP_PROP_POS_MSEC, float(index.pts[keyframe]) * 1000.0):
+            return False
+        if not capture.grab():
+            return False
+        landed = frame_for_timestamp(
+            capture.get(cv2.CAP_PROP_POS_MSEC) / 1000.0, 0.0, index.frame_count, index
+        )
+        if landed < frame:
+            return _grab_frames(capture, frame - landed - 1)
+        keyframe = index.keyframe_at_or_before(keyframe - 1)
+    if not capture.set(cv2.CAP_PROP_POS_FRAMES, 0):
+        return False
+    return _grab_frames(capture, frame)
+
+
+def _grab_frames(capture, count: int) -> bool:
+    for _ in range(count):
+        if not capture.grab():
+            return False
+    return True
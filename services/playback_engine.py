@@ -0,0 +1,537 @@
+"""Decode-ahead playback buffer backed by a dedicated OpenCV capture."""
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+import threading
+import time
+from typing import Callable, Deque, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from services.media_index import MediaIndex, seek_capture
+from services.resource_scheduler import CONTEXT_PREVIEW, get_resource_scheduler
+from services.segmented_capture import open_video_capture
+from utils.perf_stats import get_perf_stats
+
+
+@dataclass
+class PlaybackBufferStats:
+    """Counters exposed for status display and diagnostics."""
+
+    decoded: int = 0
+    skipped: int = 0
+    dropped: int = 0
+    underruns: int = 0
+    flushes: int = 0
+
+
+class DecodeAheadBuffer:
+    """Decode frames ahead of the playhead into a preallocated ring.
+
+    A background thread owns its own capture and decodes sequentially into
+    ``depth`` reusable frame buffers. The GUI thread calls :meth:`pop` from its
+    timer; the slot handed out by one ``pop`` is returned to the decoder on the
+    next call, so the caller must finish with a frame before popping again.
+    :meth:`seek` flushes the ring and restarts decoding at a new frame, and
+    :meth:`set_frame_step` makes the decoder ``grab()`` past frames that will
+    never be shown at high playback speeds.
+    """
+
+    def __init__(
+        self,
+        video_path: str,
+        depth: int = 8,
+        capture_factory: Callable[[str], object] = open_video_capture,
+        media_index: Optional[MediaIndex] = None,
+    ):
+        self.video_path = video_path
+        self.depth = max(2, int(depth))
+        self.media_index = media_index
+        self.stats = PlaybackBufferStats()
+        self._capture_factory = capture_factory
+        self._condition = threading.Condition()
+        self._slots: List[np.ndarray] = []
+        self._free: Deque[int] = deque(range(self.depth))
+        self._ready: Deque[Tuple[int, int]] = deque()
+        self._held_slot: Optional[int] = None
+        self._generation = 0
+        self._start_frame: Optional[int] = None
+        self._frame_step = 1
+        self._end_of_stream = False
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def underruns(self) -> int:
+        return self.stats.underruns
+
+    @property
+    def end_of_stream(self) -> bool:
+        """True once the decoder hit the end and every decoded frame was popped."""
+        with self._condition:
+            return self._end_of_stream and not self._ready
+
+    def seek(self, frame: int):
+        """Flush buffered frames and decode from ``frame`` onwards."""
+        with self._condition:
+            self._generation += 1
+            self._start_frame = max(0, int(frame))
+            self._end_of_stream = False
+            self._recycle_ready()
+            self.stats.flushes += 1
+            self._condition.notify_all()
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run,
+                name="playback-decode-ahead",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def set_frame_step(self, step: int):
+        """Decode every ``step``-th frame from the next decoded frame on."""
+        with self._condition:
+            self._frame_step = max(1, int(step))
+
+    def pop(self) -> Optional[Tuple[int, np.ndarray]]:
+        """Return the next decoded ``(frame_index, frame)`` or ``None`` on underrun."""
+        return self.pop_until(None)
+
+    def pop_until(self, target_frame: Optional[int]) -> Optional[Tuple[int, np.ndarray]]:
+        """Return the newest decoded frame not after ``target_frame``.
+
+        Older ready frames are dropped back into the ring. Returns ``None``
+        when nothing is ready yet (an underrun) or when the oldest ready frame
+        is still ahead of ``target_frame``.
+        """
+        with self._condition:
+            if self._held_slot is not None:
+                self._free.append(self._held_slot)
+                self._held_slot = None
+                self._condition.notify_all()
+            if not self._ready:
+                if not self._end_of_stream:
+                    self.stats.underruns += 1
+                return None
+            if target_frame is not None and self._ready[0][0] > target_frame:
+                return None
+            frame_index, slot = self._ready.popleft()
+            while target_frame is not None and self._ready and self._ready[0][0] <= target_frame:
+                self._free.append(slot)
+                self.stats.dropped += 1
+                frame_index, slot = self._ready.popleft()
+            self._held_slot = slot
+            self._condition.notify_all()
+            return frame_index, self._slots[slot]
+
+    def stop(self):
+        """Stop the decoder thread and release its capture."""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _recycle_ready(self):
+        while self._ready:
+            _frame_index, slot = self._ready.popleft()
+            self._free.append(slot)
+
+    def _run(self):
+        perf = get_perf_stats()
+        capture = self._capture_factory(self.video_path)
+        try:
+            if not capture.isOpened():
+                with self._condition:
+                    self._end_of_stream = True
+                return
+            next_frame = 0
+            generation = -1
+            skip = 0
+            while True:
+                with self._condition:
+                    while not self._stopping and (
+                        not self._free
+                        or (self._end_of_stream and self._start_frame is None)
+                    ):
+                        self._condition.wait()
+                    if self._stopping:
+                        return
+                    if self._start_frame is not None:
+                        next_frame = self._start_frame
+                        self._start_frame = None
+                        generation = self._generation
+                        seek_to: Optional[int] = next_frame
+                        skip = 0
+                    else:
+                        seek_to = None
+                    slot = self._free.popleft()
+                    step = self._frame_step
+
+                ok = True
+                if seek_to is not None:
+                    ok = seek_capture(capture, seek_to, self.media_index)
+                skipped = 0
+                while ok and skipped < skip:
+                    # grab() demuxes and decodes without the colour conversion.
+                    ok = capture.grab()
+                    skipped += 1
+                started = perf.start()
+                ok = ok and self._decode_into(capture, slot)
+                perf.stop("decode", started)
+
+                with self._condition:
+                    if generation != self._generation:
+                        self._free.append(slot)
+                        continue
+                    if not ok:
+                        self._free.append(slot)
+                        self._end_of_stream = True
+                        self._condition.notify_all()
+                        continue
+                    next_frame += skip
+                    self._ready.append((next_frame, slot))
+                    self.stats.decoded += 1
+                    self.stats.skipped += skip
+                    next_frame += 1
+                    skip = step - 1
+                    self._condition.notify_all()
+        finally:
+            capture.release()
+
+    def _decode_into(self, capture, slot: int) -> bool:
+        if not self._slots:
+            ok, frame = capture.read()
+            if not ok:
+                return False
+            # Allocate the whole ring once the frame shape is known.
+            self._slots = [np.empty_like(frame) for _ in range(self.depth)]
+            self._slots[slot][...] = frame
+            return True
+        ok, frame = capture.read(self._slots[slot])
+        if ok and frame is not self._slots[slot]:
+            # Resolution changed mid-stream; adopt the new buffer.
+            self._slots[slot] = frame
+        return ok
+
+
+class ReverseDecodeBuffer:
+    """Decode chunks forward and hand their frames out in reverse.
+
+    Going back one frame with a plain seek decodes from the preceding
+    keyframe every time. Here each chunk ending at the playhead is decoded
+    once, sequentially, and presented last frame first. While one chunk is
+    being shown the thread decodes the chunk before it, so at most two chunks
+    are held in memory. Without a media index chunks are ``chunk_frames``
+    long. With one, each chunk is the whole GOP from the keyframe at or
+    before its last frame, so every GOP is decoded exactly once; GOPs longer
+    than ``max_chunk_frames`` are split, trading repeated prefix decodes for
+    bounded memory.
+    """
+
+    def __init__(
+        self,
+        video_path: str,
+        chunk_frames: int = 30,
+        capture_factory: Callable[[str], object] = open_video_capture,
+        media_index: Optional[MediaIndex] = None,
+        max_chunk_frames: int = 300,
+    ):
+        self.video_path = video_path
+        self.chunk_frames = max(1, int(chunk_frames))
+        self.max_chunk_frames = max(self.chunk_frames, int(max_chunk_frames))
+        self.media_index = media_index
+        self.stats = PlaybackBufferStats()
+        self._capture_factory = capture_factory
+        self._condition = threading.Condition()
+        self._ready: Deque[Tuple[int, np.ndarray]] = deque()
+        self._generation = 0
+        self._start_frame: Optional[int] = None
+        self._end_of_stream = False
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def underruns(self) -> int:
+        return self.stats.underruns
+
+    @property
+    def end_of_stream(self) -> bool:
+        """True once frame 0 was decoded and every decoded frame was popped."""
+        with self._condition:
+            return self._end_of_stream and not self._ready
+
+    def seek(self, frame: int):
+        """Flush buffered frames and present backwards starting at ``frame``."""
+        with self._condition:
+            self._generation += 1
+            self._start_frame = int(frame)
+            self._end_of_stream = frame < 0
+            self._ready.clear()
+            self.stats.flushes += 1
+            self._condition.notify_all()
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run,
+                name="playback-reverse-decode",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def pop(self) -> Optional[Tuple[int, np.ndarray]]:
+        """Return the next ``(frame_index, frame)`` going backwards, or ``None``."""
+        return self.pop_until(None)
+
+    def pop_until(self, target_frame: Optional[int]) -> Optional[Tuple[int, np.ndarray]]:
+        """Return the oldest decoded frame not before ``target_frame``.
+
+        Frames between the playhead and the target are dropped. Returns
+        ``None`` on underrun or while the next frame is still ahead of the
+        target in presentation order.
+        """
+        with self._condition:
+            if not self._ready:
+                if not self._end_of_stream:
+                    self.stats.underruns += 1
+                return None
+            if target_frame is not None and self._ready[0][0] < target_frame:
+                return None
+            item = self._ready.popleft()
+            while target_frame is not None and self._ready and self._ready[0][0] >= target_frame:
+                self.stats.dropped += 1
+                item = self._ready.popleft()
+            self._condition.notify_all()
+            return item
+
+    def stop(self):
+        """Stop the decoder thread and release its capture."""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        capture = self._capture_factory(self.video_path)
+        try:
+            if not capture.isOpened():
+                with self._condition:
+                    self._end_of_stream = True
+                return
+            chunk_end = -1
+            chunk_length = self.chunk_frames
+            generation = -1
+            while True:
+                with self._condition:
+                    # Keep the chunk being shown plus one prefetched chunk.
+                    while (
+                        not self._stopping
+                        and self._start_frame is None
+                        and (chunk_end < 0 or len(self._ready) >= chunk_length)
+                    ):
+                        self._condition.wait()
+                    if self._stopping:
+                        return
+                    if self._start_frame is not None:
+                        chunk_end = self._start_frame
+                        self._start_frame = None
+                        generation = self._generation
+                        if chunk_end < 0:
+                            continue
+                chunk_start = self._chunk_start(chunk_end)
+                frames = self._decode_chunk(capture, chunk_start, chunk_end, generation)
+
+                with self._condition:
+                    if generation != self._generation:
+                        continue
+                    self._ready.extend(reversed(frames))
+                    self.stats.decoded += len(frames)
+                    chunk_length = max(1, len(frames))
+                    chunk_end = chunk_start - 1
+                    if chunk_end < 0:
+                        self._end_of_stream = True
+                    self._condition.notify_all()
+        finally:
+            capture.release()
+
+    def _chunk_start(self, chunk_end: int) -> int:
+        keyframe = (
+            self.media_index.keyframe_at_or_before(chunk_end)
+            if self.media_index is not None
+            else None
+        )
+        if keyframe is None:
+            return max(0, chunk_end - self.chunk_frames + 1)
+        return max(keyframe, chunk_end - self.max_chunk_frames + 1)
+
+    def _decode_chunk(self, capture, start: int, end: int, generation: int) -> List[Tuple[int, np.ndarray]]:
+        if not seek_capture(capture, start, self.media_index):
+            return []
+        frames: List[Tuple[int, np.ndarray]] = []
+        for index in range(start, end + 1):
+            if self._stopping or generation != self._generation:
+                break
+            ok, frame = capture.read()
+            if not ok:
+                break
+            frames.append((index, frame))
+        return frames
+
+
+@dataclass
+class ScrubStats:
+    """Counters for the scrub pipeline."""
+
+    requested: int = 0
+    decoded: int = 0
+    superseded: int = 0
+
+
+class ScrubDecoder:
+    """Latest-wins background decoder for interactive scrubbing.
+
+    :meth:`request` replaces any request the thread has not started yet, so
+    a fast drag never builds a queue; :meth:`take` returns the newest
+    finished frame. With keyframes known the thread decodes only the
+    keyframe at or before the requested frame, which keeps up with the
+    cursor on long-GOP files; the caller decodes the exact frame once the
+    drag ends. :meth:`cancel` discards pending and finished work.
+    """
+
+    def __init__(
+        self,
+        video_path: str,
+        capture_factory: Callable[[str], object] = open_video_capture,
+        media_index: Optional[MediaIndex] = None,
+    ):
+        self.video_path = video_path
+        self.media_index = media_index
+        self.stats = ScrubStats()
+        self._capture_factory = capture_factory
+        self._condition = threading.Condition()
+        self._pending: Optional[int] = None
+        self._result: Optional[Tuple[int, int, np.ndarray]] = None
+        self._generation = 0
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+    def request(self, frame: int):
+        with self._condition:
+            if self._pending is not None:
+                self.stats.superseded += 1
+            self._pending = max(0, int(frame))
+            self.stats.requested += 1
+            self._condition.notify_all()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="scrub-decode", daemon=True)
+            self._thread.start()
+
+    def take(self) -> Optional[Tuple[int, int, np.ndarray]]:
+        """Return ``(requested_frame, decoded_frame, image)`` once, or ``None``."""
+        with self._condition:
+            result, self._result = self._result, None
+            return result
+
+    def cancel(self):
+        with self._condition:
+            self._generation += 1
+            self._pending = None
+            self._result = None
+
+    def stop(self):
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        capture = self._capture_factory(self.video_path)
+        scheduler = get_resource_scheduler()
+        try:
+            while True:
+                with self._condition:
+                    while not self._stopping and self._pending is None:
+                        self._condition.wait()
+                    if self._stopping:
+                        return
+                    requested, self._pending = self._pending, None
+                    generation = self._generation
+                decoded = requested
+                keyframe = (
+                    self.media_index.keyframe_at_or_before(requested)
+                    if self.media_index is not None
+                    else None
+                )
+                if keyframe is not None:
+                    decoded = keyframe
+                with scheduler.foreground(CONTEXT_PREVIEW):
+                    capture.set(cv2.CAP_PROP_POS_FRAMES, decoded)
+                    ok, image = capture.read()
+                if not ok:
+                    continue
+                with self._condition:
+                    self.stats.decoded += 1
+                    if generation == self._generation:
+                        self._result = (requested, decoded, image)
+        finally:
+            capture.release()
+
+
+class PlaybackClock:
+    """Map wall-clock time to the frame that should be on screen.
+
+    Playback position is derived from a monotonic clock rather than from
+    counting timer ticks, so late ticks skip ahead instead of slowing the
+    video down. The clock also tracks achieved presentation rate and the
+    number of frames that were never shown.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic, window: int = 60):
+        self._clock = clock
+        self._window: Deque[float] = deque(maxlen=max(2, int(window)))
+        self.frames_per_second = 0.0
+        self.origin_frame = 0
+        self.origin_time = 0.0
+        self.last_frame = 0
+        self.presented_frames = 0
+        self.dropped_frames = 0
+
+    def start(self, frame: int, frames_per_second: float):
+        """Start timing from ``frame`` (already on screen) and reset statistics."""
+        self.presented_frames = 0
+        self.dropped_frames = 0
+        self._window.clear()
+        self.rebase(frame, frames_per_second)
+
+    def rebase(self, frame: int, frames_per_second: Optional[float] = None):
+        """Restart the timeline at ``frame`` after a seek or speed change."""
+        if frames_per_second is not None:
+            self.frames_per_second = float(frames_per_second)
+        self.origin_frame = int(frame)
+        self.origin_time = self._clock()
+        self.last_frame = int(frame)
+
+    def target_frame(self) -> int:
+        """Frame due now; a negative rate counts backwards for reverse playback."""
+        elapsed = max(0.0, self._clock() - self.origin_time)
+        return self.origin_frame + int(elapsed * self.frames_per_second)
+
+    def presented(self, frame: int):
+        """Record that ``frame`` was shown; frames jumped over count as dropped."""
+        self.dropped_frames += max(0, abs(int(frame) - self.last_frame) - 1)
+        self.last_frame = int(frame)
+        self.presented_frames += 1
+        self._window.append(self._clock())
+
+    @property
+    def achieved_fps(self) -> float:
+        if len(self._window) < 2:
+            return 0.0
+        span = self._window[-1] - self._window[0]
+        return (len(self._window) - 1) / span if span > 0 else 0.0
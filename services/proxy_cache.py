@@ -0,0 +1,136 @@
+"""Low-resolution all-intra proxies of videos for scrubbing and previews."""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Callable, Optional
+
+import cv2
+
+from services.file_cache import FileCache
+
+
+PROXY_SUFFIX = ".avi"
+# Motion JPEG: every frame is a keyframe, so frame-number seeks are exact and cheap.
+PROXY_FOURCC = "MJPG"
+
+
+class ProxyCancelledError(RuntimeError):
+    """Raised when a transcode is stopped by its ``should_continue`` hook."""
+
+
+class ProxyCache(FileCache):
+    """Byte-bounded LRU cache of proxy transcodes.
+
+    A proxy holds every frame of the source in order, scaled down to
+    ``height`` pixels, so proxy frame ``n`` is source frame ``n``. Entries are
+    validated by :class:`services.file_cache.FileCache` and against the
+    proxy height, and transcodes are written to a ``.part`` file that is
+    renamed once complete.
+    """
+
+    def __init__(self, root: str, max_bytes: int, height: int = 360):
+        super().__init__(root, max_bytes)
+        self.height = max(16, int(height))
+
+    def proxy_path(self, source_path: str, frame_count: Optional[int] = None) -> Optional[str]:
+        """Return the valid proxy of ``source_path``, or ``None``.
+
+        With ``frame_count`` given, a proxy holding a different number of
+        frames (a source that stopped decoding early, say) is not returned,
+        since its frame numbers would no longer match the source's. The entry
+        is kept so the same transcode is not repeated on every open.
+        """
+        entry = self._lookup(source_path)
+        if entry is None:
+            return None
+        if frame_count is not None and int(entry.get("frame_count", -1)) != int(frame_count):
+            return None
+        return str(self.root / entry["local_name"])
+
+    def build(
+        self,
+        source_path: str,
+        capture_path: Optional[str] = None,
+        progress_callback: Optional[Callable[[float], None]] = None,
+        should_continue: Optional[Callable[[], bool]] = None,
+    ) -> str:
+        """Transcode ``source_path`` into the cache and return the proxy path.
+
+        ``capture_path`` is decoded instead of the source when given, such as a
+        local staging copy; validity is still tied to ``source_path``.
+
+        Raises:
+            ProxyCancelledError: ``should_continue`` returned ``False``.
+            ValueError: The video could not be opened or the proxy not written.
+        """
+        existing = self.proxy_path(source_path)
+        if existing is not None:
+            return existing
+
+        stat = os.stat(source_path)
+        key = self._key(source_path)
+        local_name = f"{key[:16]}{PROXY_SUFFIX}"
+        local_path = self.root / local_name
+        # VideoWriter picks the container from the extension, so keep it last.
+        part_path = local_path.with_name(f"{key[:16]}.part{PROXY_SUFFIX}")
+        self._discard(source_path)
+
+        try:
+            frame_count = self._transcode(capture_path or source_path, str(part_path), progress_callback, should_continue)
+            os.replace(part_path, local_path)
+        except BaseException:
+            try:
+                part_path.unlink()
+            except OSError:
+                pass
+            raise
+
+        return str(self._store(source_path, stat, local_name, height=self.height, frame_count=frame_count))
+
+    def _transcode(self, capture_path, part_path, progress_callback, should_continue) -> int:
+        capture = cv2.VideoCapture(capture_path)
+        if not capture.isOpened():
+            raise ValueError(f"无法打开视频文件: {capture_path}")
+        writer = None
+        frame_count = 0
+        try:
+            fps = capture.get(cv2.CAP_PROP_FPS) or 25.0
+            expected = max(1, int(capture.get(cv2.CAP_PROP_FRAME_COUNT)))
+            while True:
+                ok, frame = capture.read()
+                if not ok:
+                    break
+                if writer is None:
+                    size = self._proxy_size(frame.shape[1], frame.shape[0])
+                    writer = cv2.VideoWriter(part_path, cv2.VideoWriter_fourcc(*PROXY_FOURCC), fps, size)
+                    if not writer.isOpened():
+                        raise ValueError(f"无法写入代理文件: {part_path}")
+                if (frame.shape[1], frame.shape[0]) != size:
+                    frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+                writer.write(frame)
+                frame_count += 1
+                if frame_count % 100 == 0:
+                    if should_continue is not None and not should_continue():
+                        raise ProxyCancelledError("代理文件生成已取消")
+                    if progress_callback:
+                        progress_callback(min(frame_count / expected, 0.99))
+        finally:
+            capture.release()
+            if writer is not None:
+                writer.release()
+        if writer is None:
+            raise ValueError(f"视频没有可读取的帧: {capture_path}")
+        if progress_callback:
+            progress_callback(1.0)
+        return frame_count
+
+    def _proxy_size(self, width: int, height: int):
+        if height <= self.height:
+            return width, height
+        # Codecs want even dimensions.
+        scaled_width = max(2, int(round(width * self.height / height / 2)) * 2)
+        return scaled_width, self.height - self.height % 2
+
+    def _entry_valid(self, entry: dict, local_path: Path, stat: os.stat_result) -> bool:
+        return entry.get("height") == self.height
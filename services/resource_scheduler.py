@@ -0,0 +1,133 @@
+"""Process-wide CPU budget shared by playback, previews and background jobs."""
+from __future__ import annotations
+
+from contextlib import contextmanager
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterator, Optional
+
+import cv2
+
+from utils.config import Config
+
+
+CONTEXT_PLAYBACK = "playback"
+CONTEXT_PREVIEW = "preview"
+CONTEXT_COMPARE = "compare"
+FOREGROUND_CONTEXTS = (CONTEXT_PLAYBACK, CONTEXT_PREVIEW, CONTEXT_COMPARE)
+
+
+def available_cores() -> int:
+    """Cores this process may run on, honouring CPU affinity where supported."""
+    if hasattr(os, "sched_getaffinity"):
+        try:
+            return max(1, len(os.sched_getaffinity(0)))
+        except OSError:
+            pass
+    return max(1, os.cpu_count() or 1)
+
+
+class ResourceScheduler:
+    """Coordinate OpenCV threads and decoder pools on one machine.
+
+    ``cv2.setNumThreads`` is process-wide, so the scheduler keeps the total of
+    background decoder threads plus OpenCV's internal pool within the core
+    budget. Background jobs call :meth:`background_checkpoint` between work
+    items and yield while playback or a hover preview is active.
+    """
+
+    def __init__(
+        self,
+        cores: Optional[int] = None,
+        interactive_reserve: int = 1,
+        yield_seconds: float = 0.005,
+        set_num_threads: Optional[Callable[[int], None]] = None,
+    ):
+        self.cores = max(1, int(cores)) if cores else available_cores()
+        self.interactive_reserve = max(0, int(interactive_reserve))
+        self.yield_seconds = max(0.0, float(yield_seconds))
+        self._set_num_threads = set_num_threads or cv2.setNumThreads
+        self._lock = threading.Lock()
+        self._foreground: Dict[str, int] = {name: 0 for name in FOREGROUND_CONTEXTS}
+        self._background_threads = 0
+        self.opencv_threads = 0
+        self._apply_opencv_threads()
+
+    @property
+    def background_threads(self) -> int:
+        with self._lock:
+            return self._background_threads
+
+    def is_foreground_active(self) -> bool:
+        with self._lock:
+            return any(self._foreground.values())
+
+    def background_pool_size(self, requested: int = 0) -> int:
+        """Threads a new background job may use; ``requested <= 0`` means automatic."""
+        with self._lock:
+            budget = self.cores - self.interactive_reserve - self._background_threads
+        budget = max(1, budget)
+        if requested > 0:
+            return min(int(requested), budget)
+        return budget
+
+    def set_foreground(self, context: str, active: bool):
+        """Mark a long-lived foreground context such as playback on or off."""
+        with self._lock:
+            self._foreground[context] = 1 if active else 0
+
+    @contextmanager
+    def foreground(self, context: str) -> Iterator[None]:
+        """Mark a short foreground operation, e.g. one hover thumbnail decode."""
+        with self._lock:
+            self._foreground[context] = self._foreground.get(context, 0) + 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._foreground[context] = max(0, self._foreground.get(context, 0) - 1)
+
+    @contextmanager
+    def background(self, threads: int = 1) -> Iterator[None]:
+        """Reserve ``threads`` cores for a background job while it runs."""
+        threads = max(1, int(threads))
+        with self._lock:
+            self._background_threads += threads
+        self._apply_opencv_threads()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._background_threads = max(0, self._background_threads - threads)
+            self._apply_opencv_threads()
+
+    def background_checkpoint(self):
+        """Let foreground work run first; called by background jobs between items."""
+        if self.yield_seconds > 0 and self.is_foreground_active():
+            time.sleep(self.yield_seconds)
+
+    def _apply_opencv_threads(self):
+        with self._lock:
+            threads = max(1, self.cores - self._background_threads)
+            changed = threads != self.opencv_threads
+            self.opencv_threads = threads
+        if changed:
+            self._set_num_threads(threads)
+
+
+_scheduler: Optional[ResourceScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_resource_scheduler() -> ResourceScheduler:
+    """Return the shared scheduler, created on first use."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            config = Config()
+            _scheduler = ResourceScheduler(
+                interactive_reserve=int(config.get("cpu_interactive_reserve", 1)),
+                yield_seconds=float(config.get("cpu_background_yield", 0.005)),
+            )
+        return _scheduler
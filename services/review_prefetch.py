@@ -0,0 +1,153 @@
+"""Background decode of whole frame ranges for candidate review."""
+from __future__ import annotations
+
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from services.media_index import MediaIndex, seek_capture
+from services.segmented_capture import open_video_capture
+
+
+class RangePrefetcher:
+    """Decode the frames of a few ranges into memory, scaled for display.
+
+    :meth:`request` names the ranges that should be resident, most important
+    first, such as the candidate under review followed by the next one. A
+    background thread decodes missing frames of each range in order with
+    one seek per contiguous run, and frames outside the requested ranges are
+    dropped. Frames are scaled down to ``size`` so a long candidate fits in
+    ``max_bytes``; once the budget is spent the rest of the plan is skipped.
+    Stored frames are never modified, so :meth:`get` hands them out directly.
+    """
+
+    def __init__(
+        self,
+        video_path: str,
+        max_bytes: int,
+        capture_factory: Callable[[str], object] = open_video_capture,
+        media_index: Optional[MediaIndex] = None,
+    ):
+        self.video_path = video_path
+        self.max_bytes = max(0, int(max_bytes))
+        self.media_index = media_index
+        self.total_bytes = 0
+        self._capture_factory = capture_factory
+        self._condition = threading.Condition()
+        self._frames: Dict[int, np.ndarray] = {}
+        self._ranges: List[Tuple[int, int]] = []
+        self._size: Optional[Tuple[int, int]] = None
+        self._generation = 0
+        self._completed_generation = 0
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def idle(self) -> bool:
+        """True once the latest request has been decoded as far as the budget allows."""
+        with self._condition:
+            return self._completed_generation == self._generation
+
+    def request(self, ranges: Sequence[Tuple[int, int]], size: Optional[Tuple[int, int]] = None):
+        """Keep the inclusive frame ``ranges`` resident, scaled to fit ``size``."""
+        ranges = [(max(0, int(start)), int(end)) for start, end in ranges if end >= start]
+        with self._condition:
+            if size != self._size:
+                self._frames.clear()
+                self.total_bytes = 0
+                self._size = size
+            for frame in [frame for frame in self._frames if not _in_ranges(frame, ranges)]:
+                self.total_bytes -= self._frames.pop(frame).nbytes
+            self._ranges = ranges
+            self._generation += 1
+            self._condition.notify_all()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="review-prefetch", daemon=True)
+            self._thread.start()
+
+    def get(self, frame: int) -> Optional[np.ndarray]:
+        with self._condition:
+            return self._frames.get(int(frame))
+
+    def covers(self, start: int, end: int) -> bool:
+        """True when every frame of the inclusive range is resident."""
+        with self._condition:
+            return all(frame in self._frames for frame in range(int(start), int(end) + 1))
+
+    def stop(self):
+        """Stop the decoder thread, release its capture and drop every frame."""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        with self._condition:
+            self._frames.clear()
+            self.total_bytes = 0
+
+    def _run(self):
+        capture = self._capture_factory(self.video_path)
+        try:
+            if not capture.isOpened():
+                return
+            position: Optional[int] = None
+            while True:
+                with self._condition:
+                    while not self._stopping and self._completed_generation == self._generation:
+                        self._condition.wait()
+                    if self._stopping:
+                        return
+                    generation = self._generation
+                    ranges = list(self._ranges)
+                    size = self._size
+                position = self._decode_plan(capture, ranges, size, generation, position)
+                with self._condition:
+                    if generation == self._generation:
+                        self._completed_generation = generation
+        finally:
+            capture.release()
+
+    def _decode_plan(self, capture, ranges, size, generation, position) -> Optional[int]:
+        for start, end in ranges:
+            for frame_index in range(start, end + 1):
+                with self._condition:
+                    if self._stopping or generation != self._generation:
+                        return position
+                    if frame_index in self._frames:
+                        continue
+                if position != frame_index:
+                    if not seek_capture(capture, frame_index, self.media_index):
+                        return None
+                ok, frame = capture.read()
+                if not ok:
+                    # Past the end of the video; later frames of this range cannot exist.
+                    position = None
+                    break
+                position = frame_index + 1
+                frame = _fit(frame, size)
+                with self._condition:
+                    if generation != self._generation:
+                        return position
+                    if self.total_bytes + frame.nbytes > self.max_bytes:
+                        return position
+                    self._frames[frame_index] = frame
+                    self.total_bytes += frame.nbytes
+        return position
+
+
+def _in_ranges(frame: int, ranges: Sequence[Tuple[int, int]]) -> bool:
+    return any(start <= frame <= end for start, end in ranges)
+
+
+def _fit(frame: np.ndarray, size: Optional[Tuple[int, int]]) -> np.ndarray:
+    if size is None:
+        return frame
+    width, height = size
+    if width >= frame.shape[1] and height >= frame.shape[0]:
+        return frame
+    scale = min(width / frame.shape[1], height / frame.shape[0])
+    target = (max(1, int(round(frame.shape[1] * scale))), max(1, int(round(frame.shape[0] * scale))))
+    return cv2.resize(frame, target, interpolation=cv2.INTER_AREA)
@@ -0,0 +1,450 @@
+"""Consecutive recording segments presented as one virtual video.
+
+DVRs cut one session into files of a few minutes each. A ``.vtseg``
+manifest lists those files in order::
+
+    {"schema_version": 1, "segments": [{"path": "cam1_0000.mp4"}, {"path": "cam1_0010.mp4", "frames": 17982}]}
+
+Relative paths are resolved against the manifest's folder. The manifest is
+opened like any other video: :func:`open_video_capture` returns a
+:class:`SegmentedCapture` for it, frames are numbered globally across the
+segments, and the sidecar and exports belong to the manifest, so one session
+gets one annotation file and one export without concatenating the videos.
+"""
+from __future__ import annotations
+
+from bisect import bisect_right
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+import json
+import logging
+import os
+from pathlib import Path
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from services.media_index import (
+    MediaIndex,
+    load_media_index,
+    save_media_index,
+    scan_media_index,
+    seek_capture,
+)
+
+
+SEGMENT_MANIFEST_SUFFIX = ".vtseg"
+SEGMENT_MANIFEST_VERSION = 1
+# Open the next segment once playback is this many frames from the boundary.
+DEFAULT_PREFETCH_FRAMES = 90
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class VideoSegment:
+    """One file of a segmented recording and the frames it contributes."""
+
+    path: str
+    frame_count: int
+    media_index: Optional[MediaIndex] = field(default=None, compare=False)
+
+
+class SegmentMap:
+    """Translate global frame numbers to ``(segment, local frame)`` and back."""
+
+    def __init__(self, frame_counts: Sequence[int]):
+        self.frame_counts = [max(0, int(count)) for count in frame_counts]
+        self.offsets = [0]
+        for count in self.frame_counts:
+            self.offsets.append(self.offsets[-1] + count)
+
+    @property
+    def total_frames(self) -> int:
+        return self.offsets[-1]
+
+    def locate(self, frame: int) -> Tuple[int, int]:
+        """Return the segment holding ``frame`` and the frame's number within it.
+
+        Frames past the end map to the end of the last non-empty segment.
+        Empty segments are never returned for a frame inside the video.
+        """
+        if not self.frame_counts:
+            raise ValueError("分段视频不包含任何片段")
+        frame = max(0, int(frame))
+        if frame >= self.total_frames:
+            segment = max(
+                (index for index, count in enumerate(self.frame_counts) if count > 0),
+                default=len(self.frame_counts) - 1,
+            )
+            return segment, self.frame_counts[segment]
+        segment = bisect_right(self.offsets, frame) - 1
+        return segment, frame - self.offsets[segment]
+
+    def global_frame(self, segment: int, local_frame: int) -> int:
+        return self.offsets[segment] + int(local_frame)
+
+
+def is_segment_manifest(path: str) -> bool:
+    return Path(path).suffix.lower() == SEGMENT_MANIFEST_SUFFIX
+
+
+def manifest_path_for(first_segment: str) -> str:
+    """Default manifest path for a session starting with ``first_segment``."""
+    path = Path(first_segment)
+    return str(path.with_name(f"{path.stem}{SEGMENT_MANIFEST_SUFFIX}"))
+
+
+def write_segment_manifest(path: str, segment_paths: Sequence[str]) -> Path:
+    """Write a manifest listing ``segment_paths`` in order and return its path.
+
+    Segments in the manifest's folder or below are stored relative to it,
+    so the folder can be moved or mounted elsewhere as a whole.
+
+    Raises:
+        ValueError: No segments were given.
+        OSError: The manifest could not be written.
+    """
+    if not segment_paths:
+        raise ValueError("至少需要一个视频片段")
+    target = Path(path)
+    entries = []
+    for segment in segment_paths:
+        segment_path = Path(segment).resolve()
+        try:
+            stored = segment_path.relative_to(target.parent.resolve()).as_posix()
+        except ValueError:
+            stored = str(segment_path)
+        entries.append({"path": stored})
+    payload = {"schema_version": SEGMENT_MANIFEST_VERSION, "segments": entries}
+    temp_path = target.with_name(f".{target.name}.tmp")
+    with temp_path.open("w", encoding="utf-8") as file:
+        json.dump(payload, file, ensure_ascii=False, indent=2)
+        file.write("\n")
+    os.replace(temp_path, target)
+    return target
+
+
+def read_segment_manifest(path: str) -> List[Tuple[str, Optional[int]]]:
+    """Return ``(absolute segment path, pinned frame count or None)`` per segment.
+
+    Raises:
+        ValueError: The manifest is malformed or lists no segments.
+        OSError: The manifest could not be read.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        try:
+            payload = json.load(file)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"分段清单格式错误: {exc}") from exc
+    if not isinstance(payload, dict) or payload.get("schema_version") != SEGMENT_MANIFEST_VERSION:
+        raise ValueError(f"不支持的分段清单版本: {path}")
+    entries = payload.get("segments")
+    if not isinstance(entries, list) or not entries:
+        raise ValueError(f"分段清单没有列出视频片段: {path}")
+    folder = Path(path).resolve().parent
+    segments = []
+    for entry in entries:
+        if isinstance(entry, str):
+            entry = {"path": entry}
+        if not isinstance(entry, dict) or not entry.get("path"):
+            raise ValueError(f"分段清单条目无效: {entry!r}")
+        frames = entry.get("frames")
+        segments.append((str(folder / entry["path"]), int(frames) if frames is not None else None))
+    return segments
+
+
+_probe_lock = threading.Lock()
+# (resolved manifest, mtime) -> (segment versions, whether missing indexes were scanned, segments)
+_probe_cache: Dict[Tuple[str, int], Tuple[Tuple, bool, List[VideoSegment]]] = {}
+
+
+def probe_segments(
+    manifest_path: str,
+    capture_factory: Callable[[str], object] = cv2.VideoCapture,
+    index_missing: bool = False,
+    allow_decode: bool = False,
+    should_continue: Optional[Callable[[], bool]] = None,
+) -> List[VideoSegment]:
+    """Read the manifest and the frame count of each segment.
+
+    A count pinned in the manifest wins, then the frame count of the
+    segment's media index, then the container header. Header counts are
+    often off by a few frames, so with ``index_missing`` segments without a
+    saved index are scanned first (see :func:`scan_media_index` for
+    ``allow_decode``) and the index is saved beside the segment when the
+    folder is writable. Results are cached per version of the manifest and
+    of every segment file (size and modification time), so the many captures
+    of one session probe the segment files only once and all agree on the
+    counts the first indexed probe found, while a replaced segment is probed
+    again.
+
+    Raises:
+        MediaIndexCancelledError: ``should_continue`` returned ``False``
+            while a segment was being scanned.
+        ValueError: The manifest is malformed or a segment cannot be opened.
+        OSError: The manifest could not be read.
+    """
+    resolved = str(Path(manifest_path).resolve())
+    key = (resolved, os.stat(resolved).st_mtime_ns)
+    entries = read_segment_manifest(resolved)
+    versions = tuple(_file_version(path) for path, _pinned in entries)
+    with _probe_lock:
+        cached = _probe_cache.get(key)
+    if cached is not None and cached[0] == versions and (cached[1] or not index_missing):
+        return cached[2]
+
+    segments = []
+    for path, pinned in entries:
+        media_index = load_media_index(path)
+        if media_index is None and pinned is None and index_missing:
+            media_index = _index_segment(path, allow_decode, should_continue)
+        if pinned is not None:
+            frame_count = pinned
+        elif media_index is not None:
+            frame_count = media_index.frame_count
+        else:
+            capture = capture_factory(path)
+            try:
+                if not capture.isOpened():
+                    raise ValueError(f"无法打开视频片段: {path}")
+                frame_count = int(capture.get(cv2.CAP_PROP_FRAME_COUNT))
+            finally:
+                capture.release()
+        segments.append(VideoSegment(path, max(0, frame_count), media_index))
+    with _probe_lock:
+        _probe_cache[key] = (versions, index_missing, segments)
+    return segments
+
+
+def _file_version(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _index_segment(
+    path: str,
+    allow_decode: bool,
+    should_continue: Optional[Callable[[], bool]],
+) -> Optional[MediaIndex]:
+    try:
+        media_index = scan_media_index(path, should_continue=should_continue, allow_decode=allow_decode)
+    except (OSError, ValueError):
+        return None
+    try:
+        save_media_index(media_index, path)
+    except OSError:
+        # Read-only shares still get exact counts for this session.
+        pass
+    return media_index
+
+
+class SegmentedCapture:
+    """``cv2.VideoCapture`` look-alike that reads segments back to back.
+
+    Supports the calls the rest of the app makes on a capture: ``read``
+    (including into a preallocated image), ``grab``, ``set``/``get`` of the
+    frame position, and ``get`` of frame rate, count, size and time. Frame
+    numbers and positions are global; a seek opens the segment holding the
+    target frame and seeks inside it, through the segment's media index when
+    it has one.
+
+    Opening a file is the slow part of crossing a boundary, especially on a
+    network share, so once reading gets within ``prefetch_frames`` of the end
+    of a segment the next one is opened on a helper thread and taken over
+    when the boundary is reached. If a segment decodes fewer frames than its
+    count, or a later segment cannot be opened at all, the missing frame
+    numbers read as black frames, both sequentially and after a seek, so
+    callers that number frames with their own counters stay in step with the
+    segment map and reach the end of the recording. Like an OpenCV capture,
+    an instance is meant for one thread at a time, and a manifest that cannot
+    be read or whose first segment cannot be opened leaves it closed instead
+    of raising.
+    """
+
+    def __init__(
+        self,
+        manifest_path: str,
+        prefetch_frames: int = DEFAULT_PREFETCH_FRAMES,
+        capture_factory: Callable[[str], object] = cv2.VideoCapture,
+    ):
+        self.manifest_path = manifest_path
+        self.prefetch_frames = max(0, int(prefetch_frames))
+        self._capture_factory = capture_factory
+        self.segments: List[VideoSegment] = []
+        self.segment_map = SegmentMap([])
+        self._segment = -1
+        self._capture = None
+        self._opened = False
+        self._local = 0
+        self._fps = 0.0
+        self._size = (0.0, 0.0)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._prefetch: Optional[Tuple[int, Future]] = None
+        try:
+            self.segments = probe_segments(manifest_path, capture_factory)
+        except (OSError, ValueError):
+            return
+        self.segment_map = SegmentMap([segment.frame_count for segment in self.segments])
+        if self.segment_map.total_frames <= 0:
+            return
+        self._switch_to(self.segment_map.locate(0)[0])
+        if self._capture is not None:
+            self._opened = True
+            self._fps = float(self._capture.get(cv2.CAP_PROP_FPS))
+            self._size = (
+                float(self._capture.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                float(self._capture.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            )
+
+    @property
+    def segment_index(self) -> int:
+        return self._segment
+
+    @property
+    def position(self) -> int:
+        if self._segment < 0:
+            return 0
+        return self.segment_map.global_frame(self._segment, self._local)
+
+    def isOpened(self) -> bool:
+        return self._opened
+
+    def get(self, prop: int) -> float:
+        if prop == cv2.CAP_PROP_FRAME_COUNT:
+            return float(self.segment_map.total_frames)
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            return float(self.position)
+        if prop == cv2.CAP_PROP_FPS:
+            return self._fps
+        if prop == cv2.CAP_PROP_POS_MSEC:
+            return self.position / self._fps * 1000 if self._fps > 0 else 0.0
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            return self._size[0]
+        if prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            return self._size[1]
+        return self._capture.get(prop) if self._capture is not None else 0.0
+
+    def set(self, prop: int, value: float) -> bool:
+        if prop != cv2.CAP_PROP_POS_FRAMES:
+            return self._capture.set(prop, value) if self._capture is not None else False
+        if not self._opened:
+            return False
+        segment, local = self.segment_map.locate(int(value))
+        if segment != self._segment or self._capture is None:
+            self._switch_to(segment)
+        if self._capture is not None and not seek_capture(
+            self._capture, local, self.segments[segment].media_index
+        ):
+            return False
+        self._local = local
+        self._maybe_prefetch()
+        return True
+
+    def read(self, image=None):
+        if not self._frame_available():
+            return False, None
+        if self._capture is None:
+            ok, frame = False, None
+        else:
+            ok, frame = self._capture.read() if image is None else self._capture.read(image)
+        if not ok:
+            frame = self._padding_frame(image)
+        self._local += 1
+        self._maybe_prefetch()
+        return True, frame
+
+    def grab(self) -> bool:
+        if not self._frame_available():
+            return False
+        # A failed grab is a frame number the segment could not decode; read() pads it.
+        if self._capture is not None:
+            self._capture.grab()
+        self._local += 1
+        self._maybe_prefetch()
+        return True
+
+    def release(self):
+        if self._capture is not None:
+            self._capture.release()
+            self._capture = None
+        self._opened = False
+        self._segment = -1
+        if self._prefetch is not None:
+            _segment, future = self._prefetch
+            self._prefetch = None
+            future.add_done_callback(lambda done: done.result().release())
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _frame_available(self) -> bool:
+        if not self._opened:
+            return False
+        while self._local >= self.segments[self._segment].frame_count:
+            if not self._switch_to(self._segment + 1):
+                return False
+        return True
+
+    def _padding_frame(self, image=None):
+        """Black frame standing in for a frame number its segment could not decode."""
+        width, height = int(self._size[0]) or 1, int(self._size[1]) or 1
+        if image is not None and image.shape == (height, width, 3):
+            image[...] = 0
+            return image
+        return np.zeros((height, width, 3), dtype=np.uint8)
+
+    def _switch_to(self, segment: int) -> bool:
+        """Make ``segment`` current, positioned at its first frame.
+
+        A segment that cannot be opened still becomes current, without a
+        capture, so its frame numbers read as padding.
+        """
+        if segment >= len(self.segments):
+            return False
+        capture = None
+        if self._prefetch is not None:
+            prefetched, future = self._prefetch
+            if prefetched == segment:
+                self._prefetch = None
+                capture = future.result()
+        if capture is None:
+            capture = self._capture_factory(self.segments[segment].path)
+        if not capture.isOpened():
+            capture.release()
+            logger.warning("无法打开视频片段, 以黑帧代替: %s", self.segments[segment].path)
+            capture = None
+        if self._capture is not None:
+            self._capture.release()
+        self._capture = capture
+        self._segment = segment
+        self._local = 0
+        return True
+
+    def _maybe_prefetch(self):
+        following = self._segment + 1
+        if self.prefetch_frames <= 0 or following >= len(self.segments):
+            return
+        if self.segments[self._segment].frame_count - self._local > self.prefetch_frames:
+            return
+        if self._prefetch is not None:
+            if self._prefetch[0] == following:
+                return
+            _stale, future = self._prefetch
+            future.add_done_callback(lambda done: done.result().release())
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="segment-prefetch")
+        path = self.segments[following].path
+        self._prefetch = (following, self._executor.submit(self._capture_factory, path))
+
+
+def open_video_capture(path: str):
+    """Open ``path`` as a capture; ``.vtseg`` manifests open as a :class:`SegmentedCapture`."""
+    if is_segment_manifest(path):
+        return SegmentedCapture(path)
+    return cv2.VideoCapture(path)
@@ -0,0 +1,88 @@
+"""Local read-ahead copies of videos that live on slow network storage."""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Callable, Optional
+
+from services.file_cache import FileCache
+
+
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+class StagingCancelledError(RuntimeError):
+    """Raised when a copy is stopped by its ``should_continue`` hook."""
+
+
+class StagingCache(FileCache):
+    """Byte-bounded LRU cache of local video copies.
+
+    Entries are validated against the source file's size and modification
+    time, so a video replaced on the share is copied again. Copies are
+    written to a ``.part`` file with large sequential reads and renamed once
+    complete, so a half-written copy is never handed to a capture.
+    """
+
+    def __init__(self, root: str, max_bytes: int, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        super().__init__(root, max_bytes)
+        self.chunk_size = max(64 * 1024, int(chunk_size))
+
+    def staged_path(self, source_path: str) -> Optional[str]:
+        """Return the valid local copy of ``source_path``, or ``None``."""
+        entry = self._lookup(source_path)
+        return str(self.root / entry["local_name"]) if entry is not None else None
+
+    def stage(
+        self,
+        source_path: str,
+        progress_callback: Optional[Callable[[float], None]] = None,
+        should_continue: Optional[Callable[[], bool]] = None,
+    ) -> Optional[str]:
+        """Copy ``source_path`` into the cache and return the local path.
+
+        Returns ``None`` when the file cannot fit in the cache at all.
+
+        Raises:
+            StagingCancelledError: ``should_continue`` returned ``False``.
+            OSError: The source could not be read or the copy not written.
+        """
+        existing = self.staged_path(source_path)
+        if existing is not None:
+            return existing
+
+        stat = os.stat(source_path)
+        if stat.st_size > self.max_bytes:
+            return None
+
+        key = self._key(source_path)
+        local_name = f"{key[:16]}{Path(source_path).suffix.lower()}"
+        local_path = self.root / local_name
+        part_path = local_path.with_name(local_name + ".part")
+        self._discard(source_path, stat.st_size)
+
+        copied = 0
+        try:
+            with open(source_path, "rb", buffering=0) as source, open(part_path, "wb") as target:
+                while True:
+                    if should_continue is not None and not should_continue():
+                        raise StagingCancelledError("本地缓存已取消")
+                    chunk = source.read(self.chunk_size)
+                    if not chunk:
+                        break
+                    target.write(chunk)
+                    copied += len(chunk)
+                    if progress_callback and stat.st_size > 0:
+                        progress_callback(min(copied / stat.st_size, 1.0))
+            os.replace(part_path, local_path)
+        except BaseException:
+            try:
+                part_path.unlink()
+            except OSError:
+                pass
+            raise
+
+        return str(self._store(source_path, stat, local_name))
+
+    def _entry_valid(self, entry: dict, local_path: Path, stat: os.stat_result) -> bool:
+        return local_path.stat().st_size == stat.st_size
@@ -129,6 +129,21 @@ class AnnotationModelTest(unittest.TestCase):
         self.assertEqual([record.video_time for record in records], [1.0, 2.5, 4.0, 5.5])
         self.assertEqual([record.frame for record in records], [10, 25, 40, 55])
 
+    def test_frame_times_map_variable_frame_rate_and_keep_intervals(self):
+        self.model.set_video_context("mouse.avi", 10.0, 4)
+        self.model.add_interval(1, 3)
+
+        self.model.set_timing(10.0, 4, [0.0, 0.1, 0.5, 0.6, 0.7])
+
+        self.assertEqual(self.model.count, 1)
+        self.assertAlmostEqual(self.model.frame_to_seconds(2), 0.5)
+        self.assertAlmostEqual(self.model.frame_to_seconds(4), 0.7)
+        self.assertEqual(self.model.seconds_to_frame(0.45), 2)
+        self.assertEqual(self.model.seconds_to_frame(0.2), 1)
+        self.assertEqual(self.model.seconds_to_frame(9.0), 4)
+        records = intervals_to_time_records(self.model.intervals, 10.0, self.model.frame_to_seconds)
+        self.assertEqual([record.video_time for record in records], [0.1, 0.6])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+
+from utils.canvas_viewport import CanvasViewport
+
+
+class CanvasViewportTest(unittest.TestCase):
+    def test_unzoomed_viewport_shows_whole_frame(self):
+        viewport = CanvasViewport()
+
+        self.assertFalse(viewport.is_zoomed)
+        self.assertEqual(viewport.visible_rect(1920, 1080), (0, 0, 1920, 1080))
+
+    def test_zoom_keeps_anchor_point_fixed(self):
+        viewport = CanvasViewport()
+
+        viewport.zoom_at(0.25, 0.5, 2.0)
+
+        self.assertEqual(viewport.visible_rect(1920, 1080), (240, 270, 960, 540))
+        # The anchor at a quarter of the old view is still a quarter into the new one.
+        self.assertAlmostEqual(240 + 0.25 * 960, 0.25 * 1920)
+
+    def test_zoom_at_corner_stays_inside_frame(self):
+        viewport = CanvasViewport()
+
+        viewport.zoom_at(1.0, 1.0, 4.0)
+
+        self.assertEqual(viewport.visible_rect(1920, 1080), (1440, 810, 480, 270))
+
+    def test_zoom_is_bounded(self):
+        viewport = CanvasViewport(max_zoom=8.0)
+
+        viewport.zoom_at(0.5, 0.5, 100.0)
+        self.assertEqual(viewport.zoom, 8.0)
+        viewport.zoom_at(0.5, 0.5, 0.001)
+        self.assertEqual(viewport.zoom, 1.0)
+        self.assertEqual((viewport.center_x, viewport.center_y), (0.5, 0.5))
+
+    def test_pan_moves_opposite_to_drag_and_clamps(self):
+        viewport = CanvasViewport()
+        viewport.zoom_at(0.5, 0.5, 2.0)
+
+        viewport.pan_by(0.5, 0.0)
+        self.assertEqual(viewport.visible_rect(1000, 1000)[0], 0)
+
+        viewport.pan_by(-10.0, -10.0)
+        self.assertEqual(viewport.visible_rect(1000, 1000)[:2], (500, 500))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import time
+import unittest
+
+import numpy as np
+
+from services.compare_playback import ComparePlayback, CompareSource
+from services.media_index import MediaIndex
+from services.playback_engine import DecodeAheadBuffer
+from tests.test_playback_engine import FakeCapture
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class CompareSourceTest(unittest.TestCase):
+    def test_frame_at_uses_each_videos_frame_rate(self):
+        fast = CompareSource("a.avi", 30.0, 300)
+        slow = CompareSource("b.avi", 12.5, 125)
+
+        self.assertEqual(fast.frame_at(1.0), 30)
+        self.assertEqual(slow.frame_at(1.0), 12)
+        self.assertEqual(slow.frame_at(1.04), 13)
+        self.assertEqual(fast.frame_at(99.0), 299)
+        self.assertEqual(slow.duration, 10.0)
+
+    def test_frame_at_follows_variable_frame_rate_timestamps(self):
+        pts = np.array([0.0, 0.1, 0.15, 0.4, 0.5])
+        source = CompareSource("vfr.mp4", 10.0, 5, MediaIndex(frame_count=5, pts=pts))
+
+        self.assertEqual(source.frame_at(0.12), 1)
+        self.assertEqual(source.frame_at(0.39), 2)
+        self.assertEqual(source.frame_at(0.4), 3)
+        self.assertAlmostEqual(source.frame_time(3), 0.4)
+
+
+class ComparePlaybackTest(unittest.TestCase):
+    def _playback(self, clock):
+        sources = [CompareSource("a.avi", 30.0, 90), CompareSource("b.avi", 15.0, 45)]
+
+        def factory(source, depth):
+            return DecodeAheadBuffer(source.video_path, depth, lambda _path: FakeCapture(source.total_frames))
+
+        playback = ComparePlayback(sources, depth=4, buffer_factory=factory, clock=clock)
+        self.addCleanup(playback.stop)
+        return playback
+
+    def _poll_until(self, playback, expected):
+        deadline = time.monotonic() + 2.0
+        while time.monotonic() < deadline:
+            for item in playback.poll():
+                if item is not None:
+                    self.assertEqual(int(item[1][0, 0, 0]), item[0] % 256)
+            if playback.shown_frames == expected:
+                return
+            time.sleep(0.001)
+        self.fail(f"expected {expected}, showing {playback.shown_frames}")
+
+    def test_seek_presents_time_aligned_frames_while_paused(self):
+        clock = FakeClock()
+        playback = self._playback(clock)
+
+        playback.seek(1.0)
+        self._poll_until(playback, [30, 15])
+        self.assertEqual(playback.poll(), [None, None])
+
+    def test_shared_clock_drives_every_video(self):
+        clock = FakeClock()
+        playback = self._playback(clock)
+        playback.seek(0.0)
+        self._poll_until(playback, [0, 0])
+
+        playback.play()
+        clock.now += 0.2
+        self._poll_until(playback, [6, 3])
+        playback.set_speed(2.0)
+        clock.now += 0.1
+        self._poll_until(playback, [12, 6])
+
+        playback.set_speed(4.0)
+        clock.now += 0.16
+        playback.poll()
+        playback.pause()
+        self._poll_until(playback, [31, 15])
+
+        playback.play()
+        clock.now += 10.0
+        self._poll_until(playback, [89, 44])
+        self.assertFalse(playback.playing)
+        self.assertEqual(playback.position, playback.duration)
+
+
+if __name__ == "__main__":
+    unittest.main()
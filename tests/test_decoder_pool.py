@@ -0,0 +1,121 @@
+import unittest
+
+import cv2
+import numpy as np
+
+from services.decoder_pool import DecoderPool
+from services.media_index import MediaIndex
+
+
+class CountingCapture:
+    def __init__(self, frame_count):
+        self.frame_count = frame_count
+        self.position = 0
+        self.seeks = 0
+        self.decoded = 0
+
+    def set(self, prop, value):
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            self.position = int(value)
+            self.seeks += 1
+        return True
+
+    def grab(self):
+        if self.position >= self.frame_count:
+            return False
+        self.position += 1
+        self.decoded += 1
+        return True
+
+    def read(self):
+        if not self.grab():
+            return False, None
+        return True, np.full((2, 2, 3), (self.position - 1) % 256, dtype=np.uint8)
+
+    def release(self):
+        pass
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += 1.0
+        return self.now
+
+
+class DecoderPoolTest(unittest.TestCase):
+    def _pool(self, frame_count=1000, size=3, media_index=None):
+        self.captures = []
+
+        def factory(_path):
+            capture = CountingCapture(frame_count)
+            self.captures.append(capture)
+            return capture
+
+        return DecoderPool("fake.avi", frame_count, size, factory, media_index, FakeClock())
+
+    def test_reads_return_the_requested_run(self):
+        pool = self._pool()
+
+        frames = pool.read_frames(500, 502)
+
+        self.assertEqual([index for index, _frame in frames], [500, 501, 502])
+        self.assertEqual(int(frames[0][1][0, 0, 0]), 500 % 256)
+
+    def test_seek_uses_the_decoder_closest_behind_the_target(self):
+        pool = self._pool()
+        pool.read_frames(100, 100)
+        pool.read_frames(600, 600)
+        seeks = pool.seeks
+
+        frames = pool.read_frames(610, 610)
+
+        self.assertEqual(frames[0][0], 610)
+        self.assertEqual(pool.seeks, seeks)
+        self.assertEqual(sorted(pool.positions)[1:], [101, 611])
+
+    def test_far_jump_moves_the_least_recently_used_decoder(self):
+        pool = self._pool()
+        pool.read_frames(100, 100)
+        pool.read_frames(400, 400)
+        pool.read_frames(700, 700)
+
+        pool.read_frames(900, 900)
+
+        self.assertEqual(sorted(pool.positions), [401, 701, 901])
+
+    def test_keyframes_bound_the_forward_decode(self):
+        index = MediaIndex(
+            frame_count=1000,
+            pts=np.arange(1000) / 25.0,
+            keyframes=list(range(0, 1000, 10)),
+        )
+        pool = self._pool(media_index=index)
+        pool.read_frames(0, 0)
+
+        self.assertIsNone(pool.forward_distance(50))
+        self.assertEqual(pool.forward_distance(5), 4)
+
+    def test_idle_decoders_park_in_the_most_visited_regions(self):
+        pool = self._pool(size=3)
+        for _ in range(3):
+            pool.read_frames(800, 800)
+        for _ in range(2):
+            pool.read_frames(300, 300)
+        pool.read_frames(20, 20)
+
+        pool.park_idle()
+
+        positions = sorted(pool.positions)
+        self.assertEqual(positions[0], 21)
+        self.assertEqual(pool._bin(positions[1]), pool._bin(300))
+        self.assertEqual(pool._bin(positions[2]), pool._bin(800))
+        seeks = pool.seeks
+        pool.read_frames(800, 800)
+        self.assertEqual(pool.seeks, seeks)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+
+from services.detection_cache import DetectionResultCache, detection_cache_key
+from services.freezing_detection_service import FreezingDetectionParams, FreezingInterval
+
+
+class DetectionCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.video_path = os.path.join(self.temp_dir.name, "mouse.avi")
+        with open(self.video_path, "wb") as file:
+            file.write(b"video")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_key_depends_on_params_and_crop(self):
+        params = FreezingDetectionParams()
+        key = detection_cache_key(self.video_path, params)
+
+        self.assertEqual(key, detection_cache_key(self.video_path, FreezingDetectionParams()))
+        self.assertNotEqual(key, detection_cache_key(self.video_path, FreezingDetectionParams(sample_rate=5.0)))
+        self.assertNotEqual(key, detection_cache_key(self.video_path, params, "upper", 0.5))
+
+    def test_key_changes_when_file_changes(self):
+        params = FreezingDetectionParams()
+        key = detection_cache_key(self.video_path, params)
+        with open(self.video_path, "ab") as file:
+            file.write(b"more")
+
+        self.assertNotEqual(key, detection_cache_key(self.video_path, params))
+        self.assertIsNone(detection_cache_key(os.path.join(self.temp_dir.name, "missing.avi"), params))
+
+    def test_cache_evicts_least_recently_used(self):
+        cache = DetectionResultCache(max_items=2)
+        interval = FreezingInterval(0.0, 1.0, 1.0, 0, 30)
+        cache.put("a", [interval])
+        cache.put("b", [])
+        cache.get("a")
+        cache.put("c", [])
+
+        self.assertEqual(cache.get("a"), [interval])
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNone(cache.get(None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+import numpy as np
+
+from services.frame_cache import FrameCache
+
+
+def frame(value):
+    return np.full((10, 10, 3), value, dtype=np.uint8)
+
+
+class FrameCacheTest(unittest.TestCase):
+    def test_round_trips_frames_by_source_index(self):
+        cache = FrameCache(max_bytes=10_000)
+        cache.put(5, frame(5))
+
+        self.assertEqual(int(cache.get(5)[0, 0, 0]), 5)
+        self.assertIsNone(cache.get(6))
+        self.assertIn(5, cache)
+
+    def test_evicts_frames_furthest_from_playhead(self):
+        cache = FrameCache(max_bytes=3 * frame(0).nbytes)
+        for index in (10, 11, 12):
+            cache.put(index, frame(index))
+        cache.get(12)
+
+        cache.put(13, frame(13))
+
+        self.assertNotIn(10, cache)
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.total_bytes, 3 * frame(0).nbytes)
+
+    def test_playback_keeps_the_most_recent_frames(self):
+        cache = FrameCache(max_bytes=10 * frame(0).nbytes)
+        cache.get(0)
+
+        for index in range(50):
+            cache.set_playhead(index)
+            cache.put(index, frame(index))
+
+        self.assertEqual(len(cache), 10)
+        self.assertTrue(all(index in cache for index in range(40, 50)))
+
+    def test_replacing_frame_keeps_byte_count(self):
+        cache = FrameCache(max_bytes=10_000)
+        cache.put(1, frame(1))
+        cache.put(1, frame(2))
+
+        self.assertEqual(cache.total_bytes, frame(0).nbytes)
+
+    def test_skips_frames_larger_than_budget(self):
+        cache = FrameCache(max_bytes=10)
+        cache.put(1, frame(1))
+
+        self.assertEqual(len(cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,9 +8,11 @@ try:
     import numpy as np
 
     from services.freezing_detection_service import (
+        DetectionCancelledError,
         FreezingDetectionParams,
         FreezingDetectionService,
     )
+    from services.media_index import MediaIndex
     from services.video_crop_service import CROP_LOWER, CROP_UPPER
 except ModuleNotFoundError as exc:
     cv2 = None
@@ -155,6 +157,63 @@ class FreezingDetectionServiceTest(unittest.TestCase):
         self.assertGreaterEqual(intervals[-1].start, 1.5)
         self.assertGreaterEqual(intervals[-1].duration, 0.5)
 
+    def test_parallel_workers_match_single_threaded_result(self):
+        fps = 10.0
+        frame_size = (64, 64)
+        params = FreezingDetectionParams(
+            sample_rate=5.0,
+            analysis_width=64,
+            pixel_diff_threshold=5,
+            motion_threshold=0.01,
+            min_freeze_duration=0.4,
+            merge_gap=0.1,
+            min_non_freeze_gap=0.1,
+            smoothing_window=0.1,
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            video_path = os.path.join(temp_dir, "synthetic_parallel.avi")
+            writer = cv2.VideoWriter(
+                video_path,
+                cv2.VideoWriter_fourcc(*"MJPG"),
+                fps,
+                frame_size,
+            )
+            if not writer.isOpened():
+                self.skipTest("OpenCV MJPG writer is not available")
+
+            try:
+                for block in range(6):
+                    for index in range(10):
+                        square_x = 20 if block % 2 == 0 else 4 + index * 4
+                        writer.write(self._mouse_frame(frame_size, square_x))
+            finally:
+                writer.release()
+
+            stages = set()
+            sequential = FreezingDetectionService(
+                stage_observer=lambda stage, _seconds: stages.add(stage)
+            ).detect_freezing(video_path, fps, 60, params)
+            # Motion JPEG: every frame is a keyframe.
+            index = MediaIndex(frame_count=60, pts=np.arange(60) / fps, keyframes=list(range(60)))
+            with patch.object(
+                FreezingDetectionService,
+                "_analyse_parallel",
+                autospec=True,
+                side_effect=FreezingDetectionService._analyse_parallel,
+            ) as analyse_parallel:
+                parallel = self.service.detect_freezing(
+                    video_path, fps, 60, params, workers=3, media_index=index
+                )
+                without_index = self.service.detect_freezing(video_path, fps, 60, params, workers=3)
+
+        self.assertGreaterEqual(len(sequential), 2)
+        self.assertEqual(parallel, sequential)
+        self.assertEqual(without_index, sequential)
+        # Without keyframes the ranges would start on inexact seeks, so only the indexed run splits.
+        self.assertEqual(analyse_parallel.call_count, 1)
+        self.assertEqual(stages, {"decode", "skip", "preprocess", "motion", "postprocess"})
+
     def test_detect_freezing_applies_virtual_crop(self):
         fps = 1.0
         frames = []
@@ -204,6 +263,29 @@ class FreezingDetectionServiceTest(unittest.TestCase):
         self.assertEqual(lower_intervals[0].end_frame, 4)
         self.assertEqual(upper_intervals, [])
 
+    def test_detect_freezing_stops_when_should_continue_returns_false(self):
+        frames = [np.zeros((4, 4, 3), dtype=np.uint8) for _ in range(6)]
+        calls = []
+
+        def should_continue():
+            calls.append(True)
+            return len(calls) < 3
+
+        with patch(
+            "services.freezing_detection_service.cv2.VideoCapture",
+            lambda _path: FakeCapture(frames, 1.0),
+        ):
+            with self.assertRaises(DetectionCancelledError):
+                self.service.detect_freezing(
+                    "synthetic.avi",
+                    1.0,
+                    len(frames),
+                    FreezingDetectionParams(sample_rate=1.0, analysis_width=4),
+                    should_continue=should_continue,
+                )
+
+        self.assertEqual(len(calls), 3)
+
     def _mouse_frame(self, frame_size, square_x):
         frame = np.zeros((frame_size[1], frame_size[0], 3), dtype=np.uint8)
         frame[24:40, square_x:square_x + 16] = 255
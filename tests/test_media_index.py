@@ -0,0 +1,177 @@
+import os
+import tempfile
+import unittest
+
+import cv2
+import numpy as np
+
+from services.media_index import (
+    MediaIndex,
+    frame_for_timestamp,
+    index_path_for,
+    load_media_index,
+    pyav_available,
+    save_media_index,
+    scan_media_index,
+    seek_capture,
+)
+
+
+class SeekRecordingCapture:
+    def __init__(self):
+        self.position = 0
+        self.seeks = []
+
+    def set(self, prop, value):
+        self.seeks.append(int(value))
+        self.position = int(value)
+        return True
+
+    def grab(self):
+        self.position += 1
+        return True
+
+
+class TimestampSeekCapture:
+    """Capture over ``pts`` whose timestamp seeks land ``overshoot`` frames late."""
+
+    def __init__(self, pts, overshoot=0):
+        self.pts = list(pts)
+        self.overshoot = overshoot
+        self.position = 0
+        self.seeks = []
+
+    def set(self, prop, value):
+        if prop == cv2.CAP_PROP_POS_MSEC:
+            target = next(index for index, pts in enumerate(self.pts) if pts * 1000 >= value - 1e-6)
+            self.position = min(len(self.pts) - 1, target + self.overshoot)
+            self.seeks.append(("msec", target))
+        else:
+            self.position = int(value)
+            self.seeks.append(("frame", int(value)))
+        return True
+
+    def grab(self):
+        self.position += 1
+        return self.position <= len(self.pts)
+
+    def get(self, prop):
+        return self.pts[self.position - 1] * 1000 if prop == cv2.CAP_PROP_POS_MSEC else 0.0
+
+
+class MediaIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.video_path = os.path.join(self.temp_dir.name, "clip.avi")
+
+    def _write_video(self, frame_count=12):
+        writer = cv2.VideoWriter(self.video_path, cv2.VideoWriter_fourcc(*"MJPG"), 10.0, (32, 24))
+        if not writer.isOpened():
+            self.skipTest("MJPG writer is not available")
+        for index in range(frame_count):
+            writer.write(np.full((24, 32, 3), index * 10, dtype=np.uint8))
+        writer.release()
+
+    def test_scan_counts_frames_and_timestamps(self):
+        self._write_video(12)
+
+        index = scan_media_index(self.video_path, allow_decode=True)
+
+        self.assertEqual(index.frame_count, 12)
+        self.assertAlmostEqual(index.average_fps, 10.0, places=3)
+        self.assertFalse(index.is_variable_frame_rate)
+        self.assertTrue(index.matches(self.video_path))
+
+    def test_scan_without_pyav_refuses_to_decode_unless_allowed(self):
+        if pyav_available():
+            self.skipTest("PyAV is installed")
+        self._write_video(3)
+
+        with self.assertRaises(ValueError):
+            scan_media_index(self.video_path)
+
+    def test_saved_index_round_trips_and_goes_stale_when_video_changes(self):
+        self._write_video(12)
+        index = MediaIndex(
+            frame_count=3,
+            pts=np.array([0.0, 0.04, 0.1]),
+            keyframes=[0, 2],
+        )
+        stat = os.stat(self.video_path)
+        index.source_size = stat.st_size
+        index.source_mtime_ns = stat.st_mtime_ns
+
+        save_media_index(index, self.video_path)
+        loaded = load_media_index(self.video_path)
+
+        self.assertEqual(loaded.frame_count, 3)
+        self.assertEqual(loaded.keyframes, [0, 2])
+        np.testing.assert_allclose(loaded.pts, [0.0, 0.04, 0.1])
+        self.assertTrue(loaded.is_variable_frame_rate)
+
+        with open(self.video_path, "ab") as file:
+            file.write(b"\0")
+        self.assertIsNone(load_media_index(self.video_path))
+
+    def test_corrupt_index_is_ignored(self):
+        self._write_video(2)
+        with open(index_path_for(self.video_path), "wb") as file:
+            file.write(b"not an index")
+
+        self.assertIsNone(load_media_index(self.video_path))
+
+    def test_seek_goes_through_nearest_keyframe(self):
+        index = MediaIndex(frame_count=100, pts=np.arange(100) / 25.0, keyframes=[0, 30, 60])
+        capture = SeekRecordingCapture()
+
+        seek_capture(capture, 47, index)
+
+        self.assertEqual(capture.seeks, [30])
+        self.assertEqual(capture.position, 47)
+
+    def test_variable_frame_rate_seek_goes_through_keyframe_timestamp(self):
+        pts = np.concatenate([np.arange(50) / 25.0, 2.0 + np.arange(50) / 10.0])
+        index = MediaIndex(frame_count=100, pts=pts, keyframes=[0, 30, 60])
+        capture = TimestampSeekCapture(pts)
+
+        self.assertTrue(seek_capture(capture, 47, index))
+
+        self.assertEqual(capture.seeks, [("msec", 30)])
+        self.assertEqual(capture.position, 47)
+
+    def test_variable_frame_rate_seek_backs_off_when_landing_past_target(self):
+        pts = np.concatenate([np.arange(50) / 25.0, 2.0 + np.arange(50) / 10.0])
+        index = MediaIndex(frame_count=100, pts=pts, keyframes=[0, 30, 60])
+        capture = TimestampSeekCapture(pts, overshoot=20)
+
+        self.assertTrue(seek_capture(capture, 65, index))
+
+        self.assertEqual(capture.seeks, [("msec", 60), ("msec", 30)])
+        self.assertEqual(capture.position, 65)
+
+    def test_seek_without_keyframes_uses_frame_position(self):
+        capture = SeekRecordingCapture()
+
+        seek_capture(capture, 47, MediaIndex(frame_count=100, pts=np.arange(100) / 25.0))
+
+        self.assertEqual(capture.seeks, [47])
+
+    def test_frame_times_append_end_of_last_frame(self):
+        index = MediaIndex(frame_count=3, pts=np.array([0.0, 0.1, 0.2]))
+
+        np.testing.assert_allclose(index.frame_times(), [0.0, 0.1, 0.2, 0.3])
+        self.assertIsNone(index.first_keyframe_in(0, 10))
+
+    def test_frame_for_timestamp_picks_the_nearest_frame(self):
+        self.assertEqual(frame_for_timestamp(1.0 - 1e-4, 30.0, 300), 30)
+        self.assertEqual(frame_for_timestamp(99.0, 30.0, 300), 299)
+
+        index = MediaIndex(frame_count=4, pts=np.array([0.0, 0.1, 0.15, 0.4]))
+        self.assertEqual(frame_for_timestamp(0.149, 10.0, 4, index), 2)
+        self.assertEqual(frame_for_timestamp(0.3, 10.0, 4, index), 3)
+        self.assertEqual(frame_for_timestamp(0.25, 10.0, 4, index), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
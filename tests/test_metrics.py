@@ -0,0 +1,72 @@
+import json
+import os
+import tempfile
+import unittest
+
+from utils.metrics import MetricsRegistry, MetricsWriter
+
+
+class MetricsRegistryTest(unittest.TestCase):
+    def test_renders_counters_gauges_and_histograms(self):
+        registry = MetricsRegistry(buckets=(0.1, 1.0))
+        registry.inc("jobs", job="detection", status="done")
+        registry.inc("jobs", job="detection", status="done")
+        registry.set_gauge("job_queue_depth", 3, job="detection")
+        registry.observe("stage_seconds", 0.05, stage="decode")
+        registry.observe("stage_seconds", 0.5, stage="decode")
+        registry.observe("stage_seconds", 2.0, stage="decode")
+
+        text = registry.render_prometheus()
+
+        self.assertIn('videotimer_jobs_total{job="detection",status="done"} 2', text)
+        self.assertIn('videotimer_job_queue_depth{job="detection"} 3', text)
+        self.assertIn('videotimer_stage_seconds_bucket{stage="decode",le="0.1"} 1', text)
+        self.assertIn('videotimer_stage_seconds_bucket{stage="decode",le="1"} 2', text)
+        self.assertIn('videotimer_stage_seconds_bucket{stage="decode",le="+Inf"} 3', text)
+        self.assertIn('videotimer_stage_seconds_count{stage="decode"} 3', text)
+
+    def test_gauge_deltas_and_counter_lookup(self):
+        registry = MetricsRegistry()
+        registry.add_gauge("job_queue_depth", 1, job="detection")
+        registry.add_gauge("job_queue_depth", 1, job="detection")
+        registry.add_gauge("job_queue_depth", -1, job="detection")
+        registry.inc("cache_requests", cache="thumbnail", result="hit")
+
+        self.assertEqual(registry.gauge_value("job_queue_depth", job="detection"), 1)
+        self.assertEqual(registry.counter_value("cache_requests", cache="thumbnail", result="hit"), 1)
+        self.assertEqual(registry.counter_value("cache_requests", cache="thumbnail", result="miss"), 0)
+
+    def test_writer_writes_prometheus_file_and_appends_json_lines(self):
+        registry = MetricsRegistry()
+        registry.inc("frames_decoded", 10, source="detection")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            prometheus_path = os.path.join(temp_dir, "videotimer.prom")
+            jsonl_path = os.path.join(temp_dir, "metrics.jsonl")
+            writer = MetricsWriter(registry, prometheus_path, jsonl_path)
+            writer.write_once()
+            writer.write_once()
+
+            with open(prometheus_path, encoding="utf-8") as file:
+                self.assertIn('videotimer_frames_decoded_total{source="detection"} 10', file.read())
+            with open(jsonl_path, encoding="utf-8") as file:
+                lines = [json.loads(line) for line in file]
+
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(lines[0]["counters"]['frames_decoded{source="detection"}'], 10)
+
+    def test_stop_swallows_write_errors_of_the_final_sample(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            blocker = os.path.join(temp_dir, "not-a-folder")
+            with open(blocker, "w", encoding="utf-8"):
+                pass
+            writer = MetricsWriter(MetricsRegistry(), os.path.join(blocker, "videotimer.prom"), interval=60)
+            writer.start()
+
+            writer.stop()
+
+        self.assertIsNone(writer._thread)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+
+from utils.perf_stats import PerfStats
+
+
+class PerfStatsTest(unittest.TestCase):
+    def test_records_nothing_while_disabled(self):
+        stats = PerfStats()
+
+        started = stats.start()
+        stats.stop("decode", started)
+
+        self.assertIsNone(started)
+        self.assertIsNone(stats.mean_ms("decode"))
+
+    def test_keeps_a_rolling_window_per_stage(self):
+        stats = PerfStats(window=2)
+        stats.set_enabled(True)
+        for seconds in (0.010, 0.002, 0.004):
+            stats.record("scale", seconds)
+        stats.stop("paint", stats.start())
+
+        self.assertAlmostEqual(stats.mean_ms("scale"), 3.0)
+        self.assertAlmostEqual(stats.max_ms("scale"), 4.0)
+        self.assertIsNotNone(stats.mean_ms("paint"))
+
+    def test_enabling_again_starts_from_fresh_samples(self):
+        stats = PerfStats()
+        stats.set_enabled(True)
+        stats.record("decode", 0.5)
+        stats.set_enabled(False)
+        stats.set_enabled(True)
+
+        self.assertIsNone(stats.mean_ms("decode"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,343 @@
+import threading
+import time
+import unittest
+
+import cv2
+import numpy as np
+
+from services.media_index import MediaIndex
+from services.playback_engine import DecodeAheadBuffer, PlaybackClock, ReverseDecodeBuffer, ScrubDecoder
+
+
+class FakeCapture:
+    def __init__(self, frame_count):
+        self.frame_count = frame_count
+        self.position = 0
+
+    def isOpened(self):
+        return True
+
+    def set(self, prop, value):
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            self.position = int(value)
+        return True
+
+    def grab(self):
+        if self.position >= self.frame_count:
+            return False
+        self.position += 1
+        return True
+
+    def read(self, image=None):
+        if self.position >= self.frame_count:
+            return False, None
+        frame = np.full((2, 2, 3), self.position % 256, dtype=np.uint8)
+        self.position += 1
+        if image is not None and image.shape == frame.shape:
+            image[...] = frame
+            return True, image
+        return True, frame
+
+    def release(self):
+        pass
+
+
+class DecodeAheadBufferTest(unittest.TestCase):
+    def _buffer(self, frame_count=20, depth=4):
+        buffer = DecodeAheadBuffer("fake.avi", depth, lambda _path: FakeCapture(frame_count))
+        self.addCleanup(buffer.stop)
+        return buffer
+
+    def _pop_blocking(self, buffer, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            item = buffer.pop()
+            if item is not None:
+                return item
+            if buffer.end_of_stream:
+                return None
+            time.sleep(0.001)
+        self.fail("decoder did not deliver a frame")
+
+    def test_frames_arrive_in_order_and_reuse_ring_slots(self):
+        buffer = self._buffer(frame_count=10, depth=3)
+        buffer.seek(0)
+
+        frames = []
+        while True:
+            item = self._pop_blocking(buffer)
+            if item is None:
+                break
+            frame_index, frame = item
+            self.assertEqual(int(frame[0, 0, 0]), frame_index)
+            frames.append(frame_index)
+
+        self.assertEqual(frames, list(range(10)))
+        self.assertEqual(len({id(slot) for slot in buffer._slots}), 3)
+
+    def test_seek_flushes_ring_and_restarts_at_target(self):
+        buffer = self._buffer(frame_count=100)
+        buffer.seek(0)
+        self.assertEqual(self._pop_blocking(buffer)[0], 0)
+
+        buffer.seek(50)
+
+        self.assertEqual(self._pop_blocking(buffer)[0], 50)
+        self.assertEqual(self._pop_blocking(buffer)[0], 51)
+        self.assertEqual(buffer.stats.flushes, 2)
+
+    def test_frame_step_grabs_past_skipped_frames(self):
+        buffer = self._buffer(frame_count=20)
+        buffer.set_frame_step(3)
+        buffer.seek(0)
+
+        frames = []
+        while True:
+            item = self._pop_blocking(buffer)
+            if item is None:
+                break
+            frame_index, frame = item
+            self.assertEqual(int(frame[0, 0, 0]), frame_index)
+            frames.append(frame_index)
+
+        self.assertEqual(frames, [0, 3, 6, 9, 12, 15, 18])
+        self.assertEqual(buffer.stats.skipped, 12)
+
+    def test_pop_until_drops_frames_behind_target(self):
+        buffer = self._buffer(frame_count=20, depth=8)
+        buffer.seek(0)
+        deadline = time.monotonic() + 2.0
+        while buffer.stats.decoded < 8 and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+        self.assertIsNone(buffer.pop_until(-1))
+        frame_index, _frame = buffer.pop_until(4)
+
+        self.assertEqual(frame_index, 4)
+        self.assertEqual(buffer.stats.dropped, 4)
+
+    def test_empty_ring_counts_underrun(self):
+        buffer = DecodeAheadBuffer("fake.avi", 2, lambda _path: FakeCapture(5))
+        self.assertIsNone(buffer.pop())
+        self.assertEqual(buffer.underruns, 1)
+
+
+class CountingCapture(FakeCapture):
+    def __init__(self, frame_count):
+        super().__init__(frame_count)
+        self.seeks = []
+
+    def set(self, prop, value):
+        self.seeks.append(int(value))
+        return super().set(prop, value)
+
+
+class ReadCountingCapture(CountingCapture):
+    def __init__(self, frame_count):
+        super().__init__(frame_count)
+        self.reads = 0
+
+    def read(self, image=None):
+        self.reads += 1
+        return super().read(image)
+
+
+class ReverseDecodeBufferTest(unittest.TestCase):
+    def _drain(self, buffer):
+        frames = []
+        deadline = time.monotonic() + 2.0
+        while time.monotonic() < deadline:
+            item = buffer.pop()
+            if item is not None:
+                frame_index, frame = item
+                self.assertEqual(int(frame[0, 0, 0]), frame_index)
+                frames.append(frame_index)
+            elif buffer.end_of_stream:
+                return frames
+            else:
+                time.sleep(0.001)
+        self.fail("reverse decoder did not finish")
+
+    def test_presents_frames_backwards_decoding_each_chunk_once(self):
+        captures = []
+
+        def factory(_path):
+            captures.append(CountingCapture(100))
+            return captures[-1]
+
+        buffer = ReverseDecodeBuffer("fake.avi", 4, factory)
+        self.addCleanup(buffer.stop)
+        buffer.seek(9)
+
+        self.assertEqual(self._drain(buffer), list(range(9, -1, -1)))
+        self.assertEqual(captures[0].seeks, [6, 2, 0])
+        self.assertEqual(buffer.stats.decoded, 10)
+
+    def test_decodes_each_gop_once_as_one_chunk(self):
+        captures = []
+
+        def factory(_path):
+            captures.append(ReadCountingCapture(200))
+            return captures[-1]
+
+        index = MediaIndex(frame_count=200, pts=np.arange(200) / 25.0, keyframes=[0, 50, 100, 150])
+        buffer = ReverseDecodeBuffer("fake.avi", 10, factory, index)
+        self.addCleanup(buffer.stop)
+        buffer.seek(120)
+
+        self.assertEqual(self._drain(buffer), list(range(120, -1, -1)))
+        self.assertEqual(captures[0].seeks, [100, 50, 0])
+        self.assertEqual(captures[0].reads, 121)
+
+    def test_splits_gops_longer_than_the_memory_budget(self):
+        captures = []
+
+        def factory(_path):
+            captures.append(ReadCountingCapture(100))
+            return captures[-1]
+
+        index = MediaIndex(frame_count=100, pts=np.arange(100) / 25.0, keyframes=[0])
+        buffer = ReverseDecodeBuffer("fake.avi", 10, factory, index, max_chunk_frames=40)
+        self.addCleanup(buffer.stop)
+        buffer.seek(99)
+
+        self.assertEqual(self._drain(buffer), list(range(99, -1, -1)))
+        self.assertEqual(buffer.stats.decoded, 100)
+
+    def test_pop_until_drops_frames_after_target(self):
+        buffer = ReverseDecodeBuffer("fake.avi", 10, lambda _path: FakeCapture(100))
+        self.addCleanup(buffer.stop)
+        buffer.seek(50)
+        deadline = time.monotonic() + 2.0
+        while buffer.stats.decoded < 10 and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+        self.assertIsNone(buffer.pop_until(51))
+        frame_index, _frame = buffer.pop_until(47)
+
+        self.assertEqual(frame_index, 47)
+        self.assertEqual(buffer.stats.dropped, 3)
+
+
+class GatedCapture(CountingCapture):
+    """Capture whose reads block until the test releases them."""
+
+    def __init__(self, frame_count):
+        super().__init__(frame_count)
+        self.gate = threading.Semaphore(0)
+
+    def read(self, image=None):
+        self.gate.acquire()
+        return super().read(image)
+
+
+class ScrubDecoderTest(unittest.TestCase):
+    def _wait_for(self, decoder):
+        deadline = time.monotonic() + 2.0
+        while time.monotonic() < deadline:
+            result = decoder.take()
+            if result is not None:
+                return result
+            time.sleep(0.001)
+        self.fail("scrub decoder did not deliver a frame")
+
+    def test_newer_requests_replace_pending_ones(self):
+        capture = GatedCapture(100)
+        decoder = ScrubDecoder("fake.avi", lambda _path: capture)
+        self.addCleanup(decoder.stop)
+        self.addCleanup(capture.gate.release)
+
+        decoder.request(10)
+        time.sleep(0.05)  # the thread is now blocked decoding frame 10
+        for frame in (20, 30, 40):
+            decoder.request(frame)
+        capture.gate.release()
+        self.assertEqual(self._wait_for(decoder)[0], 10)
+        capture.gate.release()
+
+        self.assertEqual(self._wait_for(decoder)[0], 40)
+        self.assertEqual(capture.seeks, [10, 40])
+        self.assertEqual(decoder.stats.superseded, 2)
+
+    def test_decodes_nearest_keyframe_when_index_is_known(self):
+        index = MediaIndex(frame_count=100, pts=np.arange(100) / 25.0, keyframes=[0, 25, 50])
+        decoder = ScrubDecoder("fake.avi", lambda _path: FakeCapture(100), index)
+        self.addCleanup(decoder.stop)
+
+        decoder.request(37)
+        requested, decoded, frame = self._wait_for(decoder)
+
+        self.assertEqual((requested, decoded), (37, 25))
+        self.assertEqual(int(frame[0, 0, 0]), 25)
+
+    def test_cancel_discards_in_flight_result(self):
+        capture = GatedCapture(100)
+        decoder = ScrubDecoder("fake.avi", lambda _path: capture)
+        self.addCleanup(decoder.stop)
+
+        decoder.request(10)
+        time.sleep(0.05)
+        decoder.cancel()
+        capture.gate.release()
+        deadline = time.monotonic() + 2.0
+        while decoder.stats.decoded == 0 and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+        self.assertIsNone(decoder.take())
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class PlaybackClockTest(unittest.TestCase):
+    def test_target_frame_follows_wall_clock(self):
+        now = FakeClock()
+        clock = PlaybackClock(now)
+        clock.start(10, 120.0)
+
+        now.now += 0.5
+
+        self.assertEqual(clock.target_frame(), 70)
+
+    def test_rebase_restarts_timeline_without_counting_drops(self):
+        now = FakeClock()
+        clock = PlaybackClock(now)
+        clock.start(0, 30.0)
+        now.now += 1.0
+
+        clock.rebase(200, 60.0)
+        clock.presented(201)
+
+        self.assertEqual(clock.target_frame(), 200)
+        self.assertEqual(clock.dropped_frames, 0)
+
+    def test_negative_rate_counts_backwards(self):
+        now = FakeClock()
+        clock = PlaybackClock(now)
+        clock.start(100, -30.0)
+
+        now.now += 1.0
+        clock.presented(70)
+
+        self.assertEqual(clock.target_frame(), 70)
+        self.assertEqual(clock.dropped_frames, 29)
+
+    def test_reports_dropped_frames_and_achieved_fps(self):
+        now = FakeClock()
+        clock = PlaybackClock(now)
+        clock.start(0, 120.0)
+        for frame in (2, 4, 6, 8, 10):
+            now.now += 1 / 60
+            clock.presented(frame)
+
+        self.assertEqual(clock.dropped_frames, 5)
+        self.assertAlmostEqual(clock.achieved_fps, 60.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+
+import cv2
+import numpy as np
+
+from services.proxy_cache import ProxyCache, ProxyCancelledError
+
+
+class ProxyCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.video_path = os.path.join(self.temp_dir.name, "clip.avi")
+        self.cache_dir = os.path.join(self.temp_dir.name, "proxies")
+
+    def _write_video(self, frame_count=12, size=(64, 48)):
+        writer = cv2.VideoWriter(self.video_path, cv2.VideoWriter_fourcc(*"MJPG"), 10.0, size)
+        for index in range(frame_count):
+            writer.write(np.full((size[1], size[0], 3), (index * 20) % 256, dtype=np.uint8))
+        writer.release()
+
+    def test_build_scales_down_and_keeps_every_frame(self):
+        self._write_video()
+        cache = ProxyCache(self.cache_dir, 10_000_000, height=24)
+        progress = []
+
+        proxy = cache.build(self.video_path, progress_callback=progress.append)
+
+        capture = cv2.VideoCapture(proxy)
+        self.addCleanup(capture.release)
+        self.assertEqual(int(capture.get(cv2.CAP_PROP_FRAME_COUNT)), 12)
+        capture.set(cv2.CAP_PROP_POS_FRAMES, 7)
+        ok, frame = capture.read()
+        self.assertTrue(ok)
+        self.assertEqual(frame.shape[:2], (24, 32))
+        self.assertAlmostEqual(float(frame.mean()), 140, delta=4)
+        self.assertEqual(progress[-1], 1.0)
+
+    def test_proxy_is_reused_until_the_source_changes(self):
+        self._write_video()
+        proxy = ProxyCache(self.cache_dir, 10_000_000, height=24).build(self.video_path)
+
+        self.assertEqual(ProxyCache(self.cache_dir, 10_000_000, height=24).proxy_path(self.video_path), proxy)
+        self.assertIsNone(ProxyCache(self.cache_dir, 10_000_000, height=32).proxy_path(self.video_path))
+
+        self._write_video(frame_count=5)
+        self.assertIsNone(ProxyCache(self.cache_dir, 10_000_000, height=24).proxy_path(self.video_path))
+
+    def test_proxy_with_a_different_frame_count_is_not_used(self):
+        self._write_video()
+        cache = ProxyCache(self.cache_dir, 10_000_000, height=24)
+        proxy = cache.build(self.video_path)
+
+        self.assertEqual(cache.proxy_path(self.video_path, 12), proxy)
+        self.assertIsNone(cache.proxy_path(self.video_path, 14))
+        # The entry stays, so opening the video again does not transcode again.
+        self.assertEqual(cache.build(self.video_path), proxy)
+
+    def test_cancel_leaves_no_partial_proxy(self):
+        self._write_video(frame_count=150)
+        cache = ProxyCache(self.cache_dir, 10_000_000, height=24)
+
+        with self.assertRaises(ProxyCancelledError):
+            cache.build(self.video_path, should_continue=lambda: False)
+
+        self.assertIsNone(cache.proxy_path(self.video_path))
+        self.assertEqual([name for name in os.listdir(self.cache_dir) if name.endswith(".avi")], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+
+from services.resource_scheduler import CONTEXT_PLAYBACK, CONTEXT_PREVIEW, ResourceScheduler
+
+
+class ResourceSchedulerTest(unittest.TestCase):
+    def setUp(self):
+        self.thread_settings = []
+        self.scheduler = ResourceScheduler(
+            cores=8,
+            interactive_reserve=2,
+            yield_seconds=0.0,
+            set_num_threads=self.thread_settings.append,
+        )
+
+    def test_pool_size_leaves_interactive_reserve(self):
+        self.assertEqual(self.scheduler.background_pool_size(), 6)
+        self.assertEqual(self.scheduler.background_pool_size(4), 4)
+        self.assertEqual(self.scheduler.background_pool_size(20), 6)
+
+    def test_background_jobs_shrink_opencv_pool_and_later_pools(self):
+        self.assertEqual(self.thread_settings, [8])
+
+        with self.scheduler.background(5):
+            self.assertEqual(self.scheduler.opencv_threads, 3)
+            self.assertEqual(self.scheduler.background_pool_size(), 1)
+
+        self.assertEqual(self.scheduler.opencv_threads, 8)
+        self.assertEqual(self.thread_settings, [8, 3, 8])
+
+    def test_foreground_contexts_are_tracked(self):
+        self.assertFalse(self.scheduler.is_foreground_active())
+        with self.scheduler.foreground(CONTEXT_PREVIEW):
+            self.assertTrue(self.scheduler.is_foreground_active())
+        self.assertFalse(self.scheduler.is_foreground_active())
+
+        self.scheduler.set_foreground(CONTEXT_PLAYBACK, True)
+        self.assertTrue(self.scheduler.is_foreground_active())
+        self.scheduler.set_foreground(CONTEXT_PLAYBACK, False)
+        self.assertFalse(self.scheduler.is_foreground_active())
+
+
+if __name__ == "__main__":
+    unittest.main()
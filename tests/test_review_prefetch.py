@@ -0,0 +1,83 @@
+import time
+import unittest
+
+import numpy as np
+
+from services.review_prefetch import RangePrefetcher
+from tests.test_playback_engine import FakeCapture
+
+
+class CountingCapture(FakeCapture):
+    def __init__(self, frame_count):
+        super().__init__(frame_count)
+        self.seeks = 0
+        self.reads = 0
+
+    def set(self, prop, value):
+        self.seeks += 1
+        return super().set(prop, value)
+
+    def read(self, image=None):
+        self.reads += 1
+        return super().read(image)
+
+
+class RangePrefetcherTest(unittest.TestCase):
+    def _prefetcher(self, frame_count=100, max_bytes=10_000):
+        self.capture = CountingCapture(frame_count)
+        prefetcher = RangePrefetcher("fake.avi", max_bytes, lambda _path: self.capture)
+        self.addCleanup(prefetcher.stop)
+        return prefetcher
+
+    def _wait_idle(self, prefetcher):
+        deadline = time.monotonic() + 2.0
+        while not prefetcher.idle:
+            if time.monotonic() > deadline:
+                self.fail("prefetch did not finish")
+            time.sleep(0.001)
+
+    def test_decodes_each_range_with_one_seek(self):
+        prefetcher = self._prefetcher()
+        prefetcher.request([(10, 19), (40, 44)])
+        self._wait_idle(prefetcher)
+
+        self.assertTrue(prefetcher.covers(10, 19))
+        self.assertTrue(prefetcher.covers(40, 44))
+        self.assertIsNone(prefetcher.get(20))
+        self.assertEqual(int(prefetcher.get(42)[0, 0, 0]), 42)
+        self.assertEqual(self.capture.seeks, 2)
+        self.assertEqual(self.capture.reads, 15)
+
+    def test_new_request_keeps_overlap_and_drops_the_rest(self):
+        prefetcher = self._prefetcher()
+        prefetcher.request([(10, 19), (40, 44)])
+        self._wait_idle(prefetcher)
+
+        prefetcher.request([(40, 44), (60, 62)])
+        self._wait_idle(prefetcher)
+
+        self.assertIsNone(prefetcher.get(10))
+        self.assertTrue(prefetcher.covers(40, 44))
+        self.assertTrue(prefetcher.covers(60, 62))
+        self.assertEqual(self.capture.reads, 18)
+
+    def test_stops_at_the_memory_budget(self):
+        frame_bytes = np.zeros((2, 2, 3), dtype=np.uint8).nbytes
+        prefetcher = self._prefetcher(max_bytes=frame_bytes * 3)
+        prefetcher.request([(0, 9)])
+        self._wait_idle(prefetcher)
+
+        self.assertTrue(prefetcher.covers(0, 2))
+        self.assertIsNone(prefetcher.get(3))
+        self.assertEqual(prefetcher.total_bytes, frame_bytes * 3)
+
+    def test_scales_frames_to_the_requested_size(self):
+        prefetcher = self._prefetcher()
+        prefetcher.request([(0, 1)], size=(1, 1))
+        self._wait_idle(prefetcher)
+
+        self.assertEqual(prefetcher.get(1).shape, (1, 1, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
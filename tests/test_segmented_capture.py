@@ -0,0 +1,251 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+import cv2
+import numpy as np
+
+from services.media_index import index_path_for
+from services.segmented_capture import (
+    SegmentMap,
+    SegmentedCapture,
+    probe_segments,
+    read_segment_manifest,
+    write_segment_manifest,
+)
+from tests.test_playback_engine import FakeCapture
+
+
+class SegmentCapture(FakeCapture):
+    """Frames of one segment carry ``base + local frame`` so order is visible."""
+
+    def __init__(self, frame_count, base, header_count=None, opened=True):
+        super().__init__(frame_count)
+        self.base = base
+        self.header_count = frame_count if header_count is None else header_count
+        self.opened = opened
+
+    def isOpened(self):
+        return self.opened
+
+    def get(self, prop):
+        return {
+            cv2.CAP_PROP_FRAME_COUNT: float(self.header_count),
+            cv2.CAP_PROP_FPS: 25.0,
+            cv2.CAP_PROP_FRAME_WIDTH: 2.0,
+            cv2.CAP_PROP_FRAME_HEIGHT: 2.0,
+        }.get(prop, 0.0)
+
+    def read(self, image=None):
+        if self.position >= self.frame_count:
+            return False, None
+        frame = np.full((2, 2, 3), self.base + self.position, dtype=np.uint8)
+        self.position += 1
+        return True, frame
+
+
+class SegmentMapTest(unittest.TestCase):
+    def test_locates_frames_across_segments(self):
+        segment_map = SegmentMap([10, 0, 5])
+
+        self.assertEqual(segment_map.total_frames, 15)
+        self.assertEqual(segment_map.locate(0), (0, 0))
+        self.assertEqual(segment_map.locate(9), (0, 9))
+        self.assertEqual(segment_map.locate(10), (2, 0))
+        self.assertEqual(segment_map.locate(99), (2, 5))
+        self.assertEqual(segment_map.global_frame(2, 3), 13)
+
+
+class SegmentManifestTest(unittest.TestCase):
+    def test_round_trip_keeps_order_and_relative_paths(self):
+        with tempfile.TemporaryDirectory() as folder:
+            paths = [os.path.join(folder, name) for name in ("b_0010.mp4", "a_0000.mp4")]
+            manifest = write_segment_manifest(os.path.join(folder, "session.vtseg"), paths)
+
+            stored = json.loads(manifest.read_text(encoding="utf-8"))
+            segments = read_segment_manifest(str(manifest))
+
+        self.assertEqual([entry["path"] for entry in stored["segments"]], ["b_0010.mp4", "a_0000.mp4"])
+        self.assertEqual([os.path.basename(path) for path, _frames in segments], ["b_0010.mp4", "a_0000.mp4"])
+        self.assertTrue(all(os.path.isabs(path) for path, _frames in segments))
+
+    def test_rejects_manifest_without_segments(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "empty.vtseg")
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump({"schema_version": 1, "segments": []}, file)
+
+            with self.assertRaises(ValueError):
+                read_segment_manifest(path)
+
+
+class ProbeSegmentsTest(unittest.TestCase):
+    def test_index_missing_scans_segments_and_saves_their_indexes(self):
+        with tempfile.TemporaryDirectory() as folder:
+            paths = []
+            for name, count in (("cam_0000.avi", 8), ("cam_0010.avi", 5)):
+                path = os.path.join(folder, name)
+                writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 10.0, (32, 24))
+                if not writer.isOpened():
+                    self.skipTest("MJPG writer is not available")
+                for index in range(count):
+                    writer.write(np.full((24, 32, 3), index * 10, dtype=np.uint8))
+                writer.release()
+                paths.append(path)
+            manifest = write_segment_manifest(os.path.join(folder, "cam.vtseg"), paths)
+
+            segments = probe_segments(str(manifest), index_missing=True, allow_decode=True)
+
+            self.assertEqual([segment.frame_count for segment in segments], [8, 5])
+            self.assertTrue(all(segment.media_index is not None for segment in segments))
+            self.assertTrue(all(os.path.exists(index_path_for(path)) for path in paths))
+
+    def test_replaced_segment_is_probed_again(self):
+        with tempfile.TemporaryDirectory() as folder:
+            paths = [os.path.join(folder, name) for name in ("cam_0000.mp4", "cam_0010.mp4")]
+            for path in paths:
+                with open(path, "wb") as file:
+                    file.write(b"segment")
+            manifest = str(write_segment_manifest(os.path.join(folder, "cam.vtseg"), paths))
+            counts = {paths[0]: 8, paths[1]: 5}
+            opened = []
+
+            def factory(path):
+                opened.append(path)
+                return SegmentCapture(counts[path], 0)
+
+            first = probe_segments(manifest, factory)
+            self.assertEqual(probe_segments(manifest, factory), first)
+            self.assertEqual(len(opened), 2)
+
+            counts[paths[1]] = 7
+            with open(paths[1], "wb") as file:
+                file.write(b"replaced segment")
+            segments = probe_segments(manifest, factory)
+
+        self.assertEqual([segment.frame_count for segment in segments], [8, 7])
+        self.assertEqual(len(opened), 4)
+
+
+class SegmentedCaptureTest(unittest.TestCase):
+    def _capture(self, counts, header_counts=None, prefetch_frames=2, pinned=None, unopenable=()):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        folder = directory.name
+        names = [f"part{index}.mp4" for index in range(len(counts))]
+        manifest = os.path.join(folder, "session.vtseg")
+        with open(manifest, "w", encoding="utf-8") as file:
+            entries = [{"path": name} for name in names]
+            for entry, frames in zip(entries, pinned or []):
+                if frames is not None:
+                    entry["frames"] = frames
+            json.dump({"schema_version": 1, "segments": entries}, file)
+        self.opened = []
+        bases = {name: index * 100 for index, name in enumerate(names)}
+        header_counts = header_counts or counts
+
+        def factory(path):
+            name = os.path.basename(path)
+            index = names.index(name)
+            self.opened.append((name, threading.current_thread().name))
+            return SegmentCapture(counts[index], bases[name], header_counts[index], index not in unopenable)
+
+        capture = SegmentedCapture(manifest, prefetch_frames, factory)
+        self.addCleanup(capture.release)
+        return capture
+
+    def test_reads_segments_back_to_back_with_global_positions(self):
+        capture = self._capture([3, 2])
+
+        values = []
+        while True:
+            ok, frame = capture.read()
+            if not ok:
+                break
+            values.append(int(frame[0, 0, 0]))
+
+        self.assertEqual(values, [0, 1, 2, 100, 101])
+        self.assertEqual(capture.get(cv2.CAP_PROP_FRAME_COUNT), 5)
+        self.assertEqual(capture.get(cv2.CAP_PROP_POS_FRAMES), 5)
+
+    def test_seeks_into_the_segment_holding_the_frame(self):
+        capture = self._capture([3, 4])
+
+        self.assertTrue(capture.set(cv2.CAP_PROP_POS_FRAMES, 5))
+        ok, frame = capture.read()
+
+        self.assertTrue(ok)
+        self.assertEqual(int(frame[0, 0, 0]), 102)
+        self.assertEqual(capture.segment_index, 1)
+        self.assertEqual(capture.get(cv2.CAP_PROP_POS_FRAMES), 6)
+        self.assertAlmostEqual(capture.get(cv2.CAP_PROP_POS_MSEC), 6 / 25 * 1000)
+
+    def test_short_segment_pads_its_missing_frame_numbers(self):
+        capture = self._capture([3, 8, 4], pinned=[None, 10, None])
+
+        values = []
+        while True:
+            ok, frame = capture.read()
+            if not ok:
+                break
+            values.append(int(frame[0, 0, 0]))
+
+        self.assertEqual(values, [0, 1, 2] + list(range(100, 108)) + [0, 0] + list(range(200, 204)))
+        self.assertEqual(capture.get(cv2.CAP_PROP_FRAME_COUNT), 17)
+
+    def test_sequential_reads_match_seeks_across_a_short_segment(self):
+        sequential = self._capture([3, 8, 4], pinned=[None, 10, None])
+        frames = []
+        while True:
+            ok, frame = sequential.read()
+            if not ok:
+                break
+            frames.append(int(frame[0, 0, 0]))
+
+        seeking = self._capture([3, 8, 4], pinned=[None, 10, None])
+        for number, expected in enumerate(frames):
+            self.assertTrue(seeking.set(cv2.CAP_PROP_POS_FRAMES, number))
+            ok, frame = seeking.read()
+            self.assertTrue(ok)
+            self.assertEqual(int(frame[0, 0, 0]), expected, f"frame {number}")
+
+    def test_segment_that_cannot_be_opened_reads_as_black_frames(self):
+        capture = self._capture([3, 0, 2], pinned=[None, 4, None], unopenable={1})
+
+        with self.assertLogs("services.segmented_capture", level="WARNING"):
+            values = []
+            while True:
+                ok, frame = capture.read()
+                if not ok:
+                    break
+                values.append(int(frame[0, 0, 0]))
+
+            self.assertEqual(values, [0, 1, 2, 0, 0, 0, 0, 100 * 2, 100 * 2 + 1])
+            self.assertTrue(capture.set(cv2.CAP_PROP_POS_FRAMES, 5))
+            ok, frame = capture.read()
+        self.assertTrue(ok)
+        self.assertEqual(int(frame[0, 0, 0]), 0)
+        self.assertEqual(capture.get(cv2.CAP_PROP_POS_FRAMES), 6)
+
+    def test_opens_next_segment_ahead_of_the_boundary(self):
+        capture = self._capture([4, 2], prefetch_frames=2)
+
+        capture.read()
+        capture.read()
+        capture._prefetch[1].result()
+
+        self.assertEqual(self.opened[-1][0], "part1.mp4")
+        self.assertTrue(self.opened[-1][1].startswith("segment-prefetch"))
+        capture.read()
+        capture.read()
+        ok, frame = capture.read()
+        self.assertTrue(ok)
+        self.assertEqual(int(frame[0, 0, 0]), 100)
+        # Once while probing frame counts, once ahead of the boundary.
+        self.assertEqual(sum(1 for name, _thread in self.opened if name == "part1.mp4"), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import os
+import tempfile
+import time
+import unittest
+
+from services.staging_cache import StagingCache, StagingCancelledError
+
+
+class StagingCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.share = os.path.join(self.temp_dir.name, "share")
+        os.makedirs(self.share)
+        self.cache_dir = os.path.join(self.temp_dir.name, "cache")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _source(self, name, size):
+        path = os.path.join(self.share, name)
+        with open(path, "wb") as file:
+            file.write(os.urandom(size))
+        return path
+
+    def test_stage_copies_file_and_reuses_valid_copy(self):
+        source = self._source("mouse.avi", 300_000)
+        cache = StagingCache(self.cache_dir, 10_000_000, chunk_size=65_536)
+        progress = []
+
+        local = cache.stage(source, progress.append)
+
+        self.assertNotEqual(local, source)
+        with open(source, "rb") as original, open(local, "rb") as copy:
+            self.assertEqual(original.read(), copy.read())
+        self.assertEqual(progress[-1], 1.0)
+        self.assertEqual(StagingCache(self.cache_dir, 10_000_000).staged_path(source), local)
+
+    def test_modified_source_invalidates_copy(self):
+        source = self._source("mouse.avi", 1000)
+        cache = StagingCache(self.cache_dir, 10_000_000)
+        cache.stage(source)
+        with open(source, "ab") as file:
+            file.write(b"x")
+
+        self.assertIsNone(cache.staged_path(source))
+
+    def test_evicts_least_recently_used_by_total_bytes(self):
+        first = self._source("a.avi", 400)
+        second = self._source("b.avi", 400)
+        third = self._source("c.avi", 400)
+        cache = StagingCache(self.cache_dir, 1000)
+        cache.stage(first)
+        time.sleep(0.01)
+        cache.stage(second)
+        time.sleep(0.01)
+        cache.staged_path(first)
+        time.sleep(0.01)
+        cache.stage(third)
+
+        self.assertIsNotNone(cache.staged_path(first))
+        self.assertIsNone(cache.staged_path(second))
+        self.assertIsNotNone(cache.staged_path(third))
+        self.assertLessEqual(cache.total_bytes, 1000)
+
+    def test_cancel_leaves_no_partial_copy(self):
+        source = self._source("mouse.avi", 300_000)
+        cache = StagingCache(self.cache_dir, 10_000_000, chunk_size=65_536)
+
+        with self.assertRaises(StagingCancelledError):
+            cache.stage(source, should_continue=lambda: False)
+
+        self.assertIsNone(cache.staged_path(source))
+        self.assertEqual(
+            [name for name in os.listdir(self.cache_dir) if name.endswith(".part")],
+            [],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import logging
+import os
+import tempfile
+import threading
+import unittest
+
+from utils.stall_watchdog import StallWatchdog, action_scope, create_stall_logger, current_action, tracked_action
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 10.0
+
+    def __call__(self):
+        return self.now
+
+
+class StallWatchdogTest(unittest.TestCase):
+    def _watchdog(self, clock):
+        logger = logging.getLogger("tests.stalls")
+        return StallWatchdog(0.5, logger, threading.get_ident(), clock), logger
+
+    def test_logs_stack_and_action_once_per_stall(self):
+        clock = FakeClock()
+        watchdog, logger = self._watchdog(clock)
+
+        with self.assertLogs(logger, level="WARNING") as logs:
+            with action_scope("load_video"):
+                clock.now += 0.6
+                watchdog.check()
+                clock.now += 1.0
+                watchdog.check()
+            watchdog.heartbeat()
+            watchdog.check()
+
+        self.assertEqual(watchdog.stalls, 1)
+        self.assertEqual(len(logs.output), 2)
+        self.assertIn("600 ms, action: load_video", logs.output[0])
+        self.assertIn("test_logs_stack_and_action_once_per_stall", logs.output[0])
+        self.assertIn("ended after 1600 ms, action: load_video", logs.output[1])
+
+    def test_regular_heartbeats_never_log(self):
+        clock = FakeClock()
+        watchdog, logger = self._watchdog(clock)
+
+        with self.assertNoLogs(logger):
+            for _ in range(10):
+                clock.now += 0.2
+                watchdog.heartbeat()
+                watchdog.check()
+
+        self.assertEqual(watchdog.stalls, 0)
+
+    def test_tracked_actions_nest(self):
+        @tracked_action("save")
+        def save():
+            return current_action()
+
+        with action_scope("export"):
+            self.assertEqual(save(), "export > save")
+        self.assertEqual(current_action(), "-")
+
+    def test_logger_writes_rotating_file(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "logs", "stalls.log")
+            logger = create_stall_logger(path, max_bytes=2048, backups=1)
+            try:
+                for _ in range(100):
+                    logger.warning("GUI stall: %s", "x" * 100)
+            finally:
+                for handler in list(logger.handlers):
+                    logger.removeHandler(handler)
+                    handler.close()
+
+            self.assertTrue(os.path.exists(path))
+            self.assertTrue(os.path.exists(path + ".1"))
+            self.assertLessEqual(os.path.getsize(path), 2048)
+
+
+if __name__ == "__main__":
+    unittest.main()
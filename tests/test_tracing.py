@@ -0,0 +1,60 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from utils.tracing import Tracer
+
+
+class TracerTest(unittest.TestCase):
+    def test_records_nothing_while_disabled(self):
+        tracer = Tracer()
+        with tracer.span("load"):
+            pass
+        tracer.instant("hit")
+        tracer.stop("decode", tracer.start())
+
+        self.assertEqual(tracer.events(), [])
+
+    def test_spans_and_instants_use_chrome_trace_fields(self):
+        tracer = Tracer()
+        tracer.set_enabled(True)
+        with tracer.span("load_sidecar", "io", path="a.mp4"):
+            tracer.instant("thumbnail_hit", "thumbnail", frame=3)
+        tracer.complete("decode", 1.0, 1.5, "detection")
+
+        instant, span, decode = tracer.events()
+        self.assertEqual((span["name"], span["cat"], span["ph"]), ("load_sidecar", "io", "X"))
+        self.assertEqual(span["args"], {"path": "a.mp4"})
+        self.assertLessEqual(span["ts"], instant["ts"])
+        self.assertEqual((instant["ph"], instant["s"], instant["args"]), ("i", "t", {"frame": 3}))
+        self.assertAlmostEqual(decode["dur"], 500_000)
+        self.assertEqual(span["tid"], threading.get_ident())
+
+    def test_ring_buffer_keeps_the_newest_events(self):
+        tracer = Tracer(capacity=3)
+        tracer.set_enabled(True)
+        for index in range(5):
+            tracer.instant(f"event{index}")
+
+        self.assertEqual([event["name"] for event in tracer.events()], ["event2", "event3", "event4"])
+
+    def test_dump_writes_loadable_trace_with_thread_names(self):
+        tracer = Tracer()
+        tracer.set_enabled(True)
+        worker = threading.Thread(target=lambda: tracer.instant("range"), name="detector-1")
+        worker.start()
+        worker.join()
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = tracer.dump(os.path.join(folder, "trace.json"))
+            trace = json.loads(path.read_text(encoding="utf-8"))
+
+        names = [event["args"]["name"] for event in trace["traceEvents"] if event["ph"] == "M"]
+        self.assertEqual(names, ["detector-1"])
+        self.assertEqual(trace["traceEvents"][-1]["name"], "range")
+
+
+if __name__ == "__main__":
+    unittest.main()
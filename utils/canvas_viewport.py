@@ -0,0 +1,70 @@
+"""Zoom and pan math for the video canvas."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Tuple
+
+
+@dataclass
+class CanvasViewport:
+    """Region of a frame shown by the video canvas.
+
+    ``center_x`` and ``center_y`` are the centre of the visible region as
+    fractions of the frame width and height, so the state does not depend on
+    the frame resolution. A ``zoom`` of 1 shows the whole frame.
+    """
+
+    zoom: float = 1.0
+    center_x: float = 0.5
+    center_y: float = 0.5
+    max_zoom: float = 16.0
+
+    @property
+    def is_zoomed(self) -> bool:
+        return self.zoom > 1.0
+
+    def reset(self):
+        self.zoom = 1.0
+        self.center_x = 0.5
+        self.center_y = 0.5
+
+    def visible_rect(self, width: int, height: int) -> Tuple[int, int, int, int]:
+        """Return ``(x, y, w, h)`` of the visible region in a ``width`` x ``height`` frame."""
+        visible_width = max(1, min(width, int(round(width / self.zoom))))
+        visible_height = max(1, min(height, int(round(height / self.zoom))))
+        x = int(round(self.center_x * width - visible_width / 2))
+        y = int(round(self.center_y * height - visible_height / 2))
+        x = max(0, min(x, width - visible_width))
+        y = max(0, min(y, height - visible_height))
+        return x, y, visible_width, visible_height
+
+    def zoom_at(self, anchor_x: float, anchor_y: float, scale: float):
+        """Zoom by ``scale`` keeping the point under the anchor fixed.
+
+        The anchor is given as fractions of the visible region, e.g. the
+        mouse position over the displayed image.
+        """
+        if scale <= 0:
+            return
+        anchor_x = max(0.0, min(anchor_x, 1.0))
+        anchor_y = max(0.0, min(anchor_y, 1.0))
+        old_span = 1.0 / self.zoom
+        point_x = self.center_x - old_span / 2 + anchor_x * old_span
+        point_y = self.center_y - old_span / 2 + anchor_y * old_span
+        self.zoom = max(1.0, min(self.zoom * scale, self.max_zoom))
+        new_span = 1.0 / self.zoom
+        self.center_x = point_x - anchor_x * new_span + new_span / 2
+        self.center_y = point_y - anchor_y * new_span + new_span / 2
+        self._clamp()
+
+    def pan_by(self, delta_x: float, delta_y: float):
+        """Drag the image by fractions of the visible region."""
+        span = 1.0 / self.zoom
+        self.center_x -= delta_x * span
+        self.center_y -= delta_y * span
+        self._clamp()
+
+    def _clamp(self):
+        half = 0.5 / self.zoom
+        self.center_x = max(half, min(self.center_x, 1.0 - half))
+        self.center_y = max(half, min(self.center_y, 1.0 - half))
@@ -35,6 +35,34 @@ class Config:
             'freezing_merge_gap': 0.3,
             'freezing_min_non_freeze_gap': 0.2,
             'freezing_smoothing_window': 0.3,
+            'speculative_detection': False,  # 打开视频后以低优先级预先运行自动检测
+            'freezing_workers': 0,  # 自动检测解码线程数，0 表示按可用核心自动分配；没有关键帧索引时始终单线程顺序解码
+            'cpu_interactive_reserve': 1,  # 为播放和悬停预览保留的核心数
+            'cpu_background_yield': 0.005,  # 前台活跃时后台任务每步让出的时间（秒）
+            'metrics_prometheus_path': '',  # Prometheus 文本指标文件路径，留空不写
+            'metrics_jsonl_path': '',  # JSON lines 指标日志路径，留空不写
+            'metrics_interval': 15.0,  # 指标写入间隔（秒）
+            'staging_cache_dir': '',  # 网络盘视频的本地缓存目录，留空不启用
+            'staging_cache_max_gb': 20.0,  # 本地缓存总容量上限（GB）
+            'playback_ring_depth': 8,  # 播放预解码环形缓冲的帧数
+            'frame_cache_mb': 256,  # 播放头附近已解码帧缓存的内存上限（MB）
+            'frame_cache_backfill': 15,  # 随机定位时向前补解码并缓存的帧数，用于逐帧后退
+            'media_index_enabled': True,  # 首次打开视频时后台扫描关键帧和逐帧时间戳，保存为同名 .vtidx（需要 PyAV）
+            'media_index_full_decode': False,  # 未安装 PyAV 时改用 OpenCV 逐帧解码扫描索引，较慢且没有关键帧
+            'reverse_chunk_frames': 30,  # 倒放和逐帧后退时每次顺序解码的帧数
+            'reverse_buffer_mb': 512,  # 有关键帧索引时倒放按整个 GOP 解码，单个 GOP 超出此内存上限（MB）时分段解码
+            'playback_max_display_fps': 60,  # 高倍速播放时的最大刷新帧率，超出的帧直接跳过解码
+            'proxy_cache_dir': '',  # 代理文件（低分辨率全帧内）缓存目录，留空不启用；检测和导出仍使用原视频
+            'proxy_cache_max_gb': 10.0,  # 代理文件缓存总容量上限（GB）
+            'proxy_height': 360,  # 代理文件的画面高度（像素）
+            'decoder_pool_size': 3,  # 随机跳转用的常驻解码器数量，空闲时停靠在常访问的区段
+            'review_prefetch_mb': 768,  # 候选复核时预解码当前和下一个候选区间的内存上限（MB）
+            'review_margin_seconds': 1.0,  # 候选复核预解码时在区间前后各多解码的时长（秒）
+            'stall_log_path': '',  # 界面卡顿日志路径（按大小滚动），留空不启用卡顿监测
+            'stall_threshold_ms': 500,  # 事件循环无响应超过该时长（毫秒）即记录界面线程调用栈，0 表示关闭
+            'stall_log_max_kb': 1024,  # 单个卡顿日志文件的大小上限（KB）
+            'stall_log_backups': 3,  # 保留的历史卡顿日志文件数
+            'playback_backend': 'opencv',  # 正向播放后端：opencv 或 qtmultimedia；逐帧、倒放和暂停画面始终由 OpenCV 解码
         }
 
     def get(self, key: str, default: Any = None) -> Any:
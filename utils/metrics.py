@@ -0,0 +1,228 @@
+"""Counters, gauges and histograms written to Prometheus text files and JSON lines."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from datetime import datetime, timezone
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+METRIC_PREFIX = "videotimer_"
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, object]) -> LabelKey:
+    return tuple(sorted((str(key), str(value)) for key, value in labels.items()))
+
+
+def _format_labels(labels: Iterable[Tuple[str, str]]) -> str:
+    parts = []
+    for key, value in labels:
+        escaped = value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        parts.append(f'{key}="{escaped}"')
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _Histogram:
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float):
+        index = bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.count += 1
+        self.total += value
+
+    def cumulative(self) -> List[int]:
+        running = 0
+        result = []
+        for count in self.counts:
+            running += count
+            result.append(running)
+        return result
+
+
+class MetricsRegistry:
+    """Thread-safe in-process metrics store.
+
+    Names are given without the ``videotimer_`` prefix; counters get a
+    ``_total`` suffix when rendered for Prometheus.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._gauges: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, _Histogram]] = {}
+
+    def inc(self, name: str, value: float = 1.0, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + value
+
+    def set_gauge(self, name: str, value: float, **labels):
+        with self._lock:
+            self._gauges.setdefault(name, {})[_label_key(labels)] = float(value)
+
+    def add_gauge(self, name: str, delta: float, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            series = self._gauges.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + delta
+
+    def observe(self, name: str, value: float, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram(self.buckets)
+            histogram.observe(float(value))
+
+    def counter_value(self, name: str, **labels) -> float:
+        with self._lock:
+            return self._counters.get(name, {}).get(_label_key(labels), 0.0)
+
+    def gauge_value(self, name: str, **labels) -> float:
+        with self._lock:
+            return self._gauges.get(name, {}).get(_label_key(labels), 0.0)
+
+    def render_prometheus(self) -> str:
+        """Render all series in the Prometheus text exposition format."""
+        lines: List[str] = []
+        with self._lock:
+            uptime = time.time() - self.started_at
+            lines.append(f"# TYPE {METRIC_PREFIX}uptime_seconds gauge")
+            lines.append(f"{METRIC_PREFIX}uptime_seconds {uptime:.3f}")
+            for name in sorted(self._counters):
+                metric = f"{METRIC_PREFIX}{name}_total"
+                lines.append(f"# TYPE {metric} counter")
+                for labels, value in sorted(self._counters[name].items()):
+                    lines.append(f"{metric}{_format_labels(labels)} {value:g}")
+            for name in sorted(self._gauges):
+                metric = f"{METRIC_PREFIX}{name}"
+                lines.append(f"# TYPE {metric} gauge")
+                for labels, value in sorted(self._gauges[name].items()):
+                    lines.append(f"{metric}{_format_labels(labels)} {value:g}")
+            for name in sorted(self._histograms):
+                metric = f"{METRIC_PREFIX}{name}"
+                lines.append(f"# TYPE {metric} histogram")
+                for labels, histogram in sorted(self._histograms[name].items()):
+                    for bound, count in zip(histogram.buckets, histogram.cumulative()):
+                        bucket_labels = labels + (("le", f"{bound:g}"),)
+                        lines.append(f"{metric}_bucket{_format_labels(bucket_labels)} {count}")
+                    inf_labels = labels + (("le", "+Inf"),)
+                    lines.append(f"{metric}_bucket{_format_labels(inf_labels)} {histogram.count}")
+                    lines.append(f"{metric}_sum{_format_labels(labels)} {histogram.total:.6f}")
+                    lines.append(f"{metric}_count{_format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict[str, object]:
+        """Return a JSON-serialisable view of all series."""
+
+        def series_name(name: str, labels: LabelKey) -> str:
+            return name + _format_labels(labels)
+
+        with self._lock:
+            return {
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "uptime_seconds": round(time.time() - self.started_at, 3),
+                "counters": {
+                    series_name(name, labels): value
+                    for name, series in self._counters.items()
+                    for labels, value in series.items()
+                },
+                "gauges": {
+                    series_name(name, labels): value
+                    for name, series in self._gauges.items()
+                    for labels, value in series.items()
+                },
+                "histograms": {
+                    series_name(name, labels): {
+                        "count": histogram.count,
+                        "sum": round(histogram.total, 6),
+                        "mean": round(histogram.total / histogram.count, 6) if histogram.count else 0.0,
+                    }
+                    for name, series in self._histograms.items()
+                    for labels, histogram in series.items()
+                },
+            }
+
+
+class MetricsWriter:
+    """Periodically write a registry to a Prometheus text file and a JSON lines log."""
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        prometheus_path: Optional[str] = None,
+        jsonl_path: Optional[str] = None,
+        interval: float = 15.0,
+    ):
+        self.registry = registry
+        self.prometheus_path = Path(prometheus_path) if prometheus_path else None
+        self.jsonl_path = Path(jsonl_path) if jsonl_path else None
+        self.interval = max(0.5, float(interval))
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="metrics-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the writer thread and flush one final sample."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        try:
+            self.write_once()
+        except OSError:
+            # Shutdown continues even when the last sample cannot be written.
+            pass
+
+    def write_once(self):
+        if self.prometheus_path is not None:
+            self.prometheus_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so scrapers never read a partial file.
+            temp_path = self.prometheus_path.with_name(self.prometheus_path.name + ".tmp")
+            temp_path.write_text(self.registry.render_prometheus(), encoding="utf-8")
+            os.replace(temp_path, self.prometheus_path)
+        if self.jsonl_path is not None:
+            self.jsonl_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.jsonl_path.open("a", encoding="utf-8") as file:
+                file.write(json.dumps(self.registry.snapshot(), ensure_ascii=False) + "\n")
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.write_once()
+            except OSError:
+                # A full or unreachable disk must not take down the application.
+                continue
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    """Return the process-wide metrics registry."""
+    return _registry
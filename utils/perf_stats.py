@@ -0,0 +1,58 @@
+"""Rolling stage timings for the on-screen performance overlay."""
+from __future__ import annotations
+
+from collections import deque
+import time
+from typing import Deque, Dict, Optional
+
+
+class PerfStats:
+    """Recent per-stage timings, recorded only while enabled.
+
+    Hot paths bracket their work with :meth:`start` and :meth:`stop`. While
+    disabled, ``start`` returns ``None`` and ``stop`` returns at once, so
+    instrumented code pays one attribute check per call. Each stage keeps its
+    last ``window`` samples; deque appends are atomic, so decoder threads
+    may record alongside the GUI thread.
+    """
+
+    def __init__(self, window: int = 120):
+        self.window = max(1, int(window))
+        self.enabled = False
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def set_enabled(self, enabled: bool):
+        if enabled and not self.enabled:
+            self._samples = {}
+        self.enabled = bool(enabled)
+
+    def start(self) -> Optional[float]:
+        return time.perf_counter() if self.enabled else None
+
+    def stop(self, stage: str, started: Optional[float]):
+        if started is not None:
+            self.record(stage, time.perf_counter() - started)
+
+    def record(self, stage: str, seconds: float):
+        samples = self._samples.get(stage)
+        if samples is None:
+            samples = self._samples.setdefault(stage, deque(maxlen=self.window))
+        samples.append(seconds)
+
+    def mean_ms(self, stage: str) -> Optional[float]:
+        samples = list(self._samples.get(stage, ()))
+        if not samples:
+            return None
+        return sum(samples) / len(samples) * 1000
+
+    def max_ms(self, stage: str) -> Optional[float]:
+        samples = list(self._samples.get(stage, ()))
+        return max(samples) * 1000 if samples else None
+
+
+_perf_stats = PerfStats()
+
+
+def get_perf_stats() -> PerfStats:
+    """Return the process-wide overlay timings."""
+    return _perf_stats
@@ -0,0 +1,147 @@
+"""Watchdog that logs where the GUI thread was stuck when its event loop stalls."""
+from __future__ import annotations
+
+from contextlib import contextmanager
+import functools
+import logging
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+import sys
+import threading
+import time
+import traceback
+from typing import Callable, Iterator, List, Optional
+
+from utils.tracing import get_tracer
+
+
+STALL_LOGGER_NAME = "videotimer.stalls"
+
+# Names of the user actions currently running on the GUI thread, innermost last.
+_actions: List[str] = []
+
+
+@contextmanager
+def action_scope(name: str) -> Iterator[None]:
+    """Mark ``name`` as the action in progress for stall reports and traces."""
+    tracer = get_tracer()
+    started = tracer.start()
+    _actions.append(name)
+    try:
+        yield
+    finally:
+        _actions.pop()
+        tracer.stop(name, started, "gui")
+
+
+def tracked_action(name: str):
+    """Decorator form of :func:`action_scope` for GUI entry points."""
+
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with action_scope(name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def current_action() -> str:
+    actions = list(_actions)
+    return " > ".join(actions) if actions else "-"
+
+
+def create_stall_logger(path: str, max_bytes: int = 1024 * 1024, backups: int = 3) -> logging.Logger:
+    """Return the stall logger writing to a rotating file at ``path``."""
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    logger = logging.getLogger(STALL_LOGGER_NAME)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+    handler = RotatingFileHandler(target, maxBytes=max(1024, int(max_bytes)), backupCount=max(0, int(backups)), encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+    logger.addHandler(handler)
+    return logger
+
+
+class StallWatchdog:
+    """Detect GUI event-loop stalls from a background thread.
+
+    A GUI timer calls :meth:`heartbeat`; the watchdog thread calls
+    :meth:`check` several times per ``threshold``. When no beat has arrived
+    for ``threshold`` seconds, the watched thread's Python stack is taken
+    from ``sys._current_frames()`` while it is still stuck and logged with
+    the action in progress. A second record with the total duration is
+    written once the event loop answers again, so a hang that never ends
+    still leaves its stack in the log.
+    """
+
+    def __init__(
+        self,
+        threshold: float,
+        logger: logging.Logger,
+        thread_id: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.threshold = max(0.01, float(threshold))
+        self.thread_id = threading.get_ident() if thread_id is None else thread_id
+        self.stalls = 0
+        self._logger = logger
+        self._clock = clock
+        self._last_beat = clock()
+        self._stall_started: Optional[float] = None
+        self._stall_action = "-"
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def heartbeat(self):
+        self._last_beat = self._clock()
+
+    def check(self):
+        last_beat = self._last_beat
+        if self._stall_started is not None:
+            if last_beat > self._stall_started:
+                self._logger.warning(
+                    "GUI stall ended after %.0f ms, action: %s",
+                    (last_beat - self._stall_started) * 1000,
+                    self._stall_action,
+                )
+                self._stall_started = None
+            return
+        stalled_for = self._clock() - last_beat
+        if stalled_for < self.threshold:
+            return
+        self._stall_started = last_beat
+        self._stall_action = current_action()
+        self.stalls += 1
+        frame = sys._current_frames().get(self.thread_id)
+        stack = "".join(traceback.format_stack(frame)) if frame is not None else "(stack unavailable)\n"
+        self._logger.warning(
+            "GUI stall: event loop silent for %.0f ms, action: %s\n%s",
+            stalled_for * 1000,
+            self._stall_action,
+            stack.rstrip("\n"),
+        )
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self.heartbeat()
+        self._thread = threading.Thread(target=self._run, name="stall-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.threshold / 4):
+            self.check()
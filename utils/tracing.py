@@ -0,0 +1,147 @@
+"""In-memory trace spans exported in the Chrome trace event format."""
+from __future__ import annotations
+
+from collections import deque
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Deque, Dict, List, Optional
+
+
+TRACE_ENV_VAR = "VIDEOTIMER_TRACE"
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "category", "args", "started")
+
+    def __init__(self, tracer: "Tracer", name: str, category: str, args: Dict[str, object]):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.started = 0.0
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.tracer.complete(self.name, self.started, time.perf_counter(), self.category, **self.args)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """Spans and instant events kept in a ring buffer while enabled.
+
+    Timestamps come from ``time.perf_counter`` so callers that already time
+    a stage can hand their start value to :meth:`stop` or :meth:`complete`.
+    While disabled, :meth:`span` returns a shared no-op context manager and
+    :meth:`start` returns ``None``, so instrumented code pays one attribute
+    check per call. Deque appends are atomic, so worker threads may record
+    alongside the GUI thread; the oldest events are dropped once
+    ``capacity`` is reached.
+    """
+
+    def __init__(self, capacity: int = 200_000):
+        self.capacity = max(1, int(capacity))
+        self.enabled = False
+        self._events: Deque[dict] = deque(maxlen=self.capacity)
+        self._thread_names: Dict[int, str] = {}
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+
+    def set_enabled(self, enabled: bool):
+        if enabled and not self.enabled:
+            self.clear()
+        self.enabled = bool(enabled)
+
+    def clear(self):
+        self._events = deque(maxlen=self.capacity)
+        self._thread_names = {}
+        self._origin = time.perf_counter()
+
+    def span(self, name: str, category: str = "app", **args):
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, category, args)
+
+    def start(self) -> Optional[float]:
+        return time.perf_counter() if self.enabled else None
+
+    def stop(self, name: str, started: Optional[float], category: str = "app", **args):
+        if started is not None:
+            self.complete(name, started, time.perf_counter(), category, **args)
+
+    def complete(self, name: str, started: float, ended: float, category: str = "app", **args):
+        if not self.enabled:
+            return
+        event = self._event(name, category, "X", started)
+        event["dur"] = max(0.0, (ended - started) * 1_000_000)
+        if args:
+            event["args"] = args
+        self._events.append(event)
+
+    def instant(self, name: str, category: str = "app", **args):
+        if not self.enabled:
+            return
+        event = self._event(name, category, "i", time.perf_counter())
+        event["s"] = "t"
+        if args:
+            event["args"] = args
+        self._events.append(event)
+
+    def events(self) -> List[dict]:
+        return list(self._events)
+
+    def to_chrome_trace(self) -> dict:
+        """Return the recorded events as a Chrome trace JSON object."""
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid, "args": {"name": name}}
+            for tid, name in sorted(self._thread_names.items())
+        ]
+        return {"traceEvents": metadata + self.events(), "displayTimeUnit": "ms"}
+
+    def dump(self, path: str) -> Path:
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = target.with_name(f".{target.name}.tmp")
+        with temp_path.open("w", encoding="utf-8") as handle:
+            json.dump(self.to_chrome_trace(), handle, ensure_ascii=False, default=str)
+        os.replace(temp_path, target)
+        return target
+
+    def _event(self, name: str, category: str, phase: str, at: float) -> dict:
+        tid = threading.get_ident()
+        if tid not in self._thread_names:
+            self._thread_names[tid] = threading.current_thread().name
+        return {
+            "name": name,
+            "cat": category,
+            "ph": phase,
+            "ts": (at - self._origin) * 1_000_000,
+            "pid": self._pid,
+            "tid": tid,
+        }
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Return the process-wide tracer."""
+    return _tracer
@@ -0,0 +1,227 @@
+"""Side-by-side comparison of several videos played in lockstep."""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+import cv2
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtWidgets import (
+    QComboBox,
+    QGridLayout,
+    QHBoxLayout,
+    QLabel,
+    QPushButton,
+    QSlider,
+    QStyle,
+    QVBoxLayout,
+    QWidget,
+)
+
+from models.annotation_model import AnnotationModel
+from services.compare_playback import ComparePlayback, CompareSource
+from services.media_index import load_media_index
+from services.resource_scheduler import CONTEXT_COMPARE, get_resource_scheduler
+from services.segmented_capture import open_video_capture
+from utils.config import Config
+from utils.time_formatter import TimeFormatter
+from utils.timeline_viewport import TimelineViewport
+from views.qt.widgets.timeline import IntervalTrackWidget
+from views.qt.widgets.video_canvas import VideoCanvas
+
+
+MIN_COMPARE_VIDEOS = 2
+MAX_COMPARE_VIDEOS = 4
+
+
+def open_compare_source(video_path: str) -> Optional[CompareSource]:
+    """Read frame rate and frame count of ``video_path``; ``None`` if it cannot be opened."""
+    media_index = load_media_index(video_path)
+    capture = open_video_capture(video_path)
+    try:
+        if not capture.isOpened():
+            return None
+        fps = capture.get(cv2.CAP_PROP_FPS) or 30.0
+        total_frames = int(capture.get(cv2.CAP_PROP_FRAME_COUNT))
+    finally:
+        capture.release()
+    if media_index is not None:
+        total_frames = media_index.frame_count
+        fps = media_index.average_fps or fps
+    if total_frames <= 0:
+        return None
+    return CompareSource(video_path, fps, total_frames, media_index)
+
+
+class CompareWorkspace(QWidget):
+    """Window playing two to four videos on one shared clock.
+
+    Each video has its own canvas, its own decode-ahead thread and its own
+    read-only interval track loaded from its annotation sidecar. The GUI
+    timer only polls the decoded frames and paints them; seeking from the
+    shared slider or from any track moves every video to the same time.
+    """
+
+    def __init__(self, sources: Sequence[CompareSource], parent: QWidget | None = None):
+        super().__init__(parent, Qt.WindowType.Window)
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        self.config = Config()
+        self.time_formatter = TimeFormatter()
+        self.resource_scheduler = get_resource_scheduler()
+        self.playback = ComparePlayback(
+            sources,
+            int(self.config.get("playback_ring_depth", 8)),
+            max_display_fps=float(self.config.get("playback_max_display_fps", 60)),
+        )
+        self.canvases: List[VideoCanvas] = []
+        self.tracks: List[IntervalTrackWidget] = []
+        self.playing = False
+
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.poll_timer.timeout.connect(self._present_frames)
+
+        self.setWindowTitle("多视频对比")
+        self.resize(1400, 900)
+        self._build_ui()
+        self.playback.seek(0.0)
+        self._start_polling()
+
+    def _build_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(8, 8, 8, 8)
+
+        grid = QGridLayout()
+        columns = 2
+        for index, source in enumerate(self.playback.sources):
+            pane = QVBoxLayout()
+            pane.addWidget(QLabel(Path(source.video_path).name))
+            canvas = VideoCanvas()
+            canvas.setMinimumSize(320, 180)
+            pane.addWidget(canvas, 1)
+            grid.addLayout(pane, index // columns, index % columns)
+            self.canvases.append(canvas)
+        layout.addLayout(grid, 1)
+
+        controls = QHBoxLayout()
+        self.play_button = QPushButton("播放")
+        self.play_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaPlay))
+        self.play_button.clicked.connect(self.toggle_playback)
+        controls.addWidget(self.play_button)
+
+        self.speed_combo = QComboBox()
+        self.speed_combo.addItems(["0.5x", "0.8x", "1.0x", "1.5x", "2.0x", "3.0x", "4.0x"])
+        self.speed_combo.setCurrentText("1.0x")
+        self.speed_combo.currentTextChanged.connect(self._on_speed_changed)
+        controls.addWidget(self.speed_combo)
+
+        self.position_slider = QSlider(Qt.Orientation.Horizontal)
+        self.position_slider.setRange(0, max(1, int(self.playback.duration * 1000)))
+        self.position_slider.sliderMoved.connect(lambda value: self.seek_to_time(value / 1000))
+        controls.addWidget(self.position_slider, 1)
+
+        self.time_label = QLabel()
+        controls.addWidget(self.time_label)
+        layout.addLayout(controls)
+
+        for source in self.playback.sources:
+            viewport = TimelineViewport()
+            viewport.set_video(source.total_frames, source.fps)
+            track = IntervalTrackWidget(viewport)
+            track.set_title(Path(source.video_path).name)
+            track.set_intervals(self._load_intervals(source))
+            track.seek_requested.connect(lambda frame, source=source: self.seek_to_time(source.frame_time(frame)))
+            layout.addWidget(track)
+            self.tracks.append(track)
+        self._update_time_label()
+
+    def _load_intervals(self, source: CompareSource):
+        model = AnnotationModel()
+        model.set_video_context(source.video_path, source.fps, source.total_frames)
+        try:
+            model.load_sidecar(source.video_path)
+        except Exception:
+            # A broken sidecar should not keep the videos from being compared.
+            return []
+        return model.intervals
+
+    def toggle_playback(self):
+        if self.playing:
+            self._pause()
+        else:
+            self._play()
+
+    def seek_to_time(self, seconds: float):
+        self.playback.seek(seconds)
+        self._update_time_label()
+        self._start_polling()
+
+    def _play(self):
+        self.playback.play(self._speed())
+        self.playing = True
+        self.resource_scheduler.set_foreground(CONTEXT_COMPARE, True)
+        for canvas in self.canvases:
+            canvas.set_fast_scaling(True)
+        self.play_button.setText("暂停")
+        self.play_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaPause))
+        self._start_polling()
+
+    def _pause(self):
+        self.playback.pause()
+        self.playing = False
+        self.resource_scheduler.set_foreground(CONTEXT_COMPARE, False)
+        for canvas in self.canvases:
+            canvas.set_fast_scaling(False)
+        self.play_button.setText("播放")
+        self.play_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaPlay))
+
+    def _speed(self) -> float:
+        return max(float(self.speed_combo.currentText().rstrip("x")), 0.01)
+
+    def _on_speed_changed(self):
+        self.playback.set_speed(self._speed())
+        if self.playback.playing:
+            self._start_polling()
+
+    def _start_polling(self):
+        # Poll at twice the fastest display rate so no video waits a whole frame.
+        fastest = max(source.fps for source in self.playback.sources) * self.playback.speed
+        display_rate = min(max(fastest, 1.0), self.playback.max_display_fps)
+        self.poll_timer.start(max(1, int(1000 / (display_rate * 2))))
+
+    def _present_frames(self):
+        for canvas, track, item in zip(self.canvases, self.tracks, self.playback.poll()):
+            if item is None:
+                continue
+            frame_index, frame = item
+            # Ring slots are reused by the decoder, so the canvas keeps a copy.
+            canvas.set_frame(frame.copy())
+            track.set_current_frame(frame_index)
+        self._update_time_label()
+        if not self.playback.playing:
+            if self.playing:
+                # The shared clock reached the end of the longest video.
+                self._pause()
+            if self.playback.shown_frames == self.playback.target_frames():
+                self.poll_timer.stop()
+
+    def _update_time_label(self):
+        position = self.playback.position
+        if not self.position_slider.isSliderDown():
+            self.position_slider.setValue(int(position * 1000))
+        self.time_label.setText(
+            f"{self.time_formatter.format_time(position)} / {self.time_formatter.format_time(self.playback.duration)}"
+        )
+
+    def keyPressEvent(self, event):
+        if event.key() == Qt.Key.Key_Space:
+            self.toggle_playback()
+            return
+        super().keyPressEvent(event)
+
+    def closeEvent(self, event):
+        self.poll_timer.stop()
+        if self.playing:
+            self._pause()
+        self.playback.stop()
+        event.accept()
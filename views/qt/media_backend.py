@@ -0,0 +1,130 @@
+"""Optional QtMultimedia backend for forward playback."""
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+from PySide6.QtCore import QObject, QUrl, Signal
+from PySide6.QtGui import QImage
+
+from services.media_index import MediaIndex, frame_for_timestamp
+from utils.perf_stats import get_perf_stats
+
+
+PLAYBACK_BACKEND_OPENCV = "opencv"
+PLAYBACK_BACKEND_QT = "qtmultimedia"
+
+
+def qt_multimedia_available() -> bool:
+    """True when QtMultimedia and the system media libraries it links against load."""
+    try:
+        import PySide6.QtMultimedia  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def video_frame_to_bgr(video_frame) -> Optional[np.ndarray]:
+    """Copy a ``QVideoFrame`` into a BGR array, or return ``None`` if it cannot be mapped."""
+    image = video_frame.toImage()
+    if image.isNull():
+        return None
+    image = image.convertToFormat(QImage.Format.Format_BGR888)
+    width, height = image.width(), image.height()
+    rows = np.frombuffer(image.constBits(), dtype=np.uint8, count=image.sizeInBytes())
+    rows = rows.reshape(height, image.bytesPerLine())
+    return rows[:, : width * 3].reshape(height, width, 3).copy()
+
+
+class QtMediaPlayback(QObject):
+    """Forward playback decoded by ``QMediaPlayer`` into a ``QVideoSink``.
+
+    QtMultimedia demuxes, decodes and paces frames on its own threads with
+    its own buffering. Each delivered frame's start time is mapped back to a
+    source frame number with :func:`frame_for_timestamp`, using the media
+    index when there is one, so the workbench keeps numbering frames exactly
+    like the OpenCV path. Only presentation during playback goes through
+    here; paused frames, stepping and reverse playback stay on OpenCV.
+
+    Raises:
+        ImportError: QtMultimedia is not available.
+    """
+
+    frame_ready = Signal(int, object)
+    failed = Signal(str)
+    finished = Signal()
+
+    def __init__(
+        self,
+        video_path: str,
+        fps: float,
+        total_frames: int,
+        media_index: Optional[MediaIndex] = None,
+        parent: QObject | None = None,
+    ):
+        super().__init__(parent)
+        from PySide6.QtMultimedia import QMediaPlayer, QVideoSink
+
+        self.fps = fps
+        self.total_frames = total_frames
+        self.media_index = media_index
+        self._playing_state = QMediaPlayer.PlaybackState.PlayingState
+        self._end_of_media = QMediaPlayer.MediaStatus.EndOfMedia
+        self._last_frame = -1
+        self._player = QMediaPlayer(self)
+        self._sink = QVideoSink(self)
+        self._player.setVideoOutput(self._sink)
+        self._player.setSource(QUrl.fromLocalFile(video_path))
+        self._sink.videoFrameChanged.connect(self._on_video_frame)
+        self._player.errorOccurred.connect(lambda _error, message: self.failed.emit(message))
+        self._player.mediaStatusChanged.connect(self._on_media_status)
+
+    def play(self, frame: int, rate: float):
+        """Start presenting after ``frame``, which is already on screen, at ``rate`` times normal speed."""
+        self._last_frame = int(frame)
+        self._player.setPlaybackRate(rate)
+        self._player.setPosition(self._position_ms(frame))
+        self._player.play()
+
+    def seek(self, frame: int):
+        self._last_frame = int(frame) - 1
+        self._player.setPosition(self._position_ms(frame))
+
+    def set_rate(self, rate: float):
+        self._player.setPlaybackRate(rate)
+
+    def pause(self):
+        self._player.pause()
+
+    def release(self):
+        self._player.stop()
+        self._player.setSource(QUrl())
+
+    def _position_ms(self, frame: int) -> int:
+        frame = max(0, min(int(frame), max(0, self.total_frames - 1)))
+        if self.media_index is not None and frame < self.media_index.frame_count:
+            seconds = float(self.media_index.pts[frame])
+        else:
+            seconds = frame / self.fps if self.fps > 0 else 0.0
+        return int(round(seconds * 1000))
+
+    def _on_video_frame(self, video_frame):
+        if not video_frame.isValid() or self._player.playbackState() != self._playing_state:
+            return
+        start_us = video_frame.startTime()
+        seconds = start_us / 1_000_000 if start_us >= 0 else self._player.position() / 1000
+        frame_index = frame_for_timestamp(seconds, self.fps, self.total_frames, self.media_index)
+        if frame_index <= self._last_frame:
+            return
+        perf = get_perf_stats()
+        started = perf.start()
+        image = video_frame_to_bgr(video_frame)
+        perf.stop("convert", started)
+        if image is None:
+            return
+        self._last_frame = frame_index
+        self.frame_ready.emit(frame_index, image)
+
+    def _on_media_status(self, status):
+        if status == self._end_of_media:
+            self.finished.emit()
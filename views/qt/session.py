@@ -1,7 +1,7 @@
 """Per-video session state for the Qt workbench."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
@@ -9,6 +9,7 @@ from PySide6.QtGui import QUndoStack
 
 from models.annotation_model import AnnotationModel
 from services.video_crop_service import CROP_LOWER, CROP_UPPER, clamp_split_ratio
+from utils.canvas_viewport import CanvasViewport
 from views.qt.widgets.video_canvas import VideoCanvas
 
 
@@ -56,3 +57,4 @@ class VideoSession:
     split_ratio: Optional[float] = None
     loaded_sidecar: bool = False
     metadata_dirty: bool = False
+    viewport: CanvasViewport = field(default_factory=CanvasViewport)
@@ -4,11 +4,15 @@ from __future__ import annotations
 from collections import OrderedDict
 from typing import Optional
 
-import cv2
 from PySide6.QtCore import QSize, Qt
 from PySide6.QtGui import QPixmap
 
+from services.media_index import MediaIndex, seek_capture
+from services.resource_scheduler import CONTEXT_PREVIEW, get_resource_scheduler
+from services.segmented_capture import open_video_capture
 from services.video_crop_service import apply_horizontal_crop
+from utils.metrics import get_metrics
+from utils.tracing import get_tracer
 from views.qt.widgets.video_canvas import frame_to_pixmap
 
 
@@ -19,12 +23,14 @@ class ThumbnailCache:
         self.max_items = max_items
         self.capture = None
         self.total_frames = 0
+        self.media_index: Optional[MediaIndex] = None
         self.cache: OrderedDict[tuple[int, Optional[str], Optional[float]], QPixmap] = OrderedDict()
 
-    def load_video(self, video_path: str, total_frames: int):
+    def load_video(self, video_path: str, total_frames: int, media_index: Optional[MediaIndex] = None):
         self.release()
-        self.capture = cv2.VideoCapture(video_path)
+        self.capture = open_video_capture(video_path)
         self.total_frames = max(0, int(total_frames))
+        self.media_index = media_index
         self.cache.clear()
 
     def get(
@@ -38,28 +44,45 @@ class ThumbnailCache:
             return None
         frame = max(0, min(int(frame), max(0, self.total_frames - 1)))
         cache_key = (frame, crop_role, round(split_ratio, 6) if split_ratio is not None else None)
+        metrics = get_metrics()
         if cache_key in self.cache:
             pixmap = self.cache.pop(cache_key)
             self.cache[cache_key] = pixmap
+            metrics.inc("cache_requests", cache="thumbnail", result="hit")
+            get_tracer().instant("thumbnail_hit", "thumbnail", frame=frame)
             return pixmap
+        metrics.inc("cache_requests", cache="thumbnail", result="miss")
 
-        self.capture.set(cv2.CAP_PROP_POS_FRAMES, frame)
-        ok, image = self.capture.read()
+        tracer = get_tracer()
+        with tracer.span("thumbnail_decode", "thumbnail", frame=frame), get_resource_scheduler().foreground(CONTEXT_PREVIEW):
+            seek_capture(self.capture, frame, self.media_index)
+            ok, image = self.capture.read()
         if not ok:
             return None
-        image = apply_horizontal_crop(image, crop_role, split_ratio)
-        pixmap = frame_to_pixmap(image).scaled(
-            size,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
-        )
+        metrics.inc("frames_decoded", source="thumbnail")
+        with tracer.span("thumbnail_scale", "thumbnail", frame=frame):
+            image = apply_horizontal_crop(image, crop_role, split_ratio)
+            pixmap = frame_to_pixmap(image).scaled(
+                size,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
         self.cache[cache_key] = pixmap
         while len(self.cache) > self.max_items:
             self.cache.popitem(last=False)
         return pixmap
 
+    def read_frame(self, frame: int):
+        """Decode ``frame`` at the preview source's resolution, bypassing the cache."""
+        if self.capture is None or not self.capture.isOpened():
+            return False, None
+        with get_resource_scheduler().foreground(CONTEXT_PREVIEW):
+            seek_capture(self.capture, int(frame), self.media_index)
+            return self.capture.read()
+
     def release(self):
         if self.capture is not None:
             self.capture.release()
         self.capture = None
+        self.media_index = None
         self.cache.clear()
@@ -2,17 +2,22 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, List
 
 from PySide6.QtCore import QModelIndex, Signal
-from PySide6.QtWidgets import QFileSystemModel, QPushButton, QTreeView, QVBoxLayout, QWidget
+from PySide6.QtWidgets import QAbstractItemView, QFileSystemModel, QPushButton, QTreeView, QVBoxLayout, QWidget
 
 
 class FilePanel(QWidget):
-    """Video file browser with an explicit folder picker action."""
+    """Video file browser with an explicit folder picker action.
+
+    Several recording segments can be selected together and opened as one
+    session through ``segments_requested``.
+    """
 
     folder_requested = Signal()
     video_selected = Signal(str)
+    segments_requested = Signal(list)
 
     def __init__(self, video_extensions: Iterable[str], root_path: Path, parent: QWidget | None = None):
         super().__init__(parent)
@@ -38,9 +43,15 @@ class FilePanel(QWidget):
         self.file_tree.setHeaderHidden(True)
         for column in (1, 2, 3):
             self.file_tree.hideColumn(column)
+        self.file_tree.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.file_tree.doubleClicked.connect(self._on_file_double_clicked)
         layout.addWidget(self.file_tree, 1)
 
+        self.combine_segments_button = QPushButton("合并分段播放")
+        self.combine_segments_button.setToolTip("把选中的多个分段录像作为一个连续视频打开")
+        self.combine_segments_button.clicked.connect(self._on_combine_segments_clicked)
+        layout.addWidget(self.combine_segments_button)
+
     def set_root_folder(self, folder: str):
         self.file_model.setRootPath(folder)
         self.file_tree.setRootIndex(self.file_model.index(folder))
@@ -49,3 +60,17 @@ class FilePanel(QWidget):
         path = Path(self.file_model.filePath(index))
         if path.is_file() and path.suffix.lower() in self.video_extensions:
             self.video_selected.emit(str(path))
+
+    def selected_videos(self) -> List[str]:
+        paths = {
+            Path(self.file_model.filePath(index))
+            for index in self.file_tree.selectionModel().selectedIndexes()
+        }
+        return [
+            str(path)
+            for path in paths
+            if path.is_file() and path.suffix.lower() in self.video_extensions
+        ]
+
+    def _on_combine_segments_clicked(self):
+        self.segments_requested.emit(self.selected_videos())
@@ -16,10 +16,12 @@ class PlayerPanel(QWidget):
     fullscreen_requested = Signal()
     speed_changed = Signal()
     seek_requested = Signal(int)
+    scrub_requested = Signal(int)
     interval_created = Signal(int, int)
     interval_changed = Signal(str, int, int)
     interval_selected = Signal(str)
     thumbnail_requested = Signal(int, QPoint)
+    track_activated = Signal(int)
 
     def __init__(self, parent: QWidget | None = None):
         super().__init__(parent)
@@ -48,7 +50,7 @@ class PlayerPanel(QWidget):
         controls.addWidget(self.fullscreen_button)
 
         self.speed_combo = QComboBox()
-        self.speed_combo.addItems(["0.5x", "0.8x", "1.0x", "1.5x", "2.0x", "3.0x"])
+        self.speed_combo.addItems(["0.5x", "0.8x", "1.0x", "1.5x", "2.0x", "3.0x", "4.0x"])
         self.speed_combo.setCurrentText("1.0x")
         self.speed_combo.currentTextChanged.connect(lambda _text: self.speed_changed.emit())
         controls.addWidget(self.speed_combo)
@@ -63,8 +65,10 @@ class PlayerPanel(QWidget):
 
         self.timeline = TimelineWidget()
         self.timeline.seek_requested.connect(self.seek_requested.emit)
+        self.timeline.scrub_requested.connect(self.scrub_requested.emit)
         self.timeline.interval_created.connect(self.interval_created.emit)
         self.timeline.interval_changed.connect(self.interval_changed.emit)
         self.timeline.interval_selected.connect(self.interval_selected.emit)
         self.timeline.thumbnail_requested.connect(self.thumbnail_requested.emit)
+        self.timeline.track_activated.connect(self.track_activated.emit)
         layout.addWidget(self.timeline)
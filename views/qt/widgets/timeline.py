@@ -1,20 +1,27 @@
 """Timeline tracks for seeking and interval editing."""
 from __future__ import annotations
 
-from typing import Iterable, List, Optional
+from typing import Iterable, List, Optional, Sequence
 
 from PySide6.QtCore import QPoint, QRect, Qt, Signal
 from PySide6.QtGui import QColor, QCursor, QPainter, QPen
 from PySide6.QtWidgets import QHBoxLayout, QPushButton, QVBoxLayout, QWidget
 
 from models.annotation_model import AnnotationInterval
+from utils.perf_stats import get_perf_stats
 from utils.timeline_viewport import TimelineViewport
 
 
 class ProgressTrackWidget(QWidget):
-    """Seek-only progress track."""
+    """Seek-only progress track.
+
+    Dragging emits ``scrub_requested`` for every move and a final
+    ``seek_requested`` on release, so listeners can preview cheaply while the
+    mouse moves and decode exactly once it stops.
+    """
 
     seek_requested = Signal(int)
+    scrub_requested = Signal(int)
     thumbnail_requested = Signal(int, QPoint)
     zoom_requested = Signal(int, float)
 
@@ -32,6 +39,12 @@ class ProgressTrackWidget(QWidget):
         self.update()
 
     def paintEvent(self, event):
+        perf = get_perf_stats()
+        started = perf.start()
+        self._paint_track()
+        perf.stop("progress_paint", started)
+
+    def _paint_track(self):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.fillRect(self.rect(), QColor("#171a1f"))
@@ -76,6 +89,8 @@ class ProgressTrackWidget(QWidget):
         if event.button() != Qt.MouseButton.LeftButton or self.viewport.total_frames <= 0:
             return
         self._dragging = True
+        # The canvas follows the drag; a hover thumbnail would decode again on the GUI thread.
+        self.thumbnail_requested.emit(-1, QPoint())
         self._seek_from_x(int(event.position().x()))
         event.accept()
 
@@ -83,10 +98,11 @@ class ProgressTrackWidget(QWidget):
         if self.viewport.total_frames <= 0:
             return
         frame = self._x_to_frame(int(event.position().x()), seekable=True)
-        self.thumbnail_requested.emit(frame, event.globalPosition().toPoint())
         if self._dragging:
-            self.seek_requested.emit(frame)
+            self.scrub_requested.emit(frame)
             event.accept()
+            return
+        self.thumbnail_requested.emit(frame, event.globalPosition().toPoint())
 
     def mouseReleaseEvent(self, event):
         if event.button() != Qt.MouseButton.LeftButton:
@@ -142,11 +158,14 @@ class IntervalTrackWidget(QWidget):
     interval_selected = Signal(str)
     thumbnail_requested = Signal(int, QPoint)
     zoom_requested = Signal(int, float)
+    activated = Signal()
 
     def __init__(self, viewport: TimelineViewport):
         super().__init__()
         self.viewport = viewport
         self.current_frame = 0
+        self.title = ""
+        self.highlighted = False
         self.intervals: List[AnnotationInterval] = []
         self.selected_interval_id: Optional[str] = None
         self.pending_start_frame: Optional[int] = None
@@ -190,16 +209,35 @@ class IntervalTrackWidget(QWidget):
         self.selected_interval_id = interval_id
         self.update()
 
+    def set_title(self, title: str, highlighted: bool = False):
+        self.title = title
+        self.highlighted = highlighted
+        self.update()
+
     def paintEvent(self, event):
+        perf = get_perf_stats()
+        started = perf.start()
+        self._paint_track()
+        perf.stop("interval_paint", started)
+
+    def _paint_track(self):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.fillRect(self.rect(), QColor("#171a1f"))
 
         track = self._track_rect()
-        painter.setPen(QPen(QColor("#333841"), 1))
+        painter.setPen(QPen(QColor("#4a90d9" if self.highlighted else "#333841"), 1))
         painter.setBrush(QColor("#20242b"))
         painter.drawRoundedRect(track, 4, 4)
 
+        if self.title:
+            painter.setPen(QColor("#d7dbe0" if self.highlighted else "#8f969f"))
+            painter.drawText(
+                QRect(track.left(), 0, track.width(), track.top()),
+                Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                self.title,
+            )
+
         if self.viewport.total_frames <= 0:
             painter.setPen(QColor("#8f969f"))
             painter.drawText(track, Qt.AlignmentFlag.AlignCenter, "加载视频后显示标注轨道")
@@ -249,6 +287,7 @@ class IntervalTrackWidget(QWidget):
         if event.button() != Qt.MouseButton.LeftButton or self.viewport.total_frames <= 0:
             return
 
+        self.activated.emit()
         frame = self._x_to_frame(int(event.position().x()))
         seek_frame = self.viewport.clamp_frame(frame, seekable=True)
         hit_mode, interval = self._hit_test(event.position().toPoint())
@@ -444,16 +483,22 @@ class TimelineWidget(QWidget):
     """Two-track timeline with shared zoom/pan viewport."""
 
     seek_requested = Signal(int)
+    scrub_requested = Signal(int)
     interval_created = Signal(int, int)
     interval_changed = Signal(str, int, int)
     interval_selected = Signal(str)
     thumbnail_requested = Signal(int, QPoint)
+    track_activated = Signal(int)
 
     def __init__(self):
         super().__init__()
         self.viewport = TimelineViewport()
         self.progress_track = ProgressTrackWidget(self.viewport)
         self.interval_track = IntervalTrackWidget(self.viewport)
+        # Second interval track shown under the same playhead in split view.
+        self.secondary_track = IntervalTrackWidget(self.viewport)
+        self.secondary_track.hide()
+        self.active_track = 0
 
         self.pan_left_button = QPushButton("<")
         self.pan_left_button.setFixedWidth(30)
@@ -477,45 +522,75 @@ class TimelineWidget(QWidget):
         layout.setSpacing(4)
         layout.addLayout(top_row)
         layout.addWidget(self.interval_track)
+        layout.addWidget(self.secondary_track)
 
         self.progress_track.seek_requested.connect(self.seek_requested.emit)
+        self.progress_track.scrub_requested.connect(self.scrub_requested.emit)
         self.progress_track.thumbnail_requested.connect(self.thumbnail_requested.emit)
         self.progress_track.zoom_requested.connect(self._zoom_visible)
-        self.interval_track.seek_requested.connect(self.seek_requested.emit)
-        self.interval_track.interval_created.connect(self.interval_created.emit)
-        self.interval_track.interval_changed.connect(self.interval_changed.emit)
-        self.interval_track.interval_selected.connect(self.interval_selected.emit)
-        self.interval_track.thumbnail_requested.connect(self.thumbnail_requested.emit)
-        self.interval_track.zoom_requested.connect(self._zoom_visible)
+        for index, track in enumerate(self.interval_tracks):
+            track.seek_requested.connect(self.seek_requested.emit)
+            track.interval_created.connect(self.interval_created.emit)
+            track.interval_changed.connect(self.interval_changed.emit)
+            track.interval_selected.connect(self.interval_selected.emit)
+            track.thumbnail_requested.connect(self.thumbnail_requested.emit)
+            track.zoom_requested.connect(self._zoom_visible)
+            track.activated.connect(lambda index=index: self.track_activated.emit(index))
 
         self.setMinimumHeight(132)
         self.setStyleSheet("background: #171a1f;")
         self._refresh_pan_buttons()
 
+    @property
+    def interval_tracks(self) -> List[IntervalTrackWidget]:
+        return [self.interval_track, self.secondary_track]
+
     @property
     def selected_interval_id(self) -> Optional[str]:
-        return self.interval_track.selected_interval_id
+        return self.interval_tracks[self.active_track].selected_interval_id
 
     def set_video(self, total_frames: int, fps: float):
         self.viewport.set_video(total_frames, fps)
         self.progress_track.set_current_frame(0)
-        self.interval_track.set_current_frame(0)
-        self.interval_track.reset_interaction()
+        for track in self.interval_tracks:
+            track.set_current_frame(0)
+            track.reset_interaction()
         self._sync_tracks()
 
-    def set_intervals(self, intervals: Iterable[AnnotationInterval]):
-        self.interval_track.set_intervals(intervals)
+    def set_split_tracks(self, titles: Optional[Sequence[str]]):
+        """Show one titled interval track per split session, or a single track for ``None``."""
+        if titles is None:
+            self.secondary_track.hide()
+            self.secondary_track.set_intervals([])
+            self.interval_track.set_title("")
+            self.set_active_track(0)
+            return
+        self.secondary_track.show()
+        for track, title in zip(self.interval_tracks, titles):
+            track.set_title(title, track is self.interval_tracks[self.active_track])
+
+    def set_active_track(self, index: int):
+        """Route selection and pending-start updates to track ``index``."""
+        if index != self.active_track:
+            self.interval_tracks[self.active_track].reset_interaction()
+        self.active_track = index
+        for track_index, track in enumerate(self.interval_tracks):
+            track.set_title(track.title, track_index == index and self.secondary_track.isVisibleTo(self))
+
+    def set_intervals(self, intervals: Iterable[AnnotationInterval], track: Optional[int] = None):
+        self.interval_tracks[self.active_track if track is None else track].set_intervals(intervals)
         self._refresh_pan_buttons()
 
     def set_current_frame(self, frame: int):
         self.progress_track.set_current_frame(frame)
-        self.interval_track.set_current_frame(frame)
+        for track in self.interval_tracks:
+            track.set_current_frame(frame)
 
     def set_pending_start(self, frame: Optional[int]):
-        self.interval_track.set_pending_start(frame)
+        self.interval_tracks[self.active_track].set_pending_start(frame)
 
     def set_selected_interval(self, interval_id: Optional[str]):
-        self.interval_track.set_selected_interval(interval_id)
+        self.interval_tracks[self.active_track].set_selected_interval(interval_id)
 
     def _zoom_visible(self, anchor_frame: int, scale: float):
         self.viewport.zoom_at_frame(anchor_frame, scale)
@@ -527,7 +602,8 @@ class TimelineWidget(QWidget):
 
     def _sync_tracks(self):
         self.progress_track.update()
-        self.interval_track.update()
+        for track in self.interval_tracks:
+            track.update()
         self._refresh_pan_buttons()
 
     def _refresh_pan_buttons(self):
@@ -1,59 +1,226 @@
 """Video display widgets and frame conversion helpers."""
 from __future__ import annotations
 
-from typing import Optional
+from typing import List, Optional
 
 import cv2
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QImage, QPixmap
+import numpy as np
+from PySide6.QtCore import QPoint, QPointF, QRectF, Qt, Signal
+from PySide6.QtGui import QColor, QFontDatabase, QImage, QPainter, QPixmap
 from PySide6.QtWidgets import QLabel
 
+from utils.canvas_viewport import CanvasViewport
+from utils.perf_stats import get_perf_stats
+
+
+def bgr_frame_to_image(frame) -> QImage:
+    """Wrap a BGR frame in a ``QImage`` without converting or copying pixels.
+
+    The image borrows ``frame``'s memory, so the frame must stay alive and
+    unchanged for as long as the image is used.
+    """
+    height, width = frame.shape[:2]
+    return QImage(frame.data, width, height, frame.strides[0], QImage.Format.Format_BGR888)
+
 
 def frame_to_pixmap(frame) -> QPixmap:
-    rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-    height, width, channels = rgb_frame.shape
-    image = QImage(
-        rgb_frame.data,
-        width,
-        height,
-        channels * width,
-        QImage.Format.Format_RGB888,
-    ).copy()
-    return QPixmap.fromImage(image)
+    return QPixmap.fromImage(bgr_frame_to_image(np.ascontiguousarray(frame)))
 
 
 class VideoCanvas(QLabel):
-    """Aspect-preserving video display surface."""
+    """Aspect-preserving video display surface.
+
+    Frames are scaled once in OpenCV to the widget's size in device pixels,
+    into a buffer that is reused while the size stays the same, and painted
+    straight from that buffer as BGR. While fast scaling is on, as during
+    playback, the cheaper bilinear filter is used; turning it off re-renders
+    the last frame with the smooth filter.
+
+    The mouse wheel zooms around the cursor and dragging pans. Only the
+    visible region of the frame is sliced out and scaled, so a zoomed view
+    costs less than the full frame. Double-click resets the zoom.
+
+    :meth:`set_hud_lines` draws a performance overlay in the top-left corner.
+    """
+
+    activated = Signal()
+    # Emitted when the widget size or the zoom changes the on-screen scale of frames.
+    scale_changed = Signal()
 
-    def __init__(self):
+    def __init__(self, viewport: Optional[CanvasViewport] = None):
         super().__init__("请选择视频")
-        self._source_pixmap: Optional[QPixmap] = None
+        self.viewport = viewport if viewport is not None else CanvasViewport()
+        self._frame: Optional[np.ndarray] = None
+        self._buffer: Optional[np.ndarray] = None
+        self._image: Optional[QImage] = None
+        self._fast_scaling = False
+        self._drag_position: Optional[QPointF] = None
+        self._hud_lines: List[str] = []
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.setMinimumSize(640, 360)
+        self.set_highlighted(False)
+
+    def set_frame(self, frame):
+        """Show ``frame``; the canvas keeps it for re-rendering, so it must not be modified."""
+        self._frame = frame
+        self._render()
+
+    def set_fast_scaling(self, enabled: bool):
+        if enabled == self._fast_scaling:
+            return
+        self._fast_scaling = enabled
+        if not enabled:
+            self._render()
+
+    def set_highlighted(self, highlighted: bool):
+        border = "#4a90d9" if highlighted else "#2f3338"
         self.setStyleSheet(
-            "QLabel { background: #0b0d10; color: #9aa0a6; border: 1px solid #2f3338; }"
+            f"QLabel {{ background: #0b0d10; color: #9aa0a6; border: 1px solid {border}; }}"
         )
 
-    def set_frame(self, frame):
-        self._source_pixmap = frame_to_pixmap(frame)
-        self._update_scaled_pixmap()
+    def set_hud_lines(self, lines: Optional[List[str]]):
+        """Show ``lines`` as an overlay; ``None`` or an empty list hides it."""
+        lines = list(lines or [])
+        if lines != self._hud_lines:
+            self._hud_lines = lines
+            self.update()
 
     def clear_frame(self):
-        self._source_pixmap = None
-        self.setPixmap(QPixmap())
+        self._frame = None
+        self._image = None
         self.setText("请选择视频")
+        self.update()
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        self._update_scaled_pixmap()
+        self._render()
+        self.scale_changed.emit()
 
-    def _update_scaled_pixmap(self):
-        if self._source_pixmap is None or self._source_pixmap.isNull():
+    def wheelEvent(self, event):
+        rect = self._image_rect()
+        if rect is None or event.angleDelta().y() == 0:
+            super().wheelEvent(event)
             return
-        scaled = self._source_pixmap.scaled(
-            self.size(),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
+        position = event.position()
+        self.viewport.zoom_at(
+            (position.x() - rect.left()) / rect.width(),
+            (position.y() - rect.top()) / rect.height(),
+            1.25 ** (event.angleDelta().y() / 120),
         )
-        self.setText("")
-        self.setPixmap(scaled)
+        self._update_cursor()
+        self._render()
+        self.scale_changed.emit()
+        event.accept()
+
+    def mousePressEvent(self, event):
+        self.activated.emit()
+        if event.button() == Qt.MouseButton.LeftButton and self.viewport.is_zoomed:
+            self._drag_position = event.position()
+            self.setCursor(Qt.CursorShape.ClosedHandCursor)
+            event.accept()
+            return
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        rect = self._image_rect()
+        if self._drag_position is None or rect is None:
+            super().mouseMoveEvent(event)
+            return
+        position = event.position()
+        delta = position - self._drag_position
+        self._drag_position = position
+        self.viewport.pan_by(delta.x() / rect.width(), delta.y() / rect.height())
+        self._render()
+        event.accept()
+
+    def mouseReleaseEvent(self, event):
+        if self._drag_position is not None and event.button() == Qt.MouseButton.LeftButton:
+            self._drag_position = None
+            self._update_cursor()
+            event.accept()
+            return
+        super().mouseReleaseEvent(event)
+
+    def mouseDoubleClickEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton and self.viewport.is_zoomed:
+            self.viewport.reset()
+            self._update_cursor()
+            self._render()
+            self.scale_changed.emit()
+            event.accept()
+            return
+        super().mouseDoubleClickEvent(event)
+
+    def paintEvent(self, event):
+        perf = get_perf_stats()
+        started = perf.start()
+        super().paintEvent(event)
+        if self._image is None and not self._hud_lines:
+            return
+        painter = QPainter(self)
+        if self._image is not None:
+            rect = self._image_rect()
+            # Whole-pixel offsets keep drawImage on its unscaled blit path.
+            painter.drawImage(QPoint(int(rect.left()), int(rect.top())), self._image)
+        if self._hud_lines:
+            self._paint_hud(painter)
+        painter.end()
+        perf.stop("canvas_paint", started)
+
+    def _paint_hud(self, painter: QPainter):
+        painter.setFont(QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont))
+        metrics = painter.fontMetrics()
+        width = max(metrics.horizontalAdvance(line) for line in self._hud_lines) + 16
+        height = metrics.height() * len(self._hud_lines) + 12
+        painter.fillRect(8, 8, width, height, QColor(0, 0, 0, 170))
+        painter.setPen(QColor("#8bea9f"))
+        for index, line in enumerate(self._hud_lines):
+            painter.drawText(16, 14 + metrics.ascent() + index * metrics.height(), line)
+
+    def _image_rect(self) -> Optional[QRectF]:
+        if self._image is None:
+            return None
+        ratio = self._image.devicePixelRatio()
+        width = self._image.width() / ratio
+        height = self._image.height() / ratio
+        return QRectF(int((self.width() - width) / 2), int((self.height() - height) / 2), width, height)
+
+    def _update_cursor(self):
+        if self.viewport.is_zoomed:
+            self.setCursor(Qt.CursorShape.OpenHandCursor)
+        else:
+            self.unsetCursor()
+
+    def _render(self):
+        frame = self._frame
+        if frame is None or frame.size == 0:
+            return
+        perf = get_perf_stats()
+        started = perf.start()
+        if self.viewport.is_zoomed:
+            x, y, width, height = self.viewport.visible_rect(frame.shape[1], frame.shape[0])
+            frame = frame[y:y + height, x:x + width]
+        ratio = self.devicePixelRatioF()
+        source_height, source_width = frame.shape[:2]
+        scale = min(self.width() * ratio / source_width, self.height() * ratio / source_height)
+        width = max(1, int(source_width * scale))
+        height = max(1, int(source_height * scale))
+        if (width, height) == (source_width, source_height) and frame.flags.c_contiguous:
+            image_data = frame
+        else:
+            if self._buffer is None or self._buffer.shape[:2] != (height, width):
+                self._buffer = np.empty((height, width, 3), dtype=np.uint8)
+            if self._fast_scaling:
+                interpolation = cv2.INTER_LINEAR
+            else:
+                # INTER_AREA avoids aliasing on strong downscales but is slow at
+                # non-integer ratios, where bicubic already looks clean.
+                interpolation = cv2.INTER_AREA if scale <= 0.5 else cv2.INTER_CUBIC
+            cv2.resize(frame, (width, height), dst=self._buffer, interpolation=interpolation)
+            image_data = self._buffer
+        self._image = bgr_frame_to_image(image_data)
+        self._image.setDevicePixelRatio(ratio)
+        perf.stop("scale", started)
+        if self.text():
+            self.setText("")
+        self.update()
@@ -1,7 +1,10 @@
 """Main PySide6 annotation workbench."""
 from __future__ import annotations
 
+import math
+import os
 from pathlib import Path
+import time
 from typing import List, Optional
 from uuid import uuid4
 
@@ -12,6 +15,7 @@ from PySide6.QtWidgets import (
     QApplication,
     QDialog,
     QFileDialog,
+    QHBoxLayout,
     QInputDialog,
     QLabel,
     QLineEdit,
@@ -28,17 +32,50 @@ from models.annotation_model import DEFAULT_LABEL, AnnotationInterval, Annotatio
 from models.export_types import ExportType
 from models.video_model import VideoModel
 from services.annotation_export_adapter import intervals_to_time_records
+from services.decoder_pool import DecoderPool
+from services.detection_cache import DetectionResultCache, detection_cache_key
 from services.export_service import ExportService
+from services.frame_cache import FrameCache
+from services.media_index import MediaIndex, load_media_index, pyav_available
 from services.freezing_detection_service import FreezingDetectionParams, FreezingInterval
+from services.proxy_cache import ProxyCache
+from services.review_prefetch import RangePrefetcher
+from services.segmented_capture import (
+    SEGMENT_MANIFEST_SUFFIX,
+    is_segment_manifest,
+    manifest_path_for,
+    open_video_capture,
+    write_segment_manifest,
+)
+from services.playback_engine import DecodeAheadBuffer, PlaybackClock, ReverseDecodeBuffer, ScrubDecoder
+from services.resource_scheduler import CONTEXT_PLAYBACK, get_resource_scheduler
+from services.staging_cache import StagingCache
 from services.video_crop_service import (
     CROP_LOWER,
     CROP_UPPER,
     apply_horizontal_crop,
     clamp_split_ratio,
+    horizontal_crop_bounds,
     logical_split_video_path,
 )
+from utils.canvas_viewport import CanvasViewport
 from utils.config import Config
+from utils.metrics import MetricsWriter, get_metrics
+from utils.perf_stats import get_perf_stats
+from utils.stall_watchdog import StallWatchdog, create_stall_logger, tracked_action
 from utils.time_formatter import TimeFormatter
+from utils.tracing import TRACE_ENV_VAR, get_tracer
+from views.qt.compare_workspace import (
+    MAX_COMPARE_VIDEOS,
+    MIN_COMPARE_VIDEOS,
+    CompareWorkspace,
+    open_compare_source,
+)
+from views.qt.media_backend import (
+    PLAYBACK_BACKEND_QT,
+    QtMediaPlayback,
+    qt_multimedia_available,
+)
 from views.qt.commands import (
     AddIntervalCommand,
     DeleteIntervalCommand,
@@ -53,10 +90,16 @@ from views.qt.widgets.interval_panel import IntervalPanel
 from views.qt.widgets.player_panel import PlayerPanel
 from views.qt.widgets.split_preview import SplitPreviewDialog
 from views.qt.widgets.video_canvas import VideoCanvas
-from views.qt.workers import FreezingDetectionWorker
+from views.qt.workers import (
+    FreezingDetectionWorker,
+    MediaIndexWorker,
+    ProxyWorker,
+    SegmentProbeWorker,
+    StagingWorker,
+)
 
 
-VIDEO_EXTENSIONS = {".mp4", ".avi", ".mov", ".mkv", ".wmv", ".flv", ".webm"}
+VIDEO_EXTENSIONS = {".mp4", ".avi", ".mov", ".mkv", ".wmv", ".flv", ".webm", SEGMENT_MANIFEST_SUFFIX}
 
 
 class QtAnnotationWorkbench(QMainWindow):
@@ -66,9 +109,16 @@ class QtAnnotationWorkbench(QMainWindow):
         super().__init__()
         self.config = Config()
         self.time_formatter = TimeFormatter()
-        self.video_model = VideoModel()
+        self.video_model = VideoModel(open_video_capture)
         self.annotation_model = AnnotationModel()
         self.export_service = ExportService()
+        self.resource_scheduler = get_resource_scheduler()
+        self.metrics = get_metrics()
+        self.perf_stats = get_perf_stats()
+        self.metrics_writer: Optional[MetricsWriter] = None
+        self.stall_watchdog: Optional[StallWatchdog] = None
+        self.tracer = get_tracer()
+        self.trace_dump_path = os.environ.get(TRACE_ENV_VAR, "")
         self.undo_group = QUndoGroup(self)
         self.undo_stack = QUndoStack(self)
         self.thumbnail_cache = ThumbnailCache()
@@ -80,9 +130,53 @@ class QtAnnotationWorkbench(QMainWindow):
         self._updating_table = False
         self._detection_thread: Optional[QThread] = None
         self._detection_worker: Optional[FreezingDetectionWorker] = None
+        self.detection_cache = DetectionResultCache()
+        self._speculative_thread: Optional[QThread] = None
+        self._speculative_worker: Optional[FreezingDetectionWorker] = None
+        self._speculative_promoted = False
+        self.staging_cache = self._create_staging_cache()
+        self._staging_thread: Optional[QThread] = None
+        self._staging_worker: Optional[StagingWorker] = None
+        self._media_index_thread: Optional[QThread] = None
+        self._media_index_worker: Optional[MediaIndexWorker] = None
+        self._segment_probe_thread: Optional[QThread] = None
+        self._segment_probe_worker: Optional[SegmentProbeWorker] = None
+        self.proxy_cache = self._create_proxy_cache()
+        self._proxy_thread: Optional[QThread] = None
+        self._proxy_worker: Optional[ProxyWorker] = None
+        self._proxy_progress_percent = -1
+        self.playback_buffer: Optional[DecodeAheadBuffer] = None
+        self.reverse_buffer: Optional[ReverseDecodeBuffer] = None
+        self.scrub_decoder: Optional[ScrubDecoder] = None
+        self.decoder_pool: Optional[DecoderPool] = None
+        self.review_prefetcher: Optional[RangePrefetcher] = None
+        self.media_playback: Optional[QtMediaPlayback] = None
+        self._media_playing = False
+        self.review_interval_id: Optional[str] = None
+        self.playback_direction = 1
+        self.playback_clock = PlaybackClock()
+        self.frame_cache = FrameCache(int(float(self.config.get("frame_cache_mb", 256)) * 1024 * 1024))
+        self._playback_reported_at = 0.0
 
         self.play_timer = QTimer(self)
+        self.play_timer.setTimerType(Qt.TimerType.PreciseTimer)
         self.play_timer.timeout.connect(self._advance_playback)
+        self.scrub_timer = QTimer(self)
+        self.scrub_timer.setInterval(15)
+        self.scrub_timer.timeout.connect(self._poll_scrub_frame)
+        self.decoder_park_timer = QTimer(self)
+        self.decoder_park_timer.setSingleShot(True)
+        self.decoder_park_timer.setInterval(1500)
+        self.decoder_park_timer.timeout.connect(self._park_idle_decoders)
+        # Coalesces canvas resizes and zoom steps before re-sizing review prefetch.
+        self.review_resize_timer = QTimer(self)
+        self.review_resize_timer.setSingleShot(True)
+        self.review_resize_timer.setInterval(250)
+        self.review_resize_timer.timeout.connect(self._request_review_prefetch)
+        self.perf_hud_timer = QTimer(self)
+        self.perf_hud_timer.setInterval(500)
+        self.perf_hud_timer.timeout.connect(self._refresh_perf_hud)
+        self._perf_hud_thumbnail_base = (0.0, 0.0)
 
         self.setWindowTitle("VideoTimer 标注工作台")
         self.resize(1500, 920)
@@ -90,6 +184,10 @@ class QtAnnotationWorkbench(QMainWindow):
         self._build_ui()
         self._apply_theme()
         self._refresh_actions()
+        self._start_metrics_writer()
+        self._start_stall_watchdog()
+        if self.trace_dump_path:
+            self.trace_action.setChecked(True)
         app = QApplication.instance()
         if app is not None:
             app.installEventFilter(self)
@@ -111,10 +209,50 @@ class QtAnnotationWorkbench(QMainWindow):
         self.split_action = QAction("拆分上下鼠", self)
         self.split_action.triggered.connect(self.split_top_bottom_mice)
 
+        self.split_view_action = QAction("上下鼠并排显示", self)
+        self.split_view_action.setCheckable(True)
+        self.split_view_action.toggled.connect(self._on_split_view_toggled)
+
+        self.perf_hud_action = QAction("性能监视", self)
+        self.perf_hud_action.setCheckable(True)
+        self.perf_hud_action.setShortcut(QKeySequence(Qt.Key.Key_F3))
+        self.perf_hud_action.toggled.connect(self._on_perf_hud_toggled)
+
+        self.trace_action = QAction("记录性能追踪", self)
+        self.trace_action.setCheckable(True)
+        self.trace_action.toggled.connect(self._on_trace_toggled)
+
+        self.compare_action = QAction("多视频对比", self)
+        self.compare_action.triggered.connect(self.open_compare_workspace)
+
         self.delete_action = QAction("删除区间", self)
         self.delete_action.setShortcut(QKeySequence.StandardKey.Delete)
         self.delete_action.triggered.connect(self.delete_selected_interval)
 
+        self.reverse_play_action = QAction("倒放", self)
+        self.reverse_play_action.setShortcut(QKeySequence(Qt.Key.Key_J))
+        self.reverse_play_action.triggered.connect(self.toggle_reverse_playback)
+
+        self.previous_frame_action = QAction("上一帧", self)
+        self.previous_frame_action.setShortcut(QKeySequence(Qt.Key.Key_Comma))
+        self.previous_frame_action.triggered.connect(lambda: self.step_frames(-1))
+
+        self.next_frame_action = QAction("下一帧", self)
+        self.next_frame_action.setShortcut(QKeySequence(Qt.Key.Key_Period))
+        self.next_frame_action.triggered.connect(lambda: self.step_frames(1))
+
+        self.previous_candidate_action = QAction("上一个候选", self)
+        self.previous_candidate_action.setShortcut(QKeySequence(Qt.Key.Key_BracketLeft))
+        self.previous_candidate_action.triggered.connect(lambda: self.review_candidate(-1))
+
+        self.next_candidate_action = QAction("下一个候选", self)
+        self.next_candidate_action.setShortcut(QKeySequence(Qt.Key.Key_BracketRight))
+        self.next_candidate_action.triggered.connect(lambda: self.review_candidate(1))
+
+        self.review_loop_action = QAction("循环播放候选", self)
+        self.review_loop_action.setCheckable(True)
+        self.review_loop_action.setShortcut(QKeySequence(Qt.Key.Key_L))
+
         self.clear_action = QAction("清空区间", self)
         self.clear_action.triggered.connect(self.clear_intervals)
 
@@ -133,6 +271,7 @@ class QtAnnotationWorkbench(QMainWindow):
         toolbar.addAction(self.redo_action)
         toolbar.addSeparator()
         toolbar.addAction(self.split_action)
+        toolbar.addAction(self.split_view_action)
         toolbar.addSeparator()
         toolbar.addAction(self.auto_detect_action)
         toolbar.addAction(self.export_action)
@@ -142,6 +281,8 @@ class QtAnnotationWorkbench(QMainWindow):
         file_menu.addAction(self.open_folder_action)
         file_menu.addAction(self.save_action)
         file_menu.addAction(self.export_action)
+        file_menu.addSeparator()
+        file_menu.addAction(self.compare_action)
 
         edit_menu = self.menuBar().addMenu("编辑")
         edit_menu.addAction(self.undo_action)
@@ -149,6 +290,22 @@ class QtAnnotationWorkbench(QMainWindow):
         edit_menu.addAction(self.delete_action)
         edit_menu.addAction(self.clear_action)
 
+        playback_menu = self.menuBar().addMenu("播放")
+        playback_menu.addAction(self.reverse_play_action)
+        playback_menu.addAction(self.previous_frame_action)
+        playback_menu.addAction(self.next_frame_action)
+        playback_menu.addSeparator()
+        playback_menu.addAction(self.previous_candidate_action)
+        playback_menu.addAction(self.next_candidate_action)
+        playback_menu.addAction(self.review_loop_action)
+
+        view_menu = self.menuBar().addMenu("视图")
+        view_menu.addAction(self.split_view_action)
+        view_menu.addAction(self.compare_action)
+        view_menu.addSeparator()
+        view_menu.addAction(self.perf_hud_action)
+        view_menu.addAction(self.trace_action)
+
         root_splitter = QSplitter(Qt.Orientation.Horizontal, self)
         root_splitter.addWidget(self._build_file_panel())
         root_splitter.addWidget(self._build_center_panel())
@@ -167,6 +324,7 @@ class QtAnnotationWorkbench(QMainWindow):
         self.file_panel = FilePanel(VIDEO_EXTENSIONS, Path.cwd(), self)
         self.file_panel.folder_requested.connect(self.open_folder)
         self.file_panel.video_selected.connect(self.load_video)
+        self.file_panel.segments_requested.connect(self.open_segmented_recording)
         return self.file_panel
 
     def _build_center_panel(self) -> QWidget:
@@ -184,10 +342,12 @@ class QtAnnotationWorkbench(QMainWindow):
         self.player_panel.fullscreen_requested.connect(self.toggle_fullscreen)
         self.player_panel.speed_changed.connect(self._on_speed_changed)
         self.player_panel.seek_requested.connect(self.seek_to_frame)
+        self.player_panel.scrub_requested.connect(self.scrub_to_frame)
         self.player_panel.interval_created.connect(self._push_add_interval)
         self.player_panel.interval_changed.connect(self._push_update_interval)
         self.player_panel.interval_selected.connect(self._select_interval)
         self.player_panel.thumbnail_requested.connect(self._show_thumbnail)
+        self.player_panel.track_activated.connect(self._on_split_session_activated)
         self.video_tabs.currentChanged.connect(self._on_video_tab_changed)
         return self.player_panel
 
@@ -217,12 +377,115 @@ class QtAnnotationWorkbench(QMainWindow):
             """
         )
 
+    def _start_metrics_writer(self):
+        prometheus_path = self.config.get("metrics_prometheus_path", "")
+        jsonl_path = self.config.get("metrics_jsonl_path", "")
+        if not prometheus_path and not jsonl_path:
+            return
+        self.metrics_writer = MetricsWriter(
+            self.metrics,
+            prometheus_path or None,
+            jsonl_path or None,
+            float(self.config.get("metrics_interval", 15.0)),
+        )
+        self.metrics_writer.start()
+
+    def _start_stall_watchdog(self):
+        log_path = self.config.get("stall_log_path", "")
+        threshold_ms = float(self.config.get("stall_threshold_ms", 500))
+        if not log_path or threshold_ms <= 0:
+            return
+        logger = create_stall_logger(
+            log_path,
+            int(self.config.get("stall_log_max_kb", 1024)) * 1024,
+            int(self.config.get("stall_log_backups", 3)),
+        )
+        self.stall_watchdog = StallWatchdog(threshold_ms / 1000, logger)
+        self.stall_ping_timer = QTimer(self)
+        self.stall_ping_timer.setInterval(max(10, min(100, int(threshold_ms / 4))))
+        self.stall_ping_timer.timeout.connect(self.stall_watchdog.heartbeat)
+        self.stall_ping_timer.start()
+        self.stall_watchdog.start()
+
+    def _create_staging_cache(self) -> Optional[StagingCache]:
+        cache_dir = self.config.get("staging_cache_dir", "")
+        if not cache_dir:
+            return None
+        max_bytes = int(float(self.config.get("staging_cache_max_gb", 20.0)) * 1024 ** 3)
+        try:
+            return StagingCache(cache_dir, max_bytes)
+        except OSError:
+            return None
+
+    def _create_proxy_cache(self) -> Optional[ProxyCache]:
+        cache_dir = self.config.get("proxy_cache_dir", "")
+        if not cache_dir:
+            return None
+        max_bytes = int(float(self.config.get("proxy_cache_max_gb", 10.0)) * 1024 ** 3)
+        try:
+            return ProxyCache(cache_dir, max_bytes, int(self.config.get("proxy_height", 360)))
+        except OSError:
+            return None
+
+    @tracked_action("open_folder")
     def open_folder(self):
         folder = QFileDialog.getExistingDirectory(self, "选择视频文件夹", str(Path.cwd()))
         if not folder:
             return
         self.file_panel.set_root_folder(folder)
 
+    def open_segmented_recording(self, paths: list):
+        segments = sorted(
+            (path for path in paths if not is_segment_manifest(path)),
+            key=lambda path: Path(path).name,
+        )
+        if len(segments) < 2:
+            QMessageBox.information(self, "提示", "请在文件列表中选择至少两个分段视频")
+            return
+        manifest_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "保存分段清单",
+            manifest_path_for(segments[0]),
+            f"Segment manifest (*{SEGMENT_MANIFEST_SUFFIX})",
+        )
+        if not manifest_path:
+            return
+        if not is_segment_manifest(manifest_path):
+            manifest_path += SEGMENT_MANIFEST_SUFFIX
+        try:
+            write_segment_manifest(manifest_path, segments)
+        except OSError as exc:
+            QMessageBox.critical(self, "错误", f"无法保存分段清单: {exc}")
+            return
+        self.load_video(manifest_path)
+
+    def open_compare_workspace(self):
+        session = self._current_session()
+        start_folder = str(Path(session.source_path).parent) if session else str(Path.cwd())
+        patterns = " ".join(f"*{suffix}" for suffix in sorted(VIDEO_EXTENSIONS))
+        paths, _ = QFileDialog.getOpenFileNames(
+            self,
+            f"选择 {MIN_COMPARE_VIDEOS}-{MAX_COMPARE_VIDEOS} 个视频进行对比",
+            start_folder,
+            f"Video files ({patterns});;All files (*.*)",
+        )
+        if not paths:
+            return
+        if not MIN_COMPARE_VIDEOS <= len(paths) <= MAX_COMPARE_VIDEOS:
+            QMessageBox.warning(self, "警告", f"请选择 {MIN_COMPARE_VIDEOS}-{MAX_COMPARE_VIDEOS} 个视频")
+            return
+        sources = []
+        for path in paths:
+            source = open_compare_source(path)
+            if source is None:
+                QMessageBox.critical(self, "错误", f"无法打开视频文件: {path}")
+                return
+            sources.append(source)
+        # Main playback would compete with the comparison decoders for CPU.
+        self._pause_playback()
+        workspace = CompareWorkspace(sources, self)
+        workspace.show()
+
     def _current_session(self) -> Optional[VideoSession]:
         if 0 <= self.current_session_index < len(self.video_sessions):
             return self.video_sessions[self.current_session_index]
@@ -243,6 +506,7 @@ class QtAnnotationWorkbench(QMainWindow):
     def _session_metadata(self, session: VideoSession) -> dict:
         return session_metadata(session)
 
+    @tracked_action("create_session")
     def _create_video_session(
         self,
         source_path: str,
@@ -261,7 +525,8 @@ class QtAnnotationWorkbench(QMainWindow):
 
         loaded_sidecar = False
         try:
-            loaded_sidecar = annotation_model.load_sidecar(logical_path)
+            with self.tracer.span("load_sidecar", "io", path=logical_path):
+                loaded_sidecar = annotation_model.load_sidecar(logical_path)
         except Exception as exc:
             annotation_model.set_video_context(
                 logical_path,
@@ -270,44 +535,122 @@ class QtAnnotationWorkbench(QMainWindow):
                 self._session_metadata_values(source_path, logical_path, crop_role, split_ratio),
             )
             QMessageBox.warning(self, "标注加载失败", f"标注文件无法加载，已使用空标注。\n\n{exc}")
+        self._apply_frame_times(annotation_model)
 
         undo_stack = QUndoStack(self)
         undo_stack.cleanChanged.connect(self._sync_dirty_from_undo_stack)
         undo_stack.indexChanged.connect(lambda _index: self._sync_dirty_from_undo_stack())
         undo_stack.setClean()
 
+        viewport = CanvasViewport()
+        canvas = VideoCanvas(viewport)
+        canvas.activated.connect(lambda canvas=canvas: self._on_canvas_activated(canvas))
+        canvas.scale_changed.connect(self._on_canvas_scale_changed)
         return VideoSession(
             source_path=source_path,
             logical_path=logical_path,
             title=title,
-            canvas=VideoCanvas(),
+            canvas=canvas,
             annotation_model=annotation_model,
             undo_stack=undo_stack,
             crop_role=crop_role,
             split_ratio=split_ratio,
             loaded_sidecar=loaded_sidecar,
+            viewport=viewport,
+        )
+
+    def _apply_frame_times(self, annotation_model: AnnotationModel):
+        media_index = self.video_model.media_index
+        frame_times = (
+            media_index.frame_times()
+            if media_index is not None and media_index.is_variable_frame_rate
+            else None
         )
+        annotation_model.set_timing(self.video_model.video_fps, self.video_model.total_frames, frame_times)
 
     def _install_video_sessions(self, sessions: List[VideoSession], active_index: int = 0):
-        self.video_tabs.blockSignals(True)
         for session in self.video_sessions:
             self.undo_group.removeStack(session.undo_stack)
-        while self.video_tabs.count():
-            self.video_tabs.removeTab(0)
-
         self.video_sessions = sessions
         for session in self.video_sessions:
             self.undo_group.addStack(session.undo_stack)
-            self.video_tabs.addTab(session.canvas, session.title)
 
         self.current_session_index = -1
         if self.video_sessions:
             active_index = max(0, min(active_index, len(self.video_sessions) - 1))
-            self.video_tabs.setCurrentIndex(active_index)
-        self.video_tabs.blockSignals(False)
+        self._rebuild_video_tabs(active_index)
         self._activate_video_session(active_index if self.video_sessions else -1)
 
-    def _activate_video_session(self, index: int):
+    def _rebuild_video_tabs(self, active_index: int):
+        """One tab per session, or a single tab with both split sessions side by side."""
+        self.video_tabs.blockSignals(True)
+        old_pages = [self.video_tabs.widget(index) for index in range(self.video_tabs.count())]
+        while self.video_tabs.count():
+            self.video_tabs.removeTab(0)
+
+        split_view = self._split_view_active()
+        if split_view:
+            page = QWidget()
+            layout = QHBoxLayout(page)
+            layout.setContentsMargins(0, 0, 0, 0)
+            layout.setSpacing(4)
+            for session in self.video_sessions:
+                session.canvas.setMinimumSize(320, 180)
+                layout.addWidget(session.canvas, 1)
+                # The tab widget hid these canvases when they were pages of their own.
+                session.canvas.show()
+            self.video_tabs.addTab(page, "上下鼠并排")
+        else:
+            for session in self.video_sessions:
+                session.canvas.setMinimumSize(640, 360)
+                session.canvas.set_highlighted(False)
+                self.video_tabs.addTab(session.canvas, session.title)
+            if self.video_sessions:
+                self.video_tabs.setCurrentIndex(active_index)
+        self.video_tabs.blockSignals(False)
+
+        session_canvases = {id(session.canvas) for session in self.video_sessions}
+        for page in old_pages:
+            # A previous side-by-side page is empty now that its canvases moved.
+            if not isinstance(page, VideoCanvas) and id(page) not in session_canvases:
+                page.deleteLater()
+        self.timeline.set_split_tracks(
+            [session.title for session in self.video_sessions] if split_view else None
+        )
+
+    def _is_split_pair(self) -> bool:
+        return (
+            len(self.video_sessions) == 2
+            and {session.crop_role for session in self.video_sessions} == {CROP_UPPER, CROP_LOWER}
+        )
+
+    def _split_view_active(self) -> bool:
+        return self.split_view_action.isChecked() and self._is_split_pair()
+
+    def _displayed_canvases(self) -> List[VideoCanvas]:
+        if self._split_view_active():
+            return [session.canvas for session in self.video_sessions]
+        return [self.video_canvas]
+
+    def _on_split_view_toggled(self, _checked: bool):
+        if not self._is_split_pair():
+            return
+        index = max(0, self.current_session_index)
+        self._rebuild_video_tabs(index)
+        self._activate_video_session(index)
+
+    def _on_split_session_activated(self, index: int):
+        if self._split_view_active() and index != self.current_session_index:
+            # Both canvases already show the current frame, so nothing is decoded.
+            self._activate_video_session(index, render=False)
+
+    def _on_canvas_activated(self, canvas: VideoCanvas):
+        for index, session in enumerate(self.video_sessions):
+            if session.canvas is canvas:
+                self._on_split_session_activated(index)
+                return
+
+    def _activate_video_session(self, index: int, render: bool = True):
         if not (0 <= index < len(self.video_sessions)):
             self.current_session_index = -1
             self.annotation_model = AnnotationModel()
@@ -320,14 +663,23 @@ class QtAnnotationWorkbench(QMainWindow):
         self.annotation_model = session.annotation_model
         self.undo_stack = session.undo_stack
         self.video_canvas = session.canvas
+        self.video_canvas.set_fast_scaling(self.playing)
         self.undo_group.setActiveStack(session.undo_stack)
+        if self._split_view_active():
+            self.timeline.set_active_track(index)
+            for track_index, track_session in enumerate(self.video_sessions):
+                track_session.canvas.set_highlighted(track_index == index)
+                self.timeline.set_intervals(track_session.annotation_model.intervals, track=track_index)
         self.pending_start_frame = None
         self.timeline.set_pending_start(None)
         self._refresh_all_views()
-        self._render_current_frame()
+        if render:
+            self._render_current_frame()
         self._update_video_info_label()
 
     def _on_video_tab_changed(self, index: int):
+        if self._split_view_active():
+            return
         if 0 <= index < len(self.video_sessions):
             self._activate_video_session(index)
 
@@ -357,22 +709,59 @@ class QtAnnotationWorkbench(QMainWindow):
         export_model.current_frame = self.current_frame
         return export_model
 
+    @tracked_action("load_video")
     def load_video(self, file_path: str):
         if not self._confirm_save_if_dirty():
             return
+        self._cancel_segment_probe()
+        if is_segment_manifest(file_path):
+            # Opening every segment can take seconds on a network share; the
+            # video is opened once the probe worker has the frame counts.
+            self._start_segment_probe(file_path)
+            return
+        self._open_video(file_path)
 
+    @tracked_action("open_video")
+    def _open_video(self, file_path: str):
+        # Staging, media indexing and proxies work on single files. A manifest
+        # is read in place and its segments use their own saved media indexes.
+        segmented = is_segment_manifest(file_path)
         self.stop_video()
+        self._cancel_speculative_detection()
+        self._cancel_staging()
+        self._cancel_media_indexing()
+        self._cancel_proxy()
         self.thumbnail_popup.hide()
+        self._stop_playback_buffer()
+        self.frame_cache.clear()
         self.thumbnail_cache.release()
         self.video_model.release()
-        if not self.video_model.load_video(file_path):
+        staged_path = self.staging_cache.staged_path(file_path) if self.staging_cache and not segmented else None
+        with self.tracer.span("open_capture", "io", path=file_path, staged=staged_path is not None):
+            opened = self.video_model.load_video(file_path, staged_path)
+        if not opened:
             QMessageBox.critical(self, "错误", "无法打开视频文件")
             return
+        media_index = None if segmented else load_media_index(file_path)
+        if media_index is not None:
+            self.video_model.apply_media_index(media_index)
+        proxy_path = (
+            self.proxy_cache.proxy_path(file_path, self.video_model.total_frames)
+            if self.proxy_cache and not segmented
+            else None
+        )
+        self.video_model.proxy_path = proxy_path or ""
 
         self.current_frame = 0
+        self.review_interval_id = None
         session = self._create_video_session(file_path, file_path, Path(file_path).name)
 
-        self.thumbnail_cache.load_video(file_path, self.video_model.total_frames)
+        self.thumbnail_cache.load_video(
+            self.video_model.preview_path,
+            self.video_model.total_frames,
+            self._preview_media_index(),
+        )
+        self._reset_playback_buffer()
         self._install_video_sessions([session])
         self.pending_start_frame = None
         self.timeline.set_video(self.video_model.total_frames, self.video_model.video_fps)
@@ -386,23 +775,27 @@ class QtAnnotationWorkbench(QMainWindow):
             5000,
         )
         self._refresh_actions()
-
+        if self.staging_cache is not None and staged_path is None and not segmented:
+            self._start_staging(file_path)
+        if media_index is None and not segmented and self._media_indexing_enabled():
+            self._start_media_indexing(file_path)
+        if self.proxy_cache is not None and proxy_path is None and not segmented:
+            self._start_proxy(file_path)
+        if self.config.get("speculative_detection", False):
+            self._start_speculative_detection(session)
+
+    @tracked_action("split_top_bottom_mice")
     def split_top_bottom_mice(self):
         if not self.video_model.video_capture or not self.video_model.video_path:
             QMessageBox.information(self, "提示", "请先加载视频")
             return
 
-        is_existing_split = (
-            len(self.video_sessions) == 2
-            and {session.crop_role for session in self.video_sessions} == {CROP_UPPER, CROP_LOWER}
-        )
+        is_existing_split = self._is_split_pair()
         if not is_existing_split and self._has_unsaved_changes():
             if not self._confirm_save_if_dirty():
                 return
 
-        capture = self.video_model.video_capture
-        capture.set(cv2.CAP_PROP_POS_FRAMES, self.current_frame)
-        ok, frame = capture.read()
+        ok, frame = self._read_preview_frame(self.current_frame)
         if not ok:
             QMessageBox.warning(self, "提示", "无法读取当前帧用于裁剪预览")
             return
@@ -457,15 +850,38 @@ class QtAnnotationWorkbench(QMainWindow):
         self._refresh_actions()
 
     def toggle_playback(self):
-        if not self.video_model.video_capture:
-            return
         if self.playing:
             self._pause_playback()
             return
+        self._start_playback(1)
+
+    def toggle_reverse_playback(self):
+        if self.playing and self.playback_direction < 0:
+            self._pause_playback()
+            return
+        self._pause_playback()
+        self._start_playback(-1)
+
+    def _start_playback(self, direction: int):
+        if not self.video_model.video_capture or self.playback_buffer is None:
+            return
         self.playing = True
+        self.playback_direction = direction
+        self.resource_scheduler.set_foreground(CONTEXT_PLAYBACK, True)
+        if self._speculative_worker is not None and not self._speculative_promoted:
+            self._speculative_worker.pause()
         self.play_button.setText("暂停")
         self.play_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaPause))
+        self.playback_clock.start(self.current_frame, self._playback_rate() * direction)
+        self._playback_reported_at = time.monotonic()
+        for canvas in self._displayed_canvases():
+            canvas.set_fast_scaling(True)
+        if direction > 0 and self.media_playback is not None:
+            self._media_playing = True
+            self.media_playback.play(self.current_frame, self._playback_speed())
+            return
         self._restart_play_timer()
+        self._active_playback_buffer().seek(self.current_frame + direction)
 
     def stop_video(self):
         self._pause_playback()
@@ -478,60 +894,524 @@ class QtAnnotationWorkbench(QMainWindow):
         else:
             self.showFullScreen()
 
+    @tracked_action("seek_to_frame")
     def seek_to_frame(self, frame: int):
         if not self.video_model.video_capture:
             return
+        self._finish_scrub()
         self.current_frame = max(0, min(int(frame), max(0, self.video_model.total_frames - 1)))
         self.video_model.current_frame = self.current_frame
         self._render_current_frame()
+        if self.playing and self._media_playing:
+            self.playback_clock.rebase(self.current_frame)
+            self.media_playback.seek(self.current_frame)
+        elif self.playing and self.playback_buffer is not None:
+            self.playback_clock.rebase(self.current_frame)
+            self._active_playback_buffer().seek(self.current_frame + self.playback_direction)
+
+    def scrub_to_frame(self, frame: int):
+        """Move the playhead while dragging; frames are decoded off the GUI thread."""
+        if not self.video_model.video_capture or self.scrub_decoder is None:
+            return
+        if self.playing:
+            self._pause_playback()
+        self.current_frame = max(0, min(int(frame), max(0, self.video_model.total_frames - 1)))
+        cached = self.frame_cache.get(self.current_frame)
+        if cached is not None:
+            self.scrub_decoder.cancel()
+            self._display_frame(cached)
+            return
+        self.video_model.current_frame = self.current_frame
+        self.timeline.set_current_frame(self.current_frame)
+        self._update_time_label()
+        self.scrub_decoder.request(self.current_frame)
+        if not self.scrub_timer.isActive():
+            self.scrub_timer.start()
+
+    def _poll_scrub_frame(self):
+        if self.scrub_decoder is None:
+            self.scrub_timer.stop()
+            return
+        result = self.scrub_decoder.take()
+        if result is None:
+            return
+        self.metrics.inc("frames_decoded", source="scrub")
+        _requested, _decoded, image = result
+        self._show_image(image)
+
+    def _finish_scrub(self):
+        self.scrub_timer.stop()
+        if self.scrub_decoder is not None:
+            self.scrub_decoder.cancel()
+
+    def step_frames(self, delta: int):
+        if not self.video_model.video_capture:
+            return
+        self._pause_playback()
+        target = max(0, self.current_frame + int(delta))
+        if delta < 0 and target not in self.frame_cache:
+            # Stepping backwards decodes a whole chunk once instead of paying
+            # for a keyframe seek on every frame.
+            self._decode_into_frame_cache(target, self._reverse_chunk_frames())
+        self.seek_to_frame(target)
+
+    def review_candidate(self, delta: int):
+        """Jump to the next (``delta > 0``) or previous candidate interval.
+
+        The candidate being reviewed and the one after it are decoded ahead at
+        display resolution, so jumping on and looping within them does not
+        wait for a seek.
+        """
+        intervals = self.annotation_model.intervals
+        if not self._has_current_session() or not intervals:
+            return
+        index = self._review_index()
+        if index is not None:
+            index = max(0, min(index + delta, len(intervals) - 1))
+        elif delta > 0:
+            index = next(
+                (position for position, item in enumerate(intervals) if item.start_frame >= self.current_frame),
+                len(intervals) - 1,
+            )
+        else:
+            index = max(
+                (position for position, item in enumerate(intervals) if item.start_frame < self.current_frame),
+                default=0,
+            )
+        interval = intervals[index]
+        self.review_interval_id = interval.id
+        self._select_interval(interval.id)
+        self._request_review_prefetch()
+        self.seek_to_frame(interval.start_frame)
+        self.statusBar().showMessage(f"候选 {index + 1} / {len(intervals)}", 3000)
+
+    def _review_index(self) -> Optional[int]:
+        for index, interval in enumerate(self.annotation_model.intervals):
+            if interval.id == self.review_interval_id:
+                return index
+        return None
+
+    def _request_review_prefetch(self):
+        index = self._review_index()
+        if self.review_prefetcher is None or index is None:
+            return
+        margin = round(max(0.0, float(self.config.get("review_margin_seconds", 1.0))) * self.video_model.video_fps)
+        last_frame = max(0, self.video_model.total_frames - 1)
+        # The candidate under review first, so looping it never waits on the next one.
+        ranges = [
+            (max(0, interval.start_frame - margin), min(last_frame, interval.end_frame - 1 + margin))
+            for interval in self.annotation_model.intervals[index:index + 2]
+        ]
+        self.review_prefetcher.request(ranges, self._review_prefetch_size())
+
+    def _on_canvas_scale_changed(self):
+        if self.review_prefetcher is not None and self.review_interval_id is not None:
+            self.review_resize_timer.start()
+
+    def _review_prefetch_size(self) -> Optional[tuple[int, int]]:
+        """Smallest frame size that still fills every displayed canvas pixel for pixel.
+
+        A zoomed canvas shows a crop of the frame enlarged by the zoom factor,
+        so it needs that many more source pixels.
+        """
+        width, height = self.video_model.frame_width, self.video_model.frame_height
+        if width <= 0 or height <= 0:
+            return None
+        sessions = self.video_sessions if self._split_view_active() else [self._current_session()]
+        scale = 0.0
+        for session in sessions:
+            if session is None:
+                continue
+            top, bottom = horizontal_crop_bounds(height, session.split_ratio or 0.5, session.crop_role)
+            ratio = session.canvas.devicePixelRatioF() * session.canvas.viewport.zoom
+            scale = max(
+                scale,
+                min(session.canvas.width() * ratio / width, session.canvas.height() * ratio / max(1, bottom - top)),
+            )
+        if scale <= 0 or scale >= 1:
+            return None
+        return max(2, round(width * scale)), max(2, round(height * scale))
+
+    def _review_frame(self, frame: int):
+        if self.review_prefetcher is None or self.review_interval_id is None:
+            return None
+        image = self.review_prefetcher.get(frame)
+        self.metrics.inc("cache_requests", cache="review", result="miss" if image is None else "hit")
+        return image
+
+    def _loop_review_candidate(self, previous_frame: int) -> bool:
+        """Restart the reviewed candidate when forward playback runs off its end."""
+        if not self.review_loop_action.isChecked() or self.playback_direction < 0:
+            return False
+        index = self._review_index()
+        if index is None:
+            return False
+        interval = self.annotation_model.intervals[index]
+        loop_frame = min(interval.end_frame, max(0, self.video_model.total_frames - 1))
+        if not interval.start_frame <= previous_frame < loop_frame <= self.current_frame:
+            return False
+        self.seek_to_frame(interval.start_frame)
+        return True
 
     def _advance_playback(self):
         if not self.playing or not self.video_model.video_capture:
             return
-        if self.current_frame >= self.video_model.total_frames - 1:
+        last_frame = max(0, self.video_model.total_frames - 1)
+        end_frame = last_frame if self.playback_direction > 0 else 0
+        if self.current_frame == end_frame:
             self._pause_playback()
-            self.current_frame = max(0, self.video_model.total_frames - 1)
             return
-        self.current_frame += 1
-        self.video_model.current_frame = self.current_frame
-        self._render_current_frame(seek=False)
-        if self.current_frame >= self.video_model.total_frames - 1:
+        target = max(0, min(self.playback_clock.target_frame(), last_frame))
+        buffer = self._active_playback_buffer()
+        underruns = buffer.underruns
+        # The buffer is popped even when a prefetched frame is shown, so it
+        # keeps pace with the clock for when the prefetched range ends.
+        item = buffer.pop_until(target)
+        prefetched = None
+        if self.playback_direction > 0 and target != self.current_frame:
+            prefetched = self._review_frame(target)
+        previous_frame = self.current_frame
+        if prefetched is not None:
+            self.current_frame, frame = target, prefetched
+        elif item is None:
+            if buffer.end_of_stream:
+                self._pause_playback()
+            elif buffer.underruns != underruns:
+                # The decoder fell behind; hold the current frame for this tick.
+                self.metrics.inc("playback_underruns")
+            return
+        else:
+            self.current_frame, frame = item
+            self.metrics.inc("frames_decoded", source="playback")
+            # Forward ring slots are reused, so the cache and the canvas keep a copy.
+            if self.playback_direction > 0:
+                started = self.perf_stats.start()
+                frame = frame.copy()
+                self.perf_stats.stop("copy", started)
+            self.frame_cache.set_playhead(self.current_frame)
+            self.frame_cache.put(self.current_frame, frame)
+        self._display_frame(frame)
+        self.playback_clock.presented(self.current_frame)
+        self._report_playback_rate()
+        if self._loop_review_candidate(previous_frame):
+            return
+        if self.current_frame == end_frame:
             self._pause_playback()
 
-    def _render_current_frame(self, seek: bool = True):
-        capture = self.video_model.video_capture
-        if not capture:
+    def _on_perf_hud_toggled(self, checked: bool):
+        self.perf_stats.set_enabled(checked)
+        if checked:
+            self._perf_hud_thumbnail_base = self._thumbnail_cache_counts()
+            self._refresh_perf_hud()
+            self.perf_hud_timer.start()
             return
-        if seek:
-            capture.set(cv2.CAP_PROP_POS_FRAMES, self.current_frame)
-        ok, frame = capture.read()
-        if not ok:
+        self.perf_hud_timer.stop()
+        for canvas in self._hud_canvases():
+            canvas.set_hud_lines(None)
+
+    def _on_trace_toggled(self, checked: bool):
+        if checked:
+            self.tracer.set_enabled(True)
+            self.statusBar().showMessage("正在记录性能追踪，再次点击菜单项导出", 5000)
+            return
+        if not self.tracer.enabled:
+            return
+        self.tracer.set_enabled(False)
+        if not self.tracer.events():
+            return
+        default_path = self.trace_dump_path or str(Path.home() / "videotimer-trace.json")
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "导出性能追踪",
+            default_path,
+            "Chrome trace (*.json);;All files (*.*)",
+        )
+        if file_path:
+            self._dump_trace(file_path)
+
+    def _dump_trace(self, file_path: str):
+        try:
+            self.tracer.dump(file_path)
+        except OSError as exc:
+            QMessageBox.warning(self, "导出失败", f"性能追踪无法写入：\n{exc}")
+            return
+        self.statusBar().showMessage(f"性能追踪已导出到 {file_path}，可在 Perfetto 中打开", 8000)
+
+    def _hud_canvases(self) -> List[VideoCanvas]:
+        return [session.canvas for session in self.video_sessions] or [self.video_canvas]
+
+    def _thumbnail_cache_counts(self) -> tuple[float, float]:
+        return (
+            self.metrics.counter_value("cache_requests", cache="thumbnail", result="hit"),
+            self.metrics.counter_value("cache_requests", cache="thumbnail", result="miss"),
+        )
+
+    def _refresh_perf_hud(self):
+        def stage(name: str) -> str:
+            value = self.perf_stats.mean_ms(name)
+            return "-" if value is None else f"{value:.1f}"
+
+        if self.playing:
+            clock = self.playback_clock
+            rate = f"播放 {clock.achieved_fps:.1f} / {self._display_rate():.1f} fps  丢帧 {clock.dropped_frames}"
+        else:
+            rate = "已暂停"
+        hits, misses = self._thumbnail_cache_counts()
+        hits -= self._perf_hud_thumbnail_base[0]
+        misses -= self._perf_hud_thumbnail_base[1]
+        lookups = hits + misses
+        thumbnails = f"缩略图命中率 {hits / lookups:.0%} ({lookups:.0f} 次)" if lookups else "缩略图命中率 -"
+        lines = [
+            f"解码 {stage('decode')} ms  复制 {stage('copy')} ms  转换 {stage('convert')} ms  缩放 {stage('scale')} ms",
+            f"绘制 画面 {stage('canvas_paint')} ms  进度条 {stage('progress_paint')} ms  "
+            f"区间轨道 {stage('interval_paint')} ms",
+            rate,
+            thumbnails,
+        ]
+        for canvas in self._hud_canvases():
+            canvas.set_hud_lines(lines)
+
+    def _report_playback_rate(self):
+        now = time.monotonic()
+        if now - self._playback_reported_at < 1.0:
+            return
+        self._playback_reported_at = now
+        clock = self.playback_clock
+        self.metrics.set_gauge("playback_fps", clock.achieved_fps)
+        self.metrics.set_gauge("playback_dropped_frames", clock.dropped_frames)
+        self.statusBar().showMessage(
+            f"播放 {clock.achieved_fps:.1f} / {self._display_rate():.1f} fps，丢帧 {clock.dropped_frames}",
+            2000,
+        )
+
+    def _render_current_frame(self):
+        if not self.video_model.video_capture:
+            return
+        frame = self.frame_cache.get(self.current_frame)
+        if frame is None:
+            frame = self._review_frame(self.current_frame)
+        if frame is None:
+            frame = self._decode_into_frame_cache(self.current_frame)
+        if frame is None:
             self._pause_playback()
             return
+        self._display_frame(frame)
+
+    def _decode_into_frame_cache(self, target: int, backfill: Optional[int] = None):
+        """Decode ``target`` plus uncached frames just before it into the frame cache.
+
+        A random seek already decodes from the preceding keyframe, so reading a
+        short run up to the target costs little more and makes stepping
+        backwards a cache hit.
+        """
+        pool = self.decoder_pool
+        if pool is None:
+            return None
+        start = target
+        if pool.forward_distance(target) is None:
+            if backfill is None:
+                backfill = max(0, int(self.config.get("frame_cache_backfill", 15)))
+            while start > max(0, target - backfill) and start - 1 not in self.frame_cache:
+                start -= 1
+        seeks = pool.seeks
+        frames = pool.read_frames(start, target)
+        if pool.seeks != seeks:
+            self.metrics.inc("decoder_pool_seeks")
+        if not self.playing:
+            self.decoder_park_timer.start()
+        if not frames or frames[-1][0] != target:
+            return None
+        self.frame_cache.set_playhead(target)
+        for index, frame in frames:
+            self.metrics.inc("frames_decoded", source="playback")
+            self.frame_cache.put(index, frame)
+        return frames[-1][1]
+
+    def _park_idle_decoders(self):
+        if self.decoder_pool is not None and not self.playing:
+            self.decoder_pool.park_idle()
+
+    def _display_frame(self, frame):
+        self._show_image(frame)
+        self.video_model.current_frame = self.current_frame
+        self.timeline.set_current_frame(self.current_frame)
+        self._update_time_label()
+
+    def _show_image(self, frame):
+        if self._split_view_active():
+            # One decoded frame feeds both crops; the crops are views, not copies.
+            for session in self.video_sessions:
+                session.canvas.set_frame(apply_horizontal_crop(frame, session.crop_role, session.split_ratio))
+            return
         session = self._current_session()
         if session:
             frame = apply_horizontal_crop(frame, session.crop_role, session.split_ratio)
         self.video_canvas.set_frame(frame)
-        self.video_model.current_frame = self.current_frame
-        self.timeline.set_current_frame(self.current_frame)
-        self._update_time_label()
+
+    def _reset_playback_buffer(self):
+        self._stop_playback_buffer()
+        if self.video_model.capture_path:
+            self.playback_buffer = DecodeAheadBuffer(
+                self.video_model.capture_path,
+                int(self.config.get("playback_ring_depth", 8)),
+                media_index=self.video_model.media_index,
+            )
+            self.reverse_buffer = ReverseDecodeBuffer(
+                self.video_model.capture_path,
+                self._reverse_chunk_frames(),
+                media_index=self.video_model.media_index,
+                max_chunk_frames=self._reverse_max_chunk_frames(),
+            )
+            self.scrub_decoder = ScrubDecoder(
+                self.video_model.preview_path,
+                media_index=self._preview_media_index(),
+            )
+            self.decoder_pool = DecoderPool(
+                self.video_model.capture_path,
+                self.video_model.total_frames,
+                int(self.config.get("decoder_pool_size", 3)),
+                media_index=self.video_model.media_index,
+            )
+            self.review_prefetcher = RangePrefetcher(
+                self.video_model.capture_path,
+                int(float(self.config.get("review_prefetch_mb", 768)) * 1024 * 1024),
+                media_index=self.video_model.media_index,
+            )
+            self._request_review_prefetch()
+            if self.config.get("playback_backend", "opencv") == PLAYBACK_BACKEND_QT:
+                self._create_media_playback()
+
+    def _stop_playback_buffer(self):
+        if self.playback_buffer is not None:
+            self.playback_buffer.stop()
+            self.playback_buffer = None
+        if self.reverse_buffer is not None:
+            self.reverse_buffer.stop()
+            self.reverse_buffer = None
+        self.scrub_timer.stop()
+        if self.scrub_decoder is not None:
+            self.scrub_decoder.stop()
+            self.scrub_decoder = None
+        self.decoder_park_timer.stop()
+        if self.decoder_pool is not None:
+            self.decoder_pool.release()
+            self.decoder_pool = None
+        if self.review_prefetcher is not None:
+            self.review_prefetcher.stop()
+            self.review_prefetcher = None
+        self._release_media_playback()
+
+    def _create_media_playback(self):
+        if is_segment_manifest(self.video_model.capture_path):
+            # QMediaPlayer cannot read a segment manifest; OpenCV plays it through SegmentedCapture.
+            return
+        if not qt_multimedia_available():
+            self.statusBar().showMessage("QtMultimedia 不可用，使用 OpenCV 播放", 5000)
+            return
+        self.media_playback = QtMediaPlayback(
+            self.video_model.capture_path,
+            self.video_model.video_fps,
+            self.video_model.total_frames,
+            self.video_model.media_index,
+            self,
+        )
+        self.media_playback.frame_ready.connect(self._on_media_frame)
+        self.media_playback.failed.connect(self._on_media_failed)
+        self.media_playback.finished.connect(self._pause_playback)
+
+    def _release_media_playback(self):
+        self._media_playing = False
+        if self.media_playback is not None:
+            self.media_playback.release()
+            self.media_playback.deleteLater()
+            self.media_playback = None
+
+    def _on_media_frame(self, frame_index: int, frame):
+        if self.sender() is not self.media_playback or not self._media_playing:
+            return
+        previous_frame = self.current_frame
+        self.current_frame = frame_index
+        self.metrics.inc("frames_decoded", source="qtmultimedia")
+        self._display_frame(frame)
+        self.playback_clock.presented(self.current_frame)
+        self._report_playback_rate()
+        if self._loop_review_candidate(previous_frame):
+            return
+        if self.current_frame >= self.video_model.total_frames - 1:
+            self._pause_playback()
+
+    def _on_media_failed(self, message: str):
+        if self.sender() is not self.media_playback:
+            return
+        was_playing = self._media_playing
+        self._release_media_playback()
+        self.statusBar().showMessage(f"QtMultimedia 播放失败，改用 OpenCV: {message}", 5000)
+        if was_playing:
+            self._start_playback(1)
+
+    def _active_playback_buffer(self):
+        return self.playback_buffer if self.playback_direction > 0 else self.reverse_buffer
+
+    def _reverse_chunk_frames(self) -> int:
+        return max(1, int(self.config.get("reverse_chunk_frames", 30)))
+
+    def _reverse_max_chunk_frames(self) -> int:
+        # Two chunks are held at once: the one on screen and the one before it.
+        frame_bytes = max(1, self.video_model.frame_width * self.video_model.frame_height * 3)
+        budget = float(self.config.get("reverse_buffer_mb", 512)) * 1024 ** 2
+        return max(self._reverse_chunk_frames(), int(budget / 2 / frame_bytes))
 
     def _pause_playback(self):
         self.playing = False
         self.play_timer.stop()
+        if self._media_playing:
+            self._media_playing = False
+            if self.media_playback is not None:
+                self.media_playback.pause()
+            # Show the paused frame as decoded by OpenCV, the reference for frame numbers.
+            self._render_current_frame()
+        for canvas in self._displayed_canvases():
+            canvas.set_fast_scaling(False)
+        self.resource_scheduler.set_foreground(CONTEXT_PLAYBACK, False)
+        if self._speculative_worker is not None:
+            self._speculative_worker.resume()
         if hasattr(self, "play_button"):
             self.play_button.setText("播放")
             self.play_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaPlay))
 
+    def _playback_speed(self) -> float:
+        return max(float(self.speed_combo.currentText().rstrip("x")), 0.01)
+
+    def _playback_rate(self) -> float:
+        """Source frames per second of wall time at the selected speed."""
+        return max(self.video_model.video_fps * self._playback_speed(), 1.0)
+
+    def _playback_frame_step(self) -> int:
+        """Decode every n-th frame so presentation stays under the display cap."""
+        if self.playback_direction < 0:
+            return 1
+        max_display_fps = max(float(self.config.get("playback_max_display_fps", 60)), 1.0)
+        return max(1, math.ceil(self._playback_rate() / max_display_fps - 1e-6))
+
+    def _display_rate(self) -> float:
+        return self._playback_rate() / self._playback_frame_step()
+
     def _restart_play_timer(self):
-        speed = max(float(self.speed_combo.currentText().rstrip("x")), 0.01)
-        delay = max(1, int(1000 / max(self.video_model.video_fps * speed, 1.0)))
-        self.play_timer.start(delay)
+        # Ticks only sample the clock, so a late tick skips frames instead of
+        # slowing playback down.
+        if self.playback_buffer is not None:
+            self.playback_buffer.set_frame_step(self._playback_frame_step())
+        self.play_timer.start(max(1, int(1000 / (self._display_rate() * 2))))
 
     def _on_speed_changed(self):
         if self.playing:
-            self._restart_play_timer()
+            self.playback_clock.rebase(self.current_frame, self._playback_rate() * self.playback_direction)
+            if self._media_playing:
+                self.media_playback.set_rate(self._playback_speed())
+            else:
+                self._restart_play_timer()
 
+    @tracked_action("save_annotations")
     def save_annotations(self) -> bool:
         session = self._current_session()
         if not session:
@@ -545,6 +1425,7 @@ class QtAnnotationWorkbench(QMainWindow):
         self._refresh_actions()
         return True
 
+    @tracked_action("save_sidecar")
     def _save_session_annotations(self, session: VideoSession) -> Path:
         session.annotation_model.update_video_metadata(self._session_metadata(session), dirty=False)
         path = session.annotation_model.save_sidecar(session.logical_path)
@@ -564,6 +1445,7 @@ class QtAnnotationWorkbench(QMainWindow):
         self._refresh_actions()
         return True
 
+    @tracked_action("export_excel")
     def export_excel(self):
         session = self._current_session()
         if not session:
@@ -597,6 +1479,7 @@ class QtAnnotationWorkbench(QMainWindow):
         records = intervals_to_time_records(
             self.annotation_model.intervals,
             self.video_model.video_fps,
+            self.annotation_model.frame_to_seconds,
         )
         export_model = self._export_video_model_for_current_session()
         if self.export_service.export("excel", records, export_model, file_path, export_type):
@@ -604,6 +1487,7 @@ class QtAnnotationWorkbench(QMainWindow):
         else:
             QMessageBox.critical(self, "错误", "导出失败")
 
+    @tracked_action("auto_detect_freezing")
     def auto_detect_freezing(self):
         session = self._current_session()
         if not session:
@@ -613,26 +1497,39 @@ class QtAnnotationWorkbench(QMainWindow):
             return
 
         self._pause_playback()
-        params = FreezingDetectionParams(
-            sample_rate=float(self.config.get("freezing_sample_rate", 10.0)),
-            analysis_width=int(self.config.get("freezing_analysis_width", 320)),
-            pixel_diff_threshold=int(self.config.get("freezing_pixel_diff_threshold", 25)),
-            motion_threshold=float(self.config.get("freezing_motion_threshold", 0.0004)),
-            min_freeze_duration=float(self.config.get("freezing_min_duration", 0.5)),
-            merge_gap=float(self.config.get("freezing_merge_gap", 0.3)),
-            min_non_freeze_gap=float(self.config.get("freezing_min_non_freeze_gap", 0.2)),
-            smoothing_window=float(self.config.get("freezing_smoothing_window", 0.3)),
+        params = self._detection_params()
+        cache_key = detection_cache_key(
+            self.video_model.video_path,
+            params,
+            session.crop_role,
+            session.split_ratio,
         )
+        cached = self.detection_cache.get(cache_key)
+        if cached is not None:
+            self._on_detection_finished(cached, session.logical_path)
+            return
+        if self._speculative_worker is not None:
+            if self._speculative_worker.cache_key == cache_key:
+                self._speculative_promoted = True
+                self._speculative_worker.resume()
+                self.auto_detect_action.setEnabled(False)
+                self.statusBar().showMessage("自动检测中: 使用后台预检测结果")
+                return
+            self._cancel_speculative_detection()
 
         self._detection_thread = QThread(self)
         self._detection_worker = FreezingDetectionWorker(
-            self.video_model.video_path,
+            self.video_model.capture_path,
             self.video_model.video_fps,
             self.video_model.total_frames,
             params,
             session.logical_path,
             session.crop_role,
             session.split_ratio,
+            self.detection_cache,
+            cache_key,
+            workers=int(self.config.get("freezing_workers", 0)),
+            media_index=self.video_model.media_index,
         )
         self._detection_worker.moveToThread(self._detection_thread)
         self._detection_thread.started.connect(self._detection_worker.run)
@@ -647,6 +1544,342 @@ class QtAnnotationWorkbench(QMainWindow):
         self.statusBar().showMessage("自动检测中: 0%")
         self._detection_thread.start()
 
+    def _detection_params(self) -> FreezingDetectionParams:
+        return FreezingDetectionParams(
+            sample_rate=float(self.config.get("freezing_sample_rate", 10.0)),
+            analysis_width=int(self.config.get("freezing_analysis_width", 320)),
+            pixel_diff_threshold=int(self.config.get("freezing_pixel_diff_threshold", 25)),
+            motion_threshold=float(self.config.get("freezing_motion_threshold", 0.0004)),
+            min_freeze_duration=float(self.config.get("freezing_min_duration", 0.5)),
+            merge_gap=float(self.config.get("freezing_merge_gap", 0.3)),
+            min_non_freeze_gap=float(self.config.get("freezing_min_non_freeze_gap", 0.2)),
+            smoothing_window=float(self.config.get("freezing_smoothing_window", 0.3)),
+        )
+
+    def _start_speculative_detection(self, session: VideoSession):
+        """Run detection at idle priority so a later auto-detect can reuse it."""
+        params = self._detection_params()
+        cache_key = detection_cache_key(
+            self.video_model.video_path,
+            params,
+            session.crop_role,
+            session.split_ratio,
+        )
+        if cache_key is None or self.detection_cache.get(cache_key) is not None:
+            return
+
+        self._speculative_promoted = False
+        self._speculative_thread = QThread(self)
+        self._speculative_worker = FreezingDetectionWorker(
+            self.video_model.capture_path,
+            self.video_model.video_fps,
+            self.video_model.total_frames,
+            params,
+            session.logical_path,
+            session.crop_role,
+            session.split_ratio,
+            self.detection_cache,
+            cache_key,
+            low_priority=True,
+            media_index=self.video_model.media_index,
+        )
+        self._speculative_worker.moveToThread(self._speculative_thread)
+        self._speculative_thread.started.connect(self._speculative_worker.run)
+        self._speculative_worker.progress.connect(self._on_speculative_progress)
+        self._speculative_worker.finished.connect(self._on_speculative_finished)
+        self._speculative_worker.failed.connect(self._on_speculative_failed)
+        self._speculative_worker.finished.connect(self._speculative_thread.quit)
+        self._speculative_worker.failed.connect(self._speculative_thread.quit)
+        self._speculative_worker.cancelled.connect(self._speculative_thread.quit)
+        self._speculative_thread.finished.connect(self._speculative_worker.deleteLater)
+        self._speculative_thread.finished.connect(self._speculative_thread.deleteLater)
+        if self.playing:
+            self._speculative_worker.pause()
+        self._speculative_thread.start(QThread.Priority.LowestPriority)
+
+    def _cancel_speculative_detection(self):
+        thread = self._speculative_thread
+        worker = self._speculative_worker
+        self._speculative_thread = None
+        self._speculative_worker = None
+        if self._speculative_promoted:
+            self._speculative_promoted = False
+            self._refresh_actions()
+        if worker is None or thread is None:
+            return
+        worker.cancel()
+        thread.quit()
+        thread.wait()
+
+    def _release_speculative_detection(self) -> bool:
+        promoted = self._speculative_promoted
+        self._speculative_thread = None
+        self._speculative_worker = None
+        self._speculative_promoted = False
+        return promoted
+
+    def _on_speculative_progress(self, progress: float):
+        if self.sender() is not self._speculative_worker:
+            return
+        if self._speculative_promoted:
+            self._on_detection_progress(progress)
+
+    def _on_speculative_finished(self, intervals: List[FreezingInterval], source_video_path: str):
+        if self.sender() is not self._speculative_worker:
+            return
+        if self._release_speculative_detection():
+            self._refresh_actions()
+            self._on_detection_finished(intervals, source_video_path)
+
+    def _on_speculative_failed(self, message: str):
+        if self.sender() is not self._speculative_worker:
+            return
+        if self._release_speculative_detection():
+            self._refresh_actions()
+            self._on_detection_failed(message)
+
+    def _start_staging(self, source_path: str):
+        """Copy the opened video to local storage and switch captures when done."""
+        self._staging_thread = QThread(self)
+        self._staging_worker = StagingWorker(self.staging_cache, source_path)
+        self._staging_worker.moveToThread(self._staging_thread)
+        self._staging_thread.started.connect(self._staging_worker.run)
+        self._staging_worker.finished.connect(self._on_staging_finished)
+        self._staging_worker.failed.connect(self._on_staging_failed)
+        self._staging_worker.finished.connect(self._staging_thread.quit)
+        self._staging_worker.failed.connect(self._staging_thread.quit)
+        self._staging_worker.cancelled.connect(self._staging_thread.quit)
+        self._staging_thread.finished.connect(self._staging_worker.deleteLater)
+        self._staging_thread.finished.connect(self._staging_thread.deleteLater)
+        self._staging_thread.start(QThread.Priority.LowPriority)
+
+    def _cancel_staging(self):
+        thread = self._staging_thread
+        worker = self._staging_worker
+        self._staging_thread = None
+        self._staging_worker = None
+        if worker is None or thread is None:
+            return
+        worker.cancel()
+        thread.quit()
+        thread.wait()
+
+    def _on_staging_finished(self, source_path: str, local_path: str):
+        if self.sender() is not self._staging_worker:
+            return
+        self._staging_thread = None
+        self._staging_worker = None
+        if not local_path or source_path != self.video_model.video_path:
+            return
+        if not self.video_model.switch_capture_source(local_path):
+            return
+        self.thumbnail_cache.load_video(
+            self.video_model.preview_path,
+            self.video_model.total_frames,
+            self._preview_media_index(),
+        )
+        self._reset_playback_buffer()
+        if self.playing:
+            self._restart_play_timer()
+            self._active_playback_buffer().seek(self.current_frame + self.playback_direction)
+        self.statusBar().showMessage("已切换到本地缓存副本", 5000)
+
+    def _on_staging_failed(self, message: str):
+        if self.sender() is not self._staging_worker:
+            return
+        self._staging_thread = None
+        self._staging_worker = None
+        self.statusBar().showMessage(f"本地缓存失败: {message}", 5000)
+
+    def _media_indexing_enabled(self) -> bool:
+        # Without PyAV the scan decodes every frame, so it must be asked for.
+        if not self.config.get("media_index_enabled", True):
+            return False
+        return pyav_available() or bool(self.config.get("media_index_full_decode", False))
+
+    def _start_media_indexing(self, file_path: str):
+        """Scan keyframes, timestamps and the true frame count once in the background."""
+        self._media_index_thread = QThread(self)
+        self._media_index_worker = MediaIndexWorker(
+            file_path,
+            self.video_model.capture_path,
+            bool(self.config.get("media_index_full_decode", False)),
+        )
+        self._media_index_worker.moveToThread(self._media_index_thread)
+        self._media_index_thread.started.connect(self._media_index_worker.run)
+        self._media_index_worker.finished.connect(self._on_media_index_finished)
+        self._media_index_worker.failed.connect(self._on_media_index_failed)
+        self._media_index_worker.finished.connect(self._media_index_thread.quit)
+        self._media_index_worker.failed.connect(self._media_index_thread.quit)
+        self._media_index_worker.cancelled.connect(self._media_index_thread.quit)
+        self._media_index_thread.finished.connect(self._media_index_worker.deleteLater)
+        self._media_index_thread.finished.connect(self._media_index_thread.deleteLater)
+        self._media_index_thread.start(QThread.Priority.LowPriority)
+
+    def _start_segment_probe(self, manifest_path: str):
+        """Read segment frame counts, indexing segments that have no ``.vtidx`` yet."""
+        self.statusBar().showMessage("正在读取分段录像...")
+        self._segment_probe_thread = QThread(self)
+        self._segment_probe_worker = SegmentProbeWorker(
+            manifest_path,
+            self._media_indexing_enabled(),
+            bool(self.config.get("media_index_full_decode", False)),
+        )
+        self._segment_probe_worker.moveToThread(self._segment_probe_thread)
+        self._segment_probe_thread.started.connect(self._segment_probe_worker.run)
+        self._segment_probe_worker.finished.connect(self._on_segment_probe_finished)
+        self._segment_probe_worker.failed.connect(self._on_segment_probe_failed)
+        self._segment_probe_worker.finished.connect(self._segment_probe_thread.quit)
+        self._segment_probe_worker.failed.connect(self._segment_probe_thread.quit)
+        self._segment_probe_worker.cancelled.connect(self._segment_probe_thread.quit)
+        self._segment_probe_thread.finished.connect(self._segment_probe_worker.deleteLater)
+        self._segment_probe_thread.finished.connect(self._segment_probe_thread.deleteLater)
+        self._segment_probe_thread.start()
+
+    def _cancel_segment_probe(self):
+        thread = self._segment_probe_thread
+        worker = self._segment_probe_worker
+        self._segment_probe_thread = None
+        self._segment_probe_worker = None
+        if worker is None or thread is None:
+            return
+        worker.cancel()
+        thread.quit()
+        thread.wait()
+
+    def _on_segment_probe_finished(self, manifest_path: str, _segments: list):
+        if self.sender() is not self._segment_probe_worker:
+            return
+        self._segment_probe_thread = None
+        self._segment_probe_worker = None
+        self.statusBar().clearMessage()
+        # Annotations may have been edited while the segments were probed.
+        if not self._confirm_save_if_dirty():
+            return
+        self._open_video(manifest_path)
+
+    def _on_segment_probe_failed(self, message: str):
+        if self.sender() is not self._segment_probe_worker:
+            return
+        self._segment_probe_thread = None
+        self._segment_probe_worker = None
+        self.statusBar().clearMessage()
+        QMessageBox.critical(self, "错误", f"无法打开分段录像: {message}")
+
+    def _cancel_media_indexing(self):
+        thread = self._media_index_thread
+        worker = self._media_index_worker
+        self._media_index_thread = None
+        self._media_index_worker = None
+        if worker is None or thread is None:
+            return
+        worker.cancel()
+        thread.quit()
+        thread.wait()
+
+    def _on_media_index_finished(self, video_path: str, media_index: MediaIndex):
+        if self.sender() is not self._media_index_worker:
+            return
+        self._media_index_thread = None
+        self._media_index_worker = None
+        if video_path != self.video_model.video_path or media_index.frame_count <= 0:
+            return
+        self.video_model.apply_media_index(media_index)
+        for session in self.video_sessions:
+            self._apply_frame_times(session.annotation_model)
+        self.current_frame = min(self.current_frame, max(0, self.video_model.total_frames - 1))
+        self.thumbnail_cache.total_frames = self.video_model.total_frames
+        self.thumbnail_cache.media_index = self._preview_media_index()
+        self._reset_playback_buffer()
+        if self.playing:
+            self._restart_play_timer()
+            self._active_playback_buffer().seek(self.current_frame + self.playback_direction)
+        self.timeline.set_video(self.video_model.total_frames, self.video_model.video_fps)
+        self._refresh_all_views()
+        self._update_video_info_label()
+        self.statusBar().showMessage(f"媒体索引已就绪: {media_index.frame_count} 帧", 5000)
+
+    def _on_media_index_failed(self, message: str):
+        if self.sender() is not self._media_index_worker:
+            return
+        self._media_index_thread = None
+        self._media_index_worker = None
+        self.statusBar().showMessage(f"媒体索引扫描失败: {message}", 5000)
+
+    def _preview_media_index(self) -> Optional[MediaIndex]:
+        # Every proxy frame is a keyframe, so the original's keyframes do not apply.
+        return None if self.video_model.proxy_path else self.video_model.media_index
+
+    def _read_preview_frame(self, frame_number: int):
+        if not self.video_model.proxy_path:
+            capture = self.video_model.video_capture
+            capture.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+            return capture.read()
+        # The thumbnail capture is already open on the proxy.
+        return self.thumbnail_cache.read_frame(frame_number)
+
+    def _start_proxy(self, file_path: str):
+        """Transcode a low-resolution all-intra proxy for scrubbing and previews."""
+        self._proxy_progress_percent = -1
+        self._proxy_thread = QThread(self)
+        self._proxy_worker = ProxyWorker(self.proxy_cache, file_path, self.video_model.capture_path)
+        self._proxy_worker.moveToThread(self._proxy_thread)
+        self._proxy_thread.started.connect(self._proxy_worker.run)
+        self._proxy_worker.progress.connect(self._on_proxy_progress)
+        self._proxy_worker.finished.connect(self._on_proxy_finished)
+        self._proxy_worker.failed.connect(self._on_proxy_failed)
+        self._proxy_worker.finished.connect(self._proxy_thread.quit)
+        self._proxy_worker.failed.connect(self._proxy_thread.quit)
+        self._proxy_worker.cancelled.connect(self._proxy_thread.quit)
+        self._proxy_thread.finished.connect(self._proxy_worker.deleteLater)
+        self._proxy_thread.finished.connect(self._proxy_thread.deleteLater)
+        self._proxy_thread.start(QThread.Priority.LowPriority)
+
+    def _cancel_proxy(self):
+        thread = self._proxy_thread
+        worker = self._proxy_worker
+        self._proxy_thread = None
+        self._proxy_worker = None
+        if worker is None or thread is None:
+            return
+        worker.cancel()
+        thread.quit()
+        thread.wait()
+
+    def _on_proxy_progress(self, progress: float):
+        if self.sender() is not self._proxy_worker:
+            return
+        percent = int(progress * 100)
+        if percent != self._proxy_progress_percent:
+            self._proxy_progress_percent = percent
+            self.statusBar().showMessage(f"生成代理文件: {percent}%", 2000)
+
+    def _on_proxy_finished(self, source_path: str, proxy_path: str):
+        if self.sender() is not self._proxy_worker:
+            return
+        self._proxy_thread = None
+        self._proxy_worker = None
+        if source_path != self.video_model.video_path:
+            return
+        if self.proxy_cache.proxy_path(source_path, self.video_model.total_frames) is None:
+            # A truncated proxy would show the wrong frames for every later frame number.
+            self.statusBar().showMessage("代理文件帧数与原视频不一致，继续使用原视频预览", 5000)
+            return
+        self.video_model.proxy_path = proxy_path
+        self.thumbnail_cache.load_video(proxy_path, self.video_model.total_frames, None)
+        self._finish_scrub()
+        if self.scrub_decoder is not None:
+            self.scrub_decoder.stop()
+        self.scrub_decoder = ScrubDecoder(proxy_path)
+        self.statusBar().showMessage("代理文件已就绪，拖动预览和缩略图改用代理", 5000)
+
+    def _on_proxy_failed(self, message: str):
+        if self.sender() is not self._proxy_worker:
+            return
+        self._proxy_thread = None
+        self._proxy_worker = None
+        self.statusBar().showMessage(f"代理文件生成失败: {message}", 5000)
+
     def delete_selected_interval(self):
         interval_id = self._current_table_interval_id()
         if not interval_id and self.timeline.selected_interval_id:
@@ -754,6 +1987,7 @@ class QtAnnotationWorkbench(QMainWindow):
         self.annotation_model.replace_intervals(intervals)
         self._refresh_all_views()
 
+    @tracked_action("refresh_all_views")
     def _refresh_all_views(self):
         self.timeline.set_intervals(self.annotation_model.intervals)
         self.timeline.set_pending_start(self.pending_start_frame)
@@ -761,6 +1995,7 @@ class QtAnnotationWorkbench(QMainWindow):
         self._update_time_label()
         self._refresh_actions()
 
+    @tracked_action("refresh_interval_table")
     def _refresh_interval_table(self):
         self._updating_table = True
         intervals = self.annotation_model.intervals
@@ -806,6 +2041,8 @@ class QtAnnotationWorkbench(QMainWindow):
         if interval is None:
             return
         self._select_interval(interval_id)
+        self.review_interval_id = interval_id
+        self._request_review_prefetch()
         if item.column() == 0:
             self.seek_to_frame(interval.start_frame)
         elif item.column() == 1:
@@ -848,6 +2085,7 @@ class QtAnnotationWorkbench(QMainWindow):
         item = self.interval_table.item(row, 0)
         return item.data(Qt.ItemDataRole.UserRole) if item else None
 
+    @tracked_action("hover_thumbnail")
     def _show_thumbnail(self, frame: int, global_pos: QPoint):
         if frame < 0:
             self.thumbnail_popup.hide()
@@ -869,6 +2107,7 @@ class QtAnnotationWorkbench(QMainWindow):
     def _on_detection_progress(self, progress: float):
         self.statusBar().showMessage(f"自动检测中: {progress * 100:.0f}%")
 
+    @tracked_action("apply_detection")
     def _on_detection_finished(self, intervals: List[FreezingInterval], source_video_path: str):
         session = self._current_session()
         if not session or session.logical_path != source_video_path:
@@ -968,7 +2207,13 @@ class QtAnnotationWorkbench(QMainWindow):
         self.delete_action.setEnabled(has_video and self.annotation_model.count > 0)
         self.clear_action.setEnabled(has_video and self.annotation_model.count > 0)
         self.split_action.setEnabled(bool(self.video_model.video_path))
-        if self._detection_thread is None:
+        self.split_view_action.setEnabled(self._is_split_pair())
+        self.reverse_play_action.setEnabled(has_video)
+        self.previous_candidate_action.setEnabled(has_video and self.annotation_model.count > 0)
+        self.next_candidate_action.setEnabled(has_video and self.annotation_model.count > 0)
+        self.previous_frame_action.setEnabled(has_video)
+        self.next_frame_action.setEnabled(has_video)
+        if self._detection_thread is None and not self._speculative_promoted:
             self.auto_detect_action.setEnabled(has_video)
 
     def _has_unsaved_changes(self) -> bool:
@@ -1053,6 +2298,20 @@ class QtAnnotationWorkbench(QMainWindow):
             app = QApplication.instance()
             if app is not None:
                 app.removeEventFilter(self)
+            self._cancel_speculative_detection()
+            self._cancel_staging()
+            self._cancel_media_indexing()
+            self._cancel_segment_probe()
+            self._cancel_proxy()
+            if self.metrics_writer is not None:
+                self.metrics_writer.stop()
+            if self.stall_watchdog is not None:
+                self.stall_ping_timer.stop()
+                self.stall_watchdog.stop()
+            if self.trace_dump_path and self.tracer.enabled:
+                self._dump_trace(self.trace_dump_path)
+            self._stop_playback_buffer()
+            self.frame_cache.clear()
             self.thumbnail_cache.release()
             self.video_model.release()
             event.accept()
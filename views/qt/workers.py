@@ -1,17 +1,52 @@
 """Background workers used by the Qt workbench."""
 from __future__ import annotations
 
-from typing import Optional
+import os
+import sys
+import threading
+import time
+from typing import Hashable, Optional
 
 from PySide6.QtCore import QObject, Signal
 
-from services.freezing_detection_service import FreezingDetectionParams, FreezingDetectionService
+from services.detection_cache import DetectionResultCache
+from services.freezing_detection_service import (
+    DetectionCancelledError,
+    FreezingDetectionParams,
+    FreezingDetectionService,
+)
+from services.media_index import (
+    MediaIndex,
+    MediaIndexCancelledError,
+    save_media_index,
+    scan_media_index,
+)
+from services.proxy_cache import ProxyCache, ProxyCancelledError
+from services.segmented_capture import probe_segments
+from services.resource_scheduler import get_resource_scheduler
+from services.staging_cache import StagingCache, StagingCancelledError
+from utils.metrics import get_metrics
+
+
+def lower_current_thread_priority():
+    """Best-effort OS niceness drop for the calling thread.
+
+    Linux applies ``setpriority`` to a single thread when given its native id.
+    Other platforms rely on ``QThread.Priority`` set by the caller.
+    """
+    if not sys.platform.startswith("linux") or not hasattr(os, "setpriority"):
+        return
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+    except OSError:
+        pass
 
 
 class FreezingDetectionWorker(QObject):
     progress = Signal(float)
     finished = Signal(object, str)
     failed = Signal(str)
+    cancelled = Signal()
 
     def __init__(
         self,
@@ -22,6 +57,11 @@ class FreezingDetectionWorker(QObject):
         logical_video_path: Optional[str] = None,
         crop_role: Optional[str] = None,
         split_ratio: Optional[float] = None,
+        result_cache: Optional[DetectionResultCache] = None,
+        cache_key: Optional[Hashable] = None,
+        low_priority: bool = False,
+        workers: int = 1,
+        media_index: Optional[MediaIndex] = None,
     ):
         super().__init__()
         self.video_path = video_path
@@ -31,20 +71,266 @@ class FreezingDetectionWorker(QObject):
         self.params = params
         self.crop_role = crop_role
         self.split_ratio = split_ratio
-        self.service = FreezingDetectionService()
+        self.result_cache = result_cache
+        self.cache_key = cache_key
+        self.low_priority = low_priority
+        self.workers = workers
+        self.media_index = media_index
+        self.scheduler = get_resource_scheduler()
+        self.metrics = get_metrics()
+        self.service = FreezingDetectionService(stage_observer=self._observe_stage)
+        self._cancel_requested = threading.Event()
+        self._running = threading.Event()
+        self._running.set()
+
+    def pause(self):
+        self._running.clear()
+
+    def resume(self):
+        self._running.set()
+
+    def cancel(self):
+        self._cancel_requested.set()
+        self._running.set()
 
     def run(self):
+        if self.low_priority:
+            lower_current_thread_priority()
+        threads = self.scheduler.background_pool_size(self.workers)
+        job = "speculative_detection" if self.low_priority else "detection"
+        started = time.perf_counter()
+        self.metrics.add_gauge("job_queue_depth", 1, job=job)
         try:
-            intervals = self.service.detect_freezing(
-                self.video_path,
-                self.fps,
-                self.total_frames,
-                self.params,
-                self.progress.emit,
-                self.crop_role,
-                self.split_ratio,
-            )
+            with self.scheduler.background(threads):
+                intervals = self.service.detect_freezing(
+                    self.video_path,
+                    self.fps,
+                    self.total_frames,
+                    self.params,
+                    self.progress.emit,
+                    self.crop_role,
+                    self.split_ratio,
+                    self._should_continue,
+                    threads,
+                    self.media_index,
+                )
+        except DetectionCancelledError:
+            self.metrics.inc("jobs", job=job, status="cancelled")
+            self.cancelled.emit()
+            return
         except Exception as exc:
+            self.metrics.inc("jobs", job=job, status="failed")
             self.failed.emit(str(exc))
             return
+        finally:
+            self.metrics.add_gauge("job_queue_depth", -1, job=job)
+        self.metrics.inc("jobs", job=job, status="done")
+        self.metrics.observe("job_seconds", time.perf_counter() - started, job=job)
+        if self.result_cache is not None:
+            self.result_cache.put(self.cache_key, intervals)
         self.finished.emit(intervals, self.logical_video_path)
+
+    def _observe_stage(self, stage: str, seconds: float):
+        self.metrics.observe("stage_seconds", seconds, stage=stage)
+        if stage == "decode":
+            self.metrics.inc("frames_decoded", source="detection")
+        elif stage == "preprocess":
+            self.metrics.inc("samples_analysed")
+
+    def _should_continue(self) -> bool:
+        self.scheduler.background_checkpoint()
+        while not self._running.wait(0.1):
+            if self._cancel_requested.is_set():
+                return False
+        return not self._cancel_requested.is_set()
+
+
+class StagingWorker(QObject):
+    """Copy a video into the local staging cache in the background."""
+
+    progress = Signal(float)
+    finished = Signal(str, str)
+    failed = Signal(str)
+    cancelled = Signal()
+
+    def __init__(self, cache: StagingCache, source_path: str):
+        super().__init__()
+        self.cache = cache
+        self.source_path = source_path
+        self.metrics = get_metrics()
+        self._cancel_requested = threading.Event()
+
+    def cancel(self):
+        self._cancel_requested.set()
+
+    def run(self):
+        started = time.perf_counter()
+        try:
+            local_path = self.cache.stage(
+                self.source_path,
+                self.progress.emit,
+                lambda: not self._cancel_requested.is_set(),
+            )
+        except StagingCancelledError:
+            self.metrics.inc("jobs", job="staging", status="cancelled")
+            self.cancelled.emit()
+            return
+        except OSError as exc:
+            self.metrics.inc("jobs", job="staging", status="failed")
+            self.failed.emit(str(exc))
+            return
+        self.metrics.inc("jobs", job="staging", status="done")
+        self.metrics.observe("job_seconds", time.perf_counter() - started, job="staging")
+        self.finished.emit(self.source_path, local_path or "")
+
+
+class MediaIndexWorker(QObject):
+    """Scan a video for its media index at low priority and save it beside the video."""
+
+    progress = Signal(float)
+    finished = Signal(str, object)
+    failed = Signal(str)
+    cancelled = Signal()
+
+    def __init__(self, video_path: str, capture_path: Optional[str] = None, allow_decode: bool = False):
+        super().__init__()
+        self.video_path = video_path
+        self.capture_path = capture_path or video_path
+        self.allow_decode = allow_decode
+        self.scheduler = get_resource_scheduler()
+        self.metrics = get_metrics()
+        self._cancel_requested = threading.Event()
+
+    def cancel(self):
+        self._cancel_requested.set()
+
+    def run(self):
+        lower_current_thread_priority()
+        started = time.perf_counter()
+        try:
+            with self.scheduler.background(1):
+                index = scan_media_index(
+                    self.capture_path,
+                    self.progress.emit,
+                    self._should_continue,
+                    self.allow_decode,
+                )
+            # A staged copy has its own mtime; the index describes the original.
+            stat = os.stat(self.video_path)
+            index.source_size = stat.st_size
+            index.source_mtime_ns = stat.st_mtime_ns
+        except MediaIndexCancelledError:
+            self.metrics.inc("jobs", job="media_index", status="cancelled")
+            self.cancelled.emit()
+            return
+        except (OSError, ValueError) as exc:
+            self.metrics.inc("jobs", job="media_index", status="failed")
+            self.failed.emit(str(exc))
+            return
+        try:
+            save_media_index(index, self.video_path)
+        except OSError:
+            # Read-only shares still get the index for this session.
+            self.metrics.inc("media_index_save_failures")
+        self.metrics.inc("jobs", job="media_index", status="done")
+        self.metrics.observe("job_seconds", time.perf_counter() - started, job="media_index")
+        self.finished.emit(self.video_path, index)
+
+    def _should_continue(self) -> bool:
+        self.scheduler.background_checkpoint()
+        return not self._cancel_requested.is_set()
+
+
+class ProxyWorker(QObject):
+    """Transcode a video into the proxy cache at low priority."""
+
+    progress = Signal(float)
+    finished = Signal(str, str)
+    failed = Signal(str)
+    cancelled = Signal()
+
+    def __init__(self, cache: ProxyCache, source_path: str, capture_path: Optional[str] = None):
+        super().__init__()
+        self.cache = cache
+        self.source_path = source_path
+        self.capture_path = capture_path or source_path
+        self.scheduler = get_resource_scheduler()
+        self.metrics = get_metrics()
+        self._cancel_requested = threading.Event()
+
+    def cancel(self):
+        self._cancel_requested.set()
+
+    def run(self):
+        lower_current_thread_priority()
+        started = time.perf_counter()
+        try:
+            with self.scheduler.background(1):
+                proxy_path = self.cache.build(
+                    self.source_path,
+                    self.capture_path,
+                    self.progress.emit,
+                    self._should_continue,
+                )
+        except ProxyCancelledError:
+            self.metrics.inc("jobs", job="proxy", status="cancelled")
+            self.cancelled.emit()
+            return
+        except (OSError, ValueError) as exc:
+            self.metrics.inc("jobs", job="proxy", status="failed")
+            self.failed.emit(str(exc))
+            return
+        self.metrics.inc("jobs", job="proxy", status="done")
+        self.metrics.observe("job_seconds", time.perf_counter() - started, job="proxy")
+        self.finished.emit(self.source_path, proxy_path)
+
+    def _should_continue(self) -> bool:
+        self.scheduler.background_checkpoint()
+        return not self._cancel_requested.is_set()
+
+
+class SegmentProbeWorker(QObject):
+    """Open every segment of a ``.vtseg`` manifest off the GUI thread.
+
+    Segments usually live on the same network share as the DVR, so opening
+    them, and scanning the ones without a media index, can take seconds.
+    """
+
+    finished = Signal(str, object)
+    failed = Signal(str)
+    cancelled = Signal()
+
+    def __init__(self, manifest_path: str, index_missing: bool = False, allow_decode: bool = False):
+        super().__init__()
+        self.manifest_path = manifest_path
+        self.index_missing = index_missing
+        self.allow_decode = allow_decode
+        self.metrics = get_metrics()
+        self._cancel_requested = threading.Event()
+
+    def cancel(self):
+        self._cancel_requested.set()
+
+    def run(self):
+        started = time.perf_counter()
+        try:
+            segments = probe_segments(
+                self.manifest_path,
+                index_missing=self.index_missing,
+                allow_decode=self.allow_decode,
+                should_continue=self._should_continue,
+            )
+        except MediaIndexCancelledError:
+            self.metrics.inc("jobs", job="segment_probe", status="cancelled")
+            self.cancelled.emit()
+            return
+        except (OSError, ValueError) as exc:
+            self.metrics.inc("jobs", job="segment_probe", status="failed")
+            self.failed.emit(str(exc))
+            return
+        self.metrics.inc("jobs", job="segment_probe", status="done")
+        self.metrics.observe("job_seconds", time.perf_counter() - started, job="segment_probe")
+        self.finished.emit(self.manifest_path, segments)
+
+    def _should_continue(self) -> bool:
+        return not self._cancel_requested.is_set()